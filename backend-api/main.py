@@ -2,18 +2,25 @@
 FastAPI Backend for MediVision AI
 Exposes Python AI functionality via REST API
 """
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, File, Form, HTTPException, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
+from datetime import datetime
 import sys
 from pathlib import Path
 
 # Add parent directory to path to import src modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.search import MedicalRAGSystem
+from src.utils.startup import timed_phase, startup_report
+
+with timed_phase("import src.search"):
+    from src.search import MedicalRAGSystem
+from src.search.medical_rag import IMAGE_LIST_FIELDS
 from src.memory import PatientMemoryManager
+from src.core import model_memory_report
 from src.utils import settings, setup_logger
 
 # Initialize FastAPI
@@ -42,11 +49,18 @@ async def startup_event():
     global rag_system
     try:
         logger.info("Initializing MedicalRAGSystem...")
-        rag_system = MedicalRAGSystem()
+        with timed_phase("MedicalRAGSystem()"):
+            rag_system = MedicalRAGSystem()
         logger.info("System initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize system: {e}")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close pooled Qdrant connections"""
+    if rag_system and rag_system.async_search_enabled:
+        await rag_system.async_qdrant.close()
+
 # Pydantic models for request/response
 class DiagnosisRequest(BaseModel):
     patient_id: str
@@ -63,6 +77,7 @@ class SearchRequest(BaseModel):
     query: str
     specialty: Optional[str] = None
     limit: int = 5
+    mode: Optional[str] = None  # hybrid | dense
 
 class SearchResponse(BaseModel):
     query: str
@@ -77,6 +92,11 @@ class PatientSummaryResponse(BaseModel):
     last_visit: Optional[str]
     recent_interactions: List[Dict[str, Any]]
 
+class PatientHistoryResponse(BaseModel):
+    patient_id: str
+    interactions: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
+
 class TreatmentRequest(BaseModel):
     patient_id: str
     diagnosis: str
@@ -106,7 +126,9 @@ async def diagnose_patient(request: DiagnosisRequest):
         if not rag_system:
             raise HTTPException(status_code=503, detail="System not initialized")
 
-        result = rag_system.diagnose_with_context(
+        # Run off the event loop so concurrent requests can share embedding batches
+        result = await run_in_threadpool(
+            rag_system.diagnose_with_context,
             patient_id=request.patient_id,
             symptoms=request.symptoms,
             use_patient_history=request.use_history
@@ -134,10 +156,11 @@ async def search_knowledge(request: SearchRequest):
 
         filters = {"specialty": request.specialty} if request.specialty else None
 
-        results = rag_system.search_medical_texts(
+        results = await rag_system.asearch_medical_texts(
             query=request.query,
             filters=filters,
-            limit=request.limit
+            limit=request.limit,
+            mode=request.mode
         )
 
         return SearchResponse(
@@ -146,6 +169,8 @@ async def search_knowledge(request: SearchRequest):
             count=len(results)
         )
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Search error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -159,7 +184,9 @@ async def get_patient_summary(patient_id: str):
         if not rag_system:
             raise HTTPException(status_code=503, detail="System not initialized")
 
-        summary = rag_system.memory_manager.get_patient_summary(patient_id)
+        summary = await run_in_threadpool(
+            rag_system.memory_manager.get_patient_summary, patient_id
+        )
 
         return PatientSummaryResponse(
             patient_id=summary["patient_id"],
@@ -174,6 +201,44 @@ async def get_patient_summary(patient_id: str):
         logger.error(f"Patient summary error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/patients/{patient_id}/history", response_model=PatientHistoryResponse)
+async def get_patient_history(
+    patient_id: str,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None
+):
+    """
+    Page through a patient's interactions, newest first, optionally within [start, end)
+    """
+    try:
+        if not rag_system:
+            raise HTTPException(status_code=503, detail="System not initialized")
+
+        interactions, next_cursor = await run_in_threadpool(
+            rag_system.memory_manager.retrieve_patient_history_page,
+            patient_id,
+            limit,
+            cursor,
+            start=start,
+            end=end,
+        )
+
+        return PatientHistoryResponse(
+            patient_id=patient_id,
+            interactions=interactions,
+            next_cursor=next_cursor
+        )
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Patient history error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/api/treatment", response_model=TreatmentResponse)
 async def recommend_treatment(request: TreatmentRequest):
     """
@@ -183,7 +248,8 @@ async def recommend_treatment(request: TreatmentRequest):
         if not rag_system:
             raise HTTPException(status_code=503, detail="System not initialized")
 
-        result = rag_system.recommend_treatment(
+        result = await run_in_threadpool(
+            rag_system.recommend_treatment,
             patient_id=request.patient_id,
             diagnosis=request.diagnosis,
             contraindications=request.contraindications
@@ -220,13 +286,45 @@ async def list_collections():
 
         return {
             "collections": info,
-            "count": len(collections)
+            "count": len(collections),
+            "aliases": rag_system.qdrant.aliases()
         }
 
     except Exception as e:
         logger.error(f"Collections error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/system/models")
+async def loaded_models():
+    """
+    Report shared models loaded in this worker and their memory use
+    """
+    models = model_memory_report()
+    return {
+        "models": models,
+        "count": len(models)
+    }
+
+@app.get("/api/system/startup")
+async def startup_timing():
+    """
+    Report startup phase timings and per-model load cost
+    """
+    return startup_report()
+
+@app.get("/api/system/embedding-queue")
+async def embedding_queue_stats():
+    """
+    Report micro-batching queue depth and batch sizes
+    """
+    if not rag_system:
+        raise HTTPException(status_code=503, detail="System not initialized")
+
+    query_embedder = rag_system.query_embedder
+    if not hasattr(query_embedder, "stats"):
+        return {"enabled": False}
+    return {"enabled": True, **query_embedder.stats()}
+
 # Image Search Models
 class ImageSearchRequest(BaseModel):
     query: str
@@ -250,16 +348,17 @@ async def search_medical_images(request: ImageSearchRequest):
         # Search using RAG system's new text-based image search
         filters = {"modality": request.modality} if request.modality else None
         
-        results = rag_system.search_medical_images(
+        results = await rag_system.asearch_medical_images(
             query=request.query,
             filters=filters,
-            limit=request.limit
+            limit=request.limit,
+            include_fields=IMAGE_LIST_FIELDS
         )
         
         # Format results
         image_results = [
             {
-                "id": str(i),
+                "id": res.get("id", str(i)),
                 "modality": res.get("modality", "Unknown"),
                 "body_part": res.get("body_part", "Unknown"),
                 "diagnosis": res.get("diagnosis", "Unknown"),
@@ -297,6 +396,97 @@ async def search_medical_images(request: ImageSearchRequest):
         logger.error(f"Image search error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+class SimilarImagesResponse(BaseModel):
+    filename: Optional[str]
+    results: List[Dict[str, Any]]
+    count: int
+
+@app.post("/api/images/similar", response_model=SimilarImagesResponse)
+async def search_similar_images(
+    file: UploadFile = File(...),
+    modality: Optional[str] = Form(None),
+    body_part: Optional[str] = Form(None),
+    limit: int = Form(5)
+):
+    """
+    Find stored cases visually similar to an uploaded image
+    """
+    if not rag_system:
+        raise HTTPException(status_code=503, detail="System not initialized")
+
+    # Read at most one byte past the cap instead of the whole upload
+    max_bytes = int(settings.image_upload_max_mb * 1024 * 1024)
+    image = await file.read(max_bytes + 1)
+    if len(image) > max_bytes:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Image exceeds {settings.image_upload_max_mb:g} MB upload limit"
+        )
+
+    try:
+        results = await rag_system.asearch_images_by_example(
+            image=image,
+            modality=modality,
+            body_part=body_part,
+            limit=limit,
+            include_fields=IMAGE_LIST_FIELDS
+        )
+
+        similar = [
+            {
+                "id": res["id"],
+                "title": res.get("title", ""),
+                "modality": res.get("modality", "Unknown"),
+                "body_part": res.get("body_part", "Unknown"),
+                "diagnosis": res.get("diagnosis", "Unknown"),
+                "findings": res.get("findings", ""),
+                "score": res.get("relevance_score", 0.0)
+            }
+            for res in results
+        ]
+
+        return SimilarImagesResponse(
+            filename=file.filename,
+            results=similar,
+            count=len(similar)
+        )
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"Similar image search error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+# Hydration Models
+class HydrateRequest(BaseModel):
+    kind: str  # texts | images | interactions
+    ids: List[str]
+
+@app.post("/api/hydrate")
+async def hydrate(request: HydrateRequest):
+    """
+    Fetch full payloads for results listed with a projection
+    """
+    if not rag_system:
+        raise HTTPException(status_code=503, detail="System not initialized")
+
+    hydrators = {
+        "texts": rag_system.hydrate_medical_texts,
+        "images": rag_system.hydrate_medical_images,
+        "interactions": rag_system.memory_manager.hydrate_interactions,
+    }
+    if request.kind not in hydrators:
+        raise HTTPException(status_code=400, detail=f"Unknown kind '{request.kind}'")
+
+    try:
+        items = await run_in_threadpool(hydrators[request.kind], request.ids)
+        return {"kind": request.kind, "items": items, "count": len(items)}
+    except Exception as e:
+        logger.error(f"Hydrate error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/api/demo/images")
 async def get_demo_images():
     """
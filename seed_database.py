@@ -8,7 +8,6 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.search import MedicalRAGSystem
-from src.memory import PatientMemoryManager
 from src.utils import setup_logger, settings
 import random
 from datetime import datetime, timedelta
@@ -270,8 +269,16 @@ def generate_patient_interaction(patient, interaction_type):
         return f"Medication adjustment for {patient['name']}. Modified treatment for {random.choice(conditions)}. New prescription: {random.choice(['increased dose', 'decreased dose', 'added medication', 'discontinued medication'])}."
 
 
-def seed_database():
-    """Main seeding function"""
+def seed_database(reset: bool = False, rebuild: bool = False):
+    """
+    Main seeding function
+
+    Args:
+        reset: Drop and recreate the collections (needed after changing
+            projection dimensions); otherwise sync incrementally
+        rebuild: Re-index everything into new collection versions and swap
+            the aliases, keeping the live collections searchable
+    """
     print("=" * 60)
     print("🏥 MediVision AI - Database Seeding Script")
     print("=" * 60)
@@ -280,102 +287,159 @@ def seed_database():
     print("\n📦 Initializing RAG system...")
     rag_system = MedicalRAGSystem()
     
-    print("♻️ Resetting collections for clean seed...")
-    try:
+    text_descriptions = [
+        f"{img['modality']} {img['body_part']}: {img['diagnosis']}. Findings: {img['findings']}"
+        for img in MEDICAL_IMAGES
+    ]
+
+    if reset or rebuild:
+        # Fit configured dimensionality reductions before anything is
+        # deleted; they are applied to the versions created below, and a
+        # failed fit leaves the live collections untouched
+        corpora = {
+            rag_system.texts_collection: [text["content"] for text in MEDICAL_TEXTS],
+            rag_system.images_collection: text_descriptions,
+        }
+        for collection, corpus in corpora.items():
+            if collection in settings.vector_projection_dims:
+                report = rag_system.fit_projection(collection, corpus)
+                print(
+                    f"   ✓ {collection}: {report['method']} {report['input_dim']} -> "
+                    f"{report['output_dim']} dims, held-out recall@{report['k']} "
+                    f"{report['recall_at_k']:.3f}"
+                )
+
+    if reset:
+        print("♻️ Resetting collections for clean seed...")
         rag_system.qdrant.delete_collection(rag_system.texts_collection)
         rag_system.qdrant.delete_collection(rag_system.images_collection)
         print("   ✓ Old collections deleted")
         # Re-initialize to create with correct dimensions
         rag_system._initialize_collections()
         print("   ✓ New collections created")
-    except Exception as e:
-        print(f"   ! Note: Reset warning: {e}")
     
     print("📦 Initializing Patient Memory Manager...")
-    memory_manager = PatientMemoryManager()
+    memory_manager = rag_system.memory_manager
+    # Interactions from earlier versions were stamped in naive local time
+    migrated = memory_manager.migrate_naive_timestamps()
+    if migrated:
+        print(f"   ✓ Converted {migrated} legacy interaction timestamps to UTC")
+    summaries = []
     
-    # Seed medical texts
-    print(f"\n📚 Seeding {len(MEDICAL_TEXTS)} medical texts...")
-    for i, text in enumerate(MEDICAL_TEXTS):
-        try:
-            rag_system.index_medical_text(
-                text=text["content"],
-                metadata={
-                    "title": text["title"],
-                    "category": text["category"],
-                    "specialty": text["specialty"]
-                }
+    text_metadatas = [
+        {
+            "title": text["title"],
+            "category": text["category"],
+            "specialty": text["specialty"]
+        }
+        for text in MEDICAL_TEXTS
+    ]
+    image_metadatas = [
+        {
+            "title": f"{img['modality']} - {img['diagnosis']}",
+            "category": "imaging",
+            "specialty": "Radiology",
+            "modality": img["modality"],
+            "body_part": img["body_part"],
+            "diagnosis": img["diagnosis"],
+            "findings": img["findings"]
+        }
+        for img in MEDICAL_IMAGES
+    ]
+
+    # Seed medical texts (only new or edited documents are embedded)
+    print(f"\n📚 Syncing {len(MEDICAL_TEXTS)} medical texts...")
+    try:
+        if rebuild:
+            rag_system.rebuild_medical_texts(
+                texts=[text["content"] for text in MEDICAL_TEXTS],
+                metadatas=text_metadatas
             )
-            if (i + 1) % 20 == 0:
-                print(f"   ✓ Indexed {i + 1}/{len(MEDICAL_TEXTS)} texts")
-        except Exception as e:
-            print(f"   ✗ Error indexing text {i}: {e}")
-    print(f"   ✅ Completed: {len(MEDICAL_TEXTS)} medical texts indexed")
+            print(f"   ✅ Completed: {len(MEDICAL_TEXTS)} medical texts rebuilt and swapped in")
+        else:
+            summaries.append(rag_system.sync_medical_texts(
+                texts=[text["content"] for text in MEDICAL_TEXTS],
+                metadatas=text_metadatas
+            ))
+            print(f"   ✅ Completed: {len(MEDICAL_TEXTS)} medical texts in sync")
+    except Exception as e:
+        print(f"   ✗ Error syncing medical texts: {e}")
     
-    # Seed medical images
-    print(f"\n🖼️ Seeding {len(MEDICAL_IMAGES)} medical image metadata...")
-    for i, img in enumerate(MEDICAL_IMAGES):
-        try:
-            # Create searchable text from image metadata
-            img_text = f"{img['modality']} {img['body_part']}: {img['diagnosis']}. Findings: {img['findings']}"
-            rag_system.index_medical_image(
-                description=img_text,
-                metadata={
-                    "title": f"{img['modality']} - {img['diagnosis']}",
-                    "category": "imaging",
-                    "specialty": "Radiology",
-                    "modality": img["modality"],
-                    "body_part": img["body_part"],
-                    "diagnosis": img["diagnosis"],
-                    "findings": img["findings"]
-                }
+    # Seed medical images (searchable text created from image metadata)
+    print(f"\n🖼️ Syncing {len(MEDICAL_IMAGES)} medical image metadata...")
+    try:
+        if rebuild:
+            rag_system.rebuild_medical_images(
+                descriptions=text_descriptions,
+                metadatas=image_metadatas
             )
-            if (i + 1) % 20 == 0:
-                print(f"   ✓ Indexed {i + 1}/{len(MEDICAL_IMAGES)} images")
-        except Exception as e:
-            print(f"   ✗ Error indexing image {i}: {e}")
-    print(f"   ✅ Completed: {len(MEDICAL_IMAGES)} medical images indexed")
+            print(f"   ✅ Completed: {len(MEDICAL_IMAGES)} medical images rebuilt and swapped in")
+        else:
+            summaries.append(rag_system.sync_medical_images(
+                descriptions=text_descriptions,
+                metadatas=image_metadatas
+            ))
+            print(f"   ✅ Completed: {len(MEDICAL_IMAGES)} medical images in sync")
+    except Exception as e:
+        print(f"   ✗ Error syncing medical images: {e}")
     
-    # Seed patient interactions
-    total_interactions = 0
+    # Seed patient interactions (patients that already have history are kept)
     print(f"\n👥 Seeding patient history for {len(PATIENTS)} patients...")
+    interactions = []
     for patient in PATIENTS:
+        existing = memory_manager.qdrant.count(
+            memory_manager.collection_name,
+            memory_manager.qdrant.build_filter({"patient_id": patient["id"]}),
+        )
+        if existing:
+            print(f"   = {patient['id']} ({patient['name']}): {existing} interactions already stored")
+            continue
+
         # Generate 5-15 interactions per patient
         num_interactions = random.randint(5, 15)
         
         for j in range(num_interactions):
-            try:
-                interaction_type = random.choice(INTERACTION_TYPES)
-                content = generate_patient_interaction(patient, interaction_type)
-                
-                memory_manager.store_interaction(
-                    patient_id=patient["id"],
-                    interaction_type=interaction_type,
-                    content=content,
-                    metadata={
-                        "patient_name": patient["name"],
-                        "patient_age": patient["age"],
-                        "conditions": patient["conditions"]
-                    }
-                )
-                total_interactions += 1
-            except Exception as e:
-                print(f"   ✗ Error storing interaction for {patient['id']}: {e}")
+            interaction_type = random.choice(INTERACTION_TYPES)
+            interactions.append({
+                "patient_id": patient["id"],
+                "interaction_type": interaction_type,
+                "content": generate_patient_interaction(patient, interaction_type),
+                "metadata": {
+                    "patient_name": patient["name"],
+                    "patient_age": patient["age"],
+                    "conditions": patient["conditions"]
+                }
+            })
         
         print(f"   ✓ {patient['id']} ({patient['name']}): {num_interactions} interactions")
     
+    total_interactions = 0
+    try:
+        if interactions:
+            total_interactions = len(memory_manager.store_interactions(interactions))
+    except Exception as e:
+        print(f"   ✗ Error storing patient interactions: {e}")
+    
     print(f"   ✅ Completed: {total_interactions} patient interactions stored")
     
     # Summary
     print("\n" + "=" * 60)
     print("✅ DATABASE SEEDING COMPLETE!")
     print("=" * 60)
+    for summary in summaries:
+        print(
+            f"   {summary['collection']:<16} +{summary['added']} added, "
+            f"~{summary['changed']} changed, -{summary['removed']} removed, "
+            f"={summary['unchanged']} unchanged"
+        )
     print(f"   📚 Medical Texts: {len(MEDICAL_TEXTS)}")
     print(f"   🖼️ Medical Images: {len(MEDICAL_IMAGES)}")
     print(f"   👥 Patients: {len(PATIENTS)}")
-    print(f"   📝 Total Interactions: {total_interactions}")
+    print(f"   📝 New Interactions: {total_interactions}")
     print("=" * 60)
 
 
 if __name__ == "__main__":
-    seed_database()
+    # `--reset` drops and recreates the collections; `--rebuild` re-indexes
+    # into new versions behind the aliases without downtime
+    seed_database(reset="--reset" in sys.argv, rebuild="--rebuild" in sys.argv)
@@ -1,5 +1,25 @@
 """Core modules for Qdrant and LLM integration"""
-from .qdrant_client import QdrantManager
-from .llm_client import MedicalLLM
+from importlib import import_module
 
-__all__ = ["QdrantManager", "MedicalLLM"]
+_EXPORTS = {
+    "QdrantManager": ".qdrant_client",
+    "AsyncQdrantManager": ".async_qdrant_client",
+    "MedicalLLM": ".llm_client",
+    "get_qdrant_manager": ".registry",
+    "get_async_qdrant_manager": ".registry",
+    "get_text_embedder": ".registry",
+    "get_medical_text_embedder": ".registry",
+    "get_image_embedder": ".registry",
+    "model_memory_report": ".registry",
+    "warmup_models": ".registry",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,454 @@
+"""
+Asynchronous Qdrant client wrapper for use from async request handlers
+"""
+from typing import List, Dict, Any, Optional, Tuple, Union
+from uuid import uuid4
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import (
+    PointStruct,
+    Filter,
+    OrderBy,
+    SearchRequest,
+    ScoredPoint,
+    FusionQuery,
+    Fusion,
+)
+
+from src.core.qdrant_client import PayloadSpec, QdrantManagerBase, client_options
+from src.utils import settings, setup_logger
+
+logger = setup_logger(__name__, settings.log_level)
+
+
+class AsyncQdrantManager(QdrantManagerBase):
+    """
+    Non-blocking counterpart of QdrantManager for the query path
+
+    Collection management (creation, profiles, aliases, rebuilds) stays on
+    the synchronous manager; this class covers the calls made per request.
+    With QDRANT_URL=":memory:" it opens its own empty in-process store, so
+    MedicalRAGSystem routes async searches through the synchronous manager
+    on a worker thread instead.
+    """
+
+    def __init__(self, url: Optional[str] = None, api_key: Optional[str] = None):
+        """
+        Initialize async Qdrant client
+
+        Args:
+            url: Qdrant URL (defaults to settings.qdrant_url)
+            api_key: Qdrant API key (defaults to settings.qdrant_api_key)
+        """
+        url = url or settings.qdrant_url
+        api_key = api_key or settings.qdrant_api_key
+        logger.info(
+            f"Connecting async client to Qdrant at {url} "
+            f"({'gRPC' if settings.qdrant_prefer_grpc else 'REST'})"
+        )
+        if url == ":memory:":
+            logger.warning("Async in-memory Qdrant store is separate from the synchronous one")
+            self.client = AsyncQdrantClient(location=":memory:")
+        else:
+            self.client = AsyncQdrantClient(
+                url=url,
+                api_key=api_key,
+                **client_options(),
+            )
+        logger.info("Async Qdrant client initialized successfully")
+
+    async def upsert_points(
+        self,
+        collection_name: str,
+        vectors: List[Union[List[float], Dict[str, List[float]]]],
+        payloads: List[Dict[str, Any]],
+        ids: Optional[List[str]] = None,
+        sparse_vectors: Optional[List[Dict[str, List]]] = None,
+    ) -> List[str]:
+        """
+        Insert or update points in a collection
+
+        Args:
+            collection_name: Name of the collection
+            vectors: List of embedding vectors, or of {name: vector} dicts
+            payloads: List of metadata dictionaries
+            ids: Optional list of point IDs
+            sparse_vectors: Optional sparse vectors stored as the profile's sparse vector
+
+        Returns:
+            List of point IDs
+        """
+        if ids is None:
+            ids = [str(uuid4()) for _ in range(len(vectors))]
+        sparse_vectors = sparse_vectors or [None] * len(vectors)
+
+        points = [
+            PointStruct(
+                id=point_id,
+                vector=self.point_vector(collection_name, vector, sparse),
+                payload=payload,
+            )
+            for point_id, vector, sparse, payload in zip(ids, vectors, sparse_vectors, payloads)
+        ]
+
+        for shard_key, group in self._route(collection_name, points).items():
+            await self.client.upsert(
+                collection_name=collection_name,
+                points=group,
+                shard_key_selector=shard_key,
+            )
+
+        logger.info(f"Upserted {len(points)} points to collection '{collection_name}'")
+        return ids
+
+    async def search(
+        self,
+        collection_name: str,
+        query_vector: List[float],
+        limit: int = 5,
+        score_threshold: float = 0.0,
+        query_filter: Optional[Filter] = None,
+        shard_key_selector: Optional[str] = None,
+        with_payload: PayloadSpec = True,
+        using: Optional[str] = None,
+    ) -> List[ScoredPoint]:
+        """
+        Search for similar vectors
+
+        Args:
+            collection_name: Name of the collection
+            query_vector: Query embedding vector
+            limit: Number of results to return
+            score_threshold: Minimum similarity score
+            query_filter: Optional filter conditions
+            shard_key_selector: Restrict to one custom shard (see shard_key_for)
+            with_payload: True/False, payload fields to include, or a selector
+                from payload_selector (e.g. exclude=["content"])
+            using: Named vector to search (None for the unnamed vector)
+
+        Returns:
+            List of search results with scores
+        """
+        results = await self.client.search(
+            collection_name=collection_name,
+            query_vector=self._query_vector(query_vector, using),
+            limit=limit,
+            score_threshold=score_threshold,
+            query_filter=query_filter,
+            search_params=self.search_params(collection_name),
+            shard_key_selector=shard_key_selector,
+            with_payload=with_payload,
+        )
+
+        logger.debug(f"Search returned {len(results)} results from '{collection_name}'")
+        return results
+
+    async def search_batch(
+        self,
+        collection_name: str,
+        query_vectors: List[List[float]],
+        limits: Union[int, List[int]] = 5,
+        query_filters: Optional[List[Optional[Filter]]] = None,
+        score_threshold: float = 0.0,
+        with_payload: PayloadSpec = True,
+        using: Optional[str] = None,
+    ) -> List[List[ScoredPoint]]:
+        """
+        Run many searches against one collection in a single request
+
+        Args:
+            collection_name: Name of the collection
+            query_vectors: Query embedding vectors
+            limits: One limit for all queries or a limit per query
+            query_filters: Optional filter per query (None entries allowed)
+            score_threshold: Minimum similarity score
+            with_payload: True/False, payload fields to include, or a selector
+                from payload_selector (e.g. exclude=["content"])
+            using: Named vector to search (None for the unnamed vector)
+
+        Returns:
+            One result list per query, in query order
+        """
+        if isinstance(limits, int):
+            limits = [limits] * len(query_vectors)
+        query_filters = query_filters or [None] * len(query_vectors)
+
+        params = self.search_params(collection_name)
+        requests = [
+            SearchRequest(
+                vector=self._query_vector(vector, using),
+                filter=query_filter,
+                limit=limit,
+                score_threshold=score_threshold,
+                with_payload=with_payload,
+                params=params,
+            )
+            for vector, query_filter, limit in zip(query_vectors, query_filters, limits)
+        ]
+        return await self.client.search_batch(collection_name=collection_name, requests=requests)
+
+    async def search_groups(
+        self,
+        collection_name: str,
+        query_vector: List[float],
+        group_by: str,
+        limit: int = 5,
+        group_size: int = 3,
+        metadata_filters: Optional[Dict[str, Any]] = None,
+        with_payload: PayloadSpec = True,
+        using: Optional[str] = None,
+    ) -> List[Any]:
+        """
+        Search and group hits by a payload field on the server
+
+        Args:
+            collection_name: Name of the collection
+            query_vector: Query embedding vector
+            group_by: Payload field to group by (must be indexed)
+            limit: Number of groups to return
+            group_size: Hits kept per group
+            metadata_filters: Optional exact-match filters
+            with_payload: True/False, payload fields to include, or a selector
+                from payload_selector (e.g. exclude=["content"])
+            using: Named vector to search (None for the unnamed vector)
+
+        Returns:
+            Point groups ordered by their best hit
+        """
+        result = await self.client.search_groups(
+            collection_name=collection_name,
+            query_vector=self._query_vector(query_vector, using),
+            group_by=group_by,
+            limit=limit,
+            group_size=group_size,
+            query_filter=self.build_filter(metadata_filters),
+            search_params=self.search_params(collection_name),
+            with_payload=with_payload,
+        )
+        return result.groups
+
+    async def hybrid_search(
+        self,
+        collection_name: str,
+        query_vector: List[float],
+        metadata_filters: Dict[str, Any],
+        limit: int = 5,
+        with_payload: PayloadSpec = True,
+        sparse_query: Optional[Dict[str, List]] = None,
+        prefetch_limit: Optional[int] = None,
+        using: Optional[str] = None,
+    ) -> List[ScoredPoint]:
+        """
+        Perform hybrid search with semantic similarity and metadata filtering
+
+        Args:
+            collection_name: Name of the collection
+            query_vector: Query embedding vector
+            metadata_filters: Dictionary of metadata key-value pairs to filter
+            limit: Number of results to return
+            with_payload: True/False, payload fields to include, or a selector
+                from payload_selector (e.g. exclude=["content"])
+            sparse_query: Optional sparse query vector; fuses dense and sparse
+                candidates with reciprocal rank fusion on the server
+            prefetch_limit: Candidates per retriever (defaults to settings.hybrid_prefetch_limit)
+            using: Named vector to search (None for the unnamed vector)
+
+        Returns:
+            List of filtered search results
+        """
+        if sparse_query is not None:
+            response = await self.client.query_points(
+                collection_name=collection_name,
+                prefetch=self._fusion_prefetch(
+                    collection_name,
+                    query_vector,
+                    sparse_query,
+                    self.build_filter(metadata_filters),
+                    prefetch_limit,
+                    using,
+                ),
+                query=FusionQuery(fusion=Fusion.RRF),
+                limit=limit,
+                with_payload=with_payload,
+            )
+            return response.points
+
+        return await self.search(
+            collection_name=collection_name,
+            query_vector=query_vector,
+            limit=limit,
+            query_filter=self.build_filter(metadata_filters),
+            with_payload=with_payload,
+            using=using,
+        )
+
+    async def fusion_search_groups(
+        self,
+        collection_name: str,
+        query_vector: List[float],
+        sparse_query: Dict[str, List],
+        group_by: str,
+        limit: int = 5,
+        group_size: int = 3,
+        metadata_filters: Optional[Dict[str, Any]] = None,
+        prefetch_limit: Optional[int] = None,
+        with_payload: PayloadSpec = True,
+        using: Optional[str] = None,
+    ) -> List[Any]:
+        """
+        Dense + sparse search fused with reciprocal rank fusion, grouped by a payload field
+
+        Args:
+            collection_name: Name of the collection
+            query_vector: Query embedding vector
+            sparse_query: Sparse query vector (e.g. BM25Encoder.embed_query)
+            group_by: Payload field to group by (must be indexed)
+            limit: Number of groups to return
+            group_size: Hits kept per group
+            metadata_filters: Optional exact-match filters
+            prefetch_limit: Candidates per retriever (defaults to settings.hybrid_prefetch_limit)
+            with_payload: True/False, payload fields to include, or a selector
+                from payload_selector (e.g. exclude=["content"])
+            using: Named dense vector to prefetch from (None for the unnamed vector)
+
+        Returns:
+            Point groups ordered by their best fused hit
+        """
+        result = await self.client.query_points_groups(
+            collection_name=collection_name,
+            prefetch=self._fusion_prefetch(
+                collection_name,
+                query_vector,
+                sparse_query,
+                self.build_filter(metadata_filters),
+                prefetch_limit,
+                using,
+            ),
+            query=FusionQuery(fusion=Fusion.RRF),
+            group_by=group_by,
+            limit=limit,
+            group_size=group_size,
+            with_payload=with_payload,
+        )
+        return result.groups
+
+    async def scroll(
+        self,
+        collection_name: str,
+        scroll_filter: Optional[Filter] = None,
+        limit: int = 100,
+        offset: Optional[Any] = None,
+        with_vectors: bool = False,
+        order_by: Optional[OrderBy] = None,
+        shard_key_selector: Optional[str] = None,
+        with_payload: PayloadSpec = True,
+    ) -> Tuple[List[Any], Optional[Any]]:
+        """
+        Page through points matching a filter
+
+        Args:
+            collection_name: Name of the collection
+            scroll_filter: Optional filter conditions
+            limit: Page size
+            offset: Offset returned by the previous page
+            with_vectors: Whether to return vectors
+            order_by: Order by an indexed payload field instead of point ID
+            shard_key_selector: Restrict to one custom shard (see shard_key_for)
+            with_payload: Whether to return payloads, or the payload fields to return
+
+        Returns:
+            (points, next_offset) where next_offset is None on the last page
+        """
+        return await self.client.scroll(
+            collection_name=collection_name,
+            scroll_filter=scroll_filter,
+            limit=limit,
+            offset=offset,
+            with_payload=with_payload,
+            with_vectors=with_vectors,
+            order_by=order_by,
+            shard_key_selector=shard_key_selector,
+        )
+
+    async def retrieve(
+        self,
+        collection_name: str,
+        ids: List[Union[str, int]],
+        with_vectors: bool = False,
+        with_payload: PayloadSpec = True,
+    ) -> List[Any]:
+        """
+        Fetch points by ID
+
+        Args:
+            collection_name: Name of the collection
+            ids: Point IDs
+            with_vectors: Whether to return vectors
+            with_payload: True/False, payload fields to include, or a selector
+                from payload_selector (e.g. exclude=["content"])
+
+        Returns:
+            Records for the IDs that exist
+        """
+        return await self.client.retrieve(
+            collection_name=collection_name,
+            ids=ids,
+            with_payload=with_payload,
+            with_vectors=with_vectors,
+        )
+
+    async def count(
+        self,
+        collection_name: str,
+        count_filter: Optional[Filter] = None,
+        shard_key_selector: Optional[str] = None,
+    ) -> int:
+        """
+        Exact number of points matching a filter
+
+        Args:
+            collection_name: Name of the collection
+            count_filter: Optional filter conditions
+            shard_key_selector: Restrict to one custom shard (see shard_key_for)
+
+        Returns:
+            Point count
+        """
+        result = await self.client.count(
+            collection_name=collection_name,
+            count_filter=count_filter,
+            exact=True,
+            shard_key_selector=shard_key_selector,
+        )
+        return result.count
+
+    async def get_collection_info(self, collection_name: str) -> Dict[str, Any]:
+        """
+        Get information about a collection (or the collection behind an alias)
+
+        Args:
+            collection_name: Name of the collection
+
+        Returns:
+            Collection information
+        """
+        info = await self.client.get_collection(collection_name=collection_name)
+        return {
+            "name": collection_name,
+            "vectors_count": info.vectors_count,
+            "points_count": info.points_count,
+            "status": info.status,
+        }
+
+    async def list_collections(self) -> List[str]:
+        """
+        List all collections
+
+        Returns:
+            List of collection names
+        """
+        response = await self.client.get_collections()
+        return [col.name for col in response.collections]
+
+    async def close(self) -> None:
+        """Close the underlying connections"""
+        await self.client.close()
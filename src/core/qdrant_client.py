@@ -1,7 +1,13 @@
 """
 Qdrant client wrapper with collection management
 """
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Iterable, Iterator, Optional, Set, Tuple, Union
+from datetime import datetime, timezone
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import re
+import time
+import zlib
 from qdrant_client import QdrantClient as QdrantClientBase
 from qdrant_client.models import (
     Distance,
@@ -10,89 +16,781 @@ from qdrant_client.models import (
     Filter,
     FieldCondition,
     MatchValue,
+    MatchAny,
+    FilterSelector,
     SearchRequest,
     ScoredPoint,
     PayloadSchemaType,
+    HnswConfigDiff,
+    SearchParams,
+    QuantizationSearchParams,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    VectorParamsDiff,
+    CollectionParamsDiff,
+    Disabled,
+    OrderBy,
+    DatetimeRange,
+    KeywordIndexParams,
+    KeywordIndexType,
+    ShardingMethod,
+    CreateAlias,
+    CreateAliasOperation,
+    DeleteAlias,
+    DeleteAliasOperation,
+    PayloadSelectorInclude,
+    PayloadSelectorExclude,
+    SparseVectorParams,
+    SparseIndexParams,
+    SparseVector,
+    Modifier,
+    Prefetch,
+    FusionQuery,
+    Fusion,
+    NamedVector,
+    OptimizersConfigDiff,
+    QueryRequest,
 )
 from uuid import uuid4
 
 from src.utils import settings, setup_logger
+from src.utils.config import CollectionProfile
 
 logger = setup_logger(__name__, settings.log_level)
 
+# Payload fields indexed on every collection; "timestamp" backs ordered
+# history scrolls
+PAYLOAD_INDEXES = {
+    "patient_id": PayloadSchemaType.KEYWORD,
+    "type": PayloadSchemaType.KEYWORD,
+    "specialty": PayloadSchemaType.KEYWORD,
+    "parent_id": PayloadSchemaType.KEYWORD,
+    "modality": PayloadSchemaType.KEYWORD,
+    "body_part": PayloadSchemaType.KEYWORD,
+    "timestamp": PayloadSchemaType.DATETIME,
+}
 
-class QdrantManager:
+# with_payload argument: all/none, fields to include, or an include/exclude selector
+PayloadSpec = Union[bool, List[str], PayloadSelectorInclude, PayloadSelectorExclude]
+
+# Vector size of a collection: one unnamed vector, or sizes of named vectors
+VectorSizes = Union[int, Dict[str, int]]
+
+# Physical collections behind an alias are named <alias>_v<N>
+VERSION_SUFFIX = re.compile(r"^(?P<alias>.+)_v(?P<version>\d+)$")
+
+
+def client_options() -> Dict[str, Any]:
+    """Transport and connection-pool options shared by the sync and async clients"""
+    import httpx
+
+    return {
+        "prefer_grpc": settings.qdrant_prefer_grpc,
+        "grpc_port": settings.qdrant_grpc_port,
+        "timeout": settings.qdrant_timeout,
+        "limits": httpx.Limits(
+            max_connections=settings.qdrant_pool_max_connections,
+            max_keepalive_connections=settings.qdrant_pool_max_keepalive,
+        ),
+    }
+
+
+class QdrantManagerBase:
+    """Client-independent profile, routing and filter helpers shared by the sync and async managers"""
+
+    @staticmethod
+    def _logical_name(collection_name: str) -> str:
+        """Alias a versioned physical collection belongs to"""
+        match = VERSION_SUFFIX.match(collection_name)
+        return match.group("alias") if match else collection_name
+
+    def _profile(self, collection_name: str) -> CollectionProfile:
+        """Profile of a collection, alias or versioned physical collection"""
+        return settings.collection_profile(self._logical_name(collection_name))
+
+    def search_params(self, collection_name: str) -> Optional[SearchParams]:
+        """
+        Search-time parameters from a collection's profile
+
+        Args:
+            collection_name: Name of the collection
+
+        Returns:
+            SearchParams, or None to use Qdrant defaults
+        """
+        profile = self._profile(collection_name)
+        quantization = None
+        if profile.quantization:
+            quantization = QuantizationSearchParams(
+                rescore=profile.rescore,
+                oversampling=profile.oversampling,
+            )
+        if profile.search_ef is None and quantization is None:
+            return None
+        return SearchParams(hnsw_ef=profile.search_ef, quantization=quantization)
+
+    def shard_key_for(self, collection_name: str, tenant: Optional[str]) -> Optional[str]:
+        """
+        Shard key holding a tenant's points
+
+        Args:
+            collection_name: Name of the collection
+            tenant: Value of the collection's tenant_key
+
+        Returns:
+            Shard key, or None when the collection is not custom-sharded
+        """
+        profile = self._profile(collection_name)
+        if not profile.shard_buckets or tenant is None:
+            return None
+        return f"bucket-{zlib.crc32(str(tenant).encode()) % profile.shard_buckets}"
+
+    def _route(
+        self,
+        collection_name: str,
+        points: List[PointStruct],
+    ) -> Dict[Optional[str], List[PointStruct]]:
+        """Group points by the shard key of their tenant (a single None group if unsharded)"""
+        profile = self._profile(collection_name)
+        if not profile.shard_buckets:
+            return {None: points}
+        groups: Dict[Optional[str], List[PointStruct]] = {}
+        for point in points:
+            tenant = (point.payload or {}).get(profile.tenant_key)
+            groups.setdefault(self.shard_key_for(collection_name, tenant), []).append(point)
+        return groups
+
+    def point_vector(
+        self,
+        collection_name: str,
+        vector: Union[List[float], Dict[str, List[float]]],
+        sparse: Optional[Dict[str, List]] = None,
+    ) -> Any:
+        """
+        Vector struct of a point: its dense vector(s), plus the profile's sparse vector
+
+        Args:
+            collection_name: Name of the collection
+            vector: Dense vector, or named dense vectors (a point may carry a
+                subset of the collection's named vectors)
+            sparse: {"indices", "values"} sparse vector (e.g. from BM25Encoder)
+
+        Returns:
+            Value for PointStruct.vector
+        """
+        if sparse is None:
+            return vector
+        named = vector if isinstance(vector, dict) else {"": vector}
+        return {**named, self._profile(collection_name).sparse_vector: SparseVector(**sparse)}
+
+    @staticmethod
+    def _query_vector(query_vector: List[float], using: Optional[str]) -> Any:
+        """Query vector aimed at a named vector (or the unnamed one)"""
+        return NamedVector(name=using, vector=query_vector) if using else query_vector
+
+    def _fusion_prefetch(
+        self,
+        collection_name: str,
+        query_vector: List[float],
+        sparse_query: Dict[str, List],
+        query_filter: Optional[Filter],
+        prefetch_limit: Optional[int],
+        using: Optional[str] = None,
+    ) -> List[Prefetch]:
+        """Dense and sparse candidate queries to fuse server-side"""
+        prefetch_limit = prefetch_limit or settings.hybrid_prefetch_limit
+        return [
+            Prefetch(
+                query=query_vector,
+                using=using,
+                filter=query_filter,
+                limit=prefetch_limit,
+                params=self.search_params(collection_name),
+            ),
+            Prefetch(
+                query=SparseVector(**sparse_query),
+                using=self._profile(collection_name).sparse_vector,
+                filter=query_filter,
+                limit=prefetch_limit,
+            ),
+        ]
+
+    @staticmethod
+    def payload_selector(
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> PayloadSpec:
+        """
+        Build a payload projection
+
+        Args:
+            include: Only return these payload fields
+            exclude: Return every payload field except these
+
+        Returns:
+            Value for the with_payload argument (True when neither is given)
+        """
+        if include is not None and exclude is not None:
+            raise ValueError("Pass either include or exclude, not both")
+        if include is not None:
+            return PayloadSelectorInclude(include=list(include))
+        if exclude is not None:
+            return PayloadSelectorExclude(exclude=list(exclude))
+        return True
+
+    @staticmethod
+    def build_filter(metadata_filters: Optional[Dict[str, Any]]) -> Optional[Filter]:
+        """
+        Build an exact-match filter from metadata key-value pairs
+
+        Args:
+            metadata_filters: Dictionary of metadata key-value pairs
+
+        Returns:
+            Filter, or None when there is nothing to filter on
+        """
+        conditions = [
+            FieldCondition(
+                key=key,
+                match=MatchValue(value=value),
+            )
+            for key, value in (metadata_filters or {}).items()
+        ]
+        return Filter(must=conditions) if conditions else None
+
+    @staticmethod
+    def any_of_filter(key: str, values: List[Any]) -> Filter:
+        """Filter matching points whose payload field equals any of the values"""
+        return Filter(must=[FieldCondition(key=key, match=MatchAny(any=list(values)))])
+
+    @staticmethod
+    def datetime_range(
+        key: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> FieldCondition:
+        """
+        Half-open [start, end) condition on a DATETIME-indexed payload field
+
+        Args:
+            key: Payload field
+            start: Inclusive lower bound (naive datetimes are taken as UTC)
+            end: Exclusive upper bound
+
+        Returns:
+            Field condition evaluated by Qdrant's payload index
+        """
+        def as_utc(value: Optional[datetime]) -> Optional[datetime]:
+            if value is None or value.tzinfo is not None:
+                return value
+            return value.replace(tzinfo=timezone.utc)
+
+        return FieldCondition(key=key, range=DatetimeRange(gte=as_utc(start), lt=as_utc(end)))
+
+    @staticmethod
+    def _hnsw_config(profile: CollectionProfile) -> Optional[HnswConfigDiff]:
+        """HNSW overrides from a profile"""
+        m, payload_m = profile.hnsw_m, profile.hnsw_payload_m
+        if profile.tenant_key:
+            # Every query filters by tenant, so build per-tenant graphs only
+            m = 0 if m is None else m
+            payload_m = payload_m or 16
+        if (
+            m is None and payload_m is None and profile.hnsw_ef_construct is None
+            and profile.hnsw_full_scan_threshold is None
+        ):
+            return None
+        return HnswConfigDiff(
+            m=m,
+            ef_construct=profile.hnsw_ef_construct,
+            payload_m=payload_m,
+            full_scan_threshold=profile.hnsw_full_scan_threshold,
+        )
+
+    @staticmethod
+    def _optimizers_config(profile: CollectionProfile) -> Optional[OptimizersConfigDiff]:
+        """Optimizer overrides from a profile"""
+        if profile.indexing_threshold is None:
+            return None
+        return OptimizersConfigDiff(indexing_threshold=profile.indexing_threshold)
+
+    @staticmethod
+    def _quantization_config(profile: CollectionProfile):
+        """Quantization config from a profile"""
+        if profile.quantization == "scalar":
+            return ScalarQuantization(
+                scalar=ScalarQuantizationConfig(
+                    type=ScalarType.INT8,
+                    quantile=0.99,
+                    always_ram=profile.quantization_always_ram,
+                )
+            )
+        if profile.quantization == "binary":
+            return BinaryQuantization(
+                binary=BinaryQuantizationConfig(always_ram=profile.quantization_always_ram)
+            )
+        if profile.quantization:
+            raise ValueError(f"Unknown quantization: {profile.quantization}")
+        return None
+
+    @staticmethod
+    def _vectors_config(
+        vector_size: VectorSizes,
+        distance: Distance,
+        profile: CollectionProfile,
+    ) -> Union[VectorParams, Dict[str, VectorParams]]:
+        """Dense vector config: one unnamed vector or several named ones"""
+        def params(size: int) -> VectorParams:
+            return VectorParams(size=size, distance=distance, on_disk=profile.on_disk_vectors or None)
+
+        if isinstance(vector_size, dict):
+            return {name: params(size) for name, size in vector_size.items()}
+        return params(vector_size)
+
+    @staticmethod
+    def _sparse_vectors_config(profile: CollectionProfile) -> Optional[Dict[str, SparseVectorParams]]:
+        """Sparse vector config from a profile; Qdrant applies the IDF weighting"""
+        if not profile.sparse_vector:
+            return None
+        return {
+            profile.sparse_vector: SparseVectorParams(
+                index=SparseIndexParams(on_disk=profile.on_disk_vectors or None),
+                modifier=Modifier.IDF,
+            )
+        }
+
+    @staticmethod
+    def _shard_keys(profile: CollectionProfile) -> List[str]:
+        """Custom shard keys for a profile"""
+        return [f"bucket-{bucket}" for bucket in range(profile.shard_buckets)]
+
+
+class QdrantManager(QdrantManagerBase):
     """Manage Qdrant operations and collections"""
 
-    def __init__(self):
-        """Initialize Qdrant client"""
-        logger.info(f"Connecting to Qdrant at {settings.qdrant_url}")
-        if settings.qdrant_url == ":memory:":
+    def __init__(self, url: Optional[str] = None, api_key: Optional[str] = None):
+        """
+        Initialize Qdrant client
+
+        Args:
+            url: Qdrant URL (defaults to settings.qdrant_url)
+            api_key: Qdrant API key (defaults to settings.qdrant_api_key)
+        """
+        url = url or settings.qdrant_url
+        api_key = api_key or settings.qdrant_api_key
+        logger.info(f"Connecting to Qdrant at {url}")
+        # An in-process store is private to this client; async callers must
+        # go through this manager to see its collections
+        self.in_memory = url == ":memory:"
+        if self.in_memory:
             self.client = QdrantClientBase(location=":memory:")
         else:
             self.client = QdrantClientBase(
-                url=settings.qdrant_url,
-                api_key=settings.qdrant_api_key,
+                url=url,
+                api_key=api_key,
+                **client_options(),
             )
         logger.info("Qdrant client initialized successfully")
 
     def create_collection(
         self,
         collection_name: str,
-        vector_size: int,
+        vector_size: VectorSizes,
         distance: Distance = Distance.COSINE,
+        profile: Optional[CollectionProfile] = None,
     ) -> None:
         """
         Create a new collection if it doesn't exist
 
+        With settings.collection_aliases the name becomes an alias over a
+        versioned physical collection, so it can later be rebuilt and
+        swapped with rebuild_collection.
+
         Args:
-            collection_name: Name of the collection
-            vector_size: Dimension of vectors
+            collection_name: Name of the collection (or alias)
+            vector_size: Dimension of vectors, or {name: dimension} for named
+                vectors (e.g. {"text_biomed": 768, "image_resnet": 2048})
             distance: Distance metric to use
+            profile: Index/quantization/storage profile (defaults to settings)
         """
+        profile = profile or self._profile(collection_name)
         try:
-            # Check if collection exists
-            collections = self.client.get_collections().collections
-            collection_names = [col.name for col in collections]
-
-            if collection_name in collection_names:
+            # Check if collection exists, directly or as an alias
+            physical = self.resolve_collection(collection_name)
+            if physical is not None:
                 logger.info(f"Collection '{collection_name}' already exists")
+                if settings.migrate_collection_profiles:
+                    self.apply_collection_profile(physical, profile)
                 # Ensure indexes exist even for existing collections
-                self._ensure_payload_indexes(collection_name)
+                self._ensure_payload_indexes(physical, profile)
                 return
 
-            # Create collection
-            self.client.create_collection(
-                collection_name=collection_name,
-                vectors_config=VectorParams(
-                    size=vector_size,
-                    distance=distance,
-                ),
-            )
-            logger.info(f"Created collection '{collection_name}' with dimension {vector_size}")
-
-            # Create payload indexes for filtering
-            self._ensure_payload_indexes(collection_name)
+            if settings.collection_aliases:
+                physical = self.create_versioned_collection(collection_name, vector_size, distance, profile)
+                self.swap_alias(collection_name, physical)
+            else:
+                self._create_physical(collection_name, vector_size, distance, profile)
 
         except Exception as e:
             logger.error(f"Failed to create collection '{collection_name}': {e}")
             raise
 
-    def _ensure_payload_indexes(self, collection_name: str) -> None:
+    def _create_physical(
+        self,
+        collection_name: str,
+        vector_size: VectorSizes,
+        distance: Distance,
+        profile: CollectionProfile,
+    ) -> None:
+        """Create one physical collection with its profile and payload indexes"""
+        self.client.create_collection(
+            collection_name=collection_name,
+            vectors_config=self._vectors_config(vector_size, distance, profile),
+            sparse_vectors_config=self._sparse_vectors_config(profile),
+            hnsw_config=self._hnsw_config(profile),
+            optimizers_config=self._optimizers_config(profile),
+            quantization_config=self._quantization_config(profile),
+            on_disk_payload=profile.on_disk_payload,
+            sharding_method=ShardingMethod.CUSTOM if profile.shard_buckets else None,
+        )
+        for shard_key in self._shard_keys(profile):
+            self.client.create_shard_key(collection_name=collection_name, shard_key=shard_key)
+        logger.info(f"Created collection '{collection_name}' with dimension {vector_size}")
+
+        # Create payload indexes for filtering
+        self._ensure_payload_indexes(collection_name, profile)
+
+    def aliases(self) -> Dict[str, str]:
         """
-        Create payload indexes for common filter fields
-        
+        Current aliases
+
+        Returns:
+            Alias name -> physical collection name
+        """
+        return {
+            alias.alias_name: alias.collection_name
+            for alias in self.client.get_aliases().aliases
+        }
+
+    def resolve_collection(self, name: str) -> Optional[str]:
+        """
+        Physical collection behind a name
+
+        Args:
+            name: Alias or collection name
+
+        Returns:
+            Physical collection name, or None if neither exists
+        """
+        aliases = self.aliases()
+        if name in aliases:
+            return aliases[name]
+        return name if name in self.list_collections() else None
+
+    def collection_versions(self, alias: str) -> List[str]:
+        """
+        Physical versions of an alias, oldest first
+
+        Args:
+            alias: Alias name
+
+        Returns:
+            Collection names of the form <alias>_v<N>, ordered by N
+        """
+        versions = []
+        for name in self.list_collections():
+            match = VERSION_SUFFIX.match(name)
+            if match and match.group("alias") == alias:
+                versions.append((int(match.group("version")), name))
+        return [name for _, name in sorted(versions)]
+
+    def create_versioned_collection(
+        self,
+        alias: str,
+        vector_size: VectorSizes,
+        distance: Distance = Distance.COSINE,
+        profile: Optional[CollectionProfile] = None,
+    ) -> str:
+        """
+        Create the next physical version of an alias without pointing the alias at it
+
+        Args:
+            alias: Alias name
+            vector_size: Dimension of vectors, or {name: dimension} for named vectors
+            distance: Distance metric to use
+            profile: Index/quantization/storage profile (defaults to the alias's)
+
+        Returns:
+            Name of the new physical collection
+        """
+        versions = self.collection_versions(alias)
+        latest = int(VERSION_SUFFIX.match(versions[-1]).group("version")) if versions else 0
+        physical = f"{alias}_v{latest + 1}"
+        self._create_physical(physical, vector_size, distance, profile or self._profile(alias))
+        return physical
+
+    def swap_alias(self, alias: str, collection_name: str) -> Optional[str]:
+        """
+        Atomically point an alias at a physical collection
+
+        Both alias operations are applied in one request, so readers see
+        either the old or the new collection, never a missing one. A legacy
+        physical collection that holds the alias's name has to be dropped
+        first; that one-time migration leaves a brief gap.
+
+        Args:
+            alias: Alias name
+            collection_name: Physical collection to serve under the alias
+
+        Returns:
+            Physical collection the alias pointed at before, if any
+        """
+        previous = self.aliases().get(alias)
+        operations = []
+        if previous is not None:
+            operations.append(DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=alias)))
+        elif alias in self.list_collections():
+            logger.warning(f"Dropping legacy collection '{alias}' so its name can become an alias")
+            self.client.delete_collection(collection_name=alias)
+        operations.append(CreateAliasOperation(
+            create_alias=CreateAlias(collection_name=collection_name, alias_name=alias)
+        ))
+
+        self.client.update_collection_aliases(change_aliases_operations=operations)
+        logger.info(f"Alias '{alias}' now serves '{collection_name}' (was '{previous}')")
+        return previous
+
+    def wait_until_ready(self, collection_name: str, timeout: float = 300.0) -> bool:
+        """
+        Block until the optimizer has finished building a collection's indexes
+
+        Args:
+            collection_name: Name of the collection
+            timeout: Seconds to wait
+
+        Returns:
+            True if the collection reached green status in time
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.client.get_collection(collection_name=collection_name).status == "green":
+                return True
+            time.sleep(0.5)
+        logger.warning(f"Collection '{collection_name}' still optimizing after {timeout:.0f}s")
+        return False
+
+    def rebuild_collection(
+        self,
+        alias: str,
+        vector_size: VectorSizes,
+        populate: Callable[[str], Any],
+        distance: Distance = Distance.COSINE,
+        profile: Optional[CollectionProfile] = None,
+        keep_previous: bool = False,
+    ) -> str:
+        """
+        Blue/green rebuild: fill a new version, then swap the alias to it
+
+        Searches keep hitting the current version until the swap. If
+        populating fails, or leaves the new version empty while the live one
+        is not, the new version is dropped and the alias is left alone.
+
+        Args:
+            alias: Alias name
+            vector_size: Dimension of vectors in the new version, or {name: dimension}
+            populate: Called with the new physical collection name to fill it
+            distance: Distance metric to use
+            profile: Index/quantization/storage profile (defaults to the alias's)
+            keep_previous: Keep the old version for rollback instead of deleting it
+
+        Returns:
+            Name of the new physical collection
+        """
+        physical = self.create_versioned_collection(alias, vector_size, distance, profile)
+        try:
+            populate(physical)
+            live = self.resolve_collection(alias)
+            if live is not None and self.count(physical) == 0 and self.count(live) > 0:
+                raise RuntimeError(f"Rebuilt '{physical}' is empty; keeping '{live}' live")
+            self.wait_until_ready(physical)
+        except Exception:
+            self.client.delete_collection(collection_name=physical)
+            raise
+
+        previous = self.swap_alias(alias, physical)
+        if previous is not None and not keep_previous:
+            self.client.delete_collection(collection_name=previous)
+            logger.info(f"Deleted previous version '{previous}'")
+        return physical
+
+    def apply_collection_profile(
+        self,
+        collection_name: str,
+        profile: Optional[CollectionProfile] = None,
+    ) -> bool:
+        """
+        Migrate an existing collection to its profile if its config differs
+
+        Qdrant rebuilds the HNSW graph, quantized vectors and storage layout
+        in the background; the collection stays searchable meanwhile.
+
         Args:
             collection_name: Name of the collection
+            profile: Target profile (defaults to settings)
+
+        Returns:
+            True if an update was sent
         """
-        index_fields = ["patient_id", "type", "specialty"]
+        profile = profile or self._profile(collection_name)
+        config = self.client.get_collection(collection_name=collection_name).config
+
+        vectors = config.params.vectors
+        named = vectors if isinstance(vectors, dict) else {"": vectors}
+        current_on_disk = all(bool(getattr(params, "on_disk", False)) for params in named.values())
+        current_quantization = type(config.quantization_config).__name__ if config.quantization_config else None
+        desired_quantization = type(self._quantization_config(profile)).__name__ if profile.quantization else None
+
+        hnsw = self._hnsw_config(profile)
+        hnsw_drift = hnsw is not None and any(
+            value is not None and value != getattr(config.hnsw_config, field)
+            for field, value in (
+                ("m", hnsw.m),
+                ("ef_construct", hnsw.ef_construct),
+                ("payload_m", hnsw.payload_m),
+                ("full_scan_threshold", hnsw.full_scan_threshold),
+            )
+        )
+        optimizers_drift = (
+            profile.indexing_threshold is not None
+            and profile.indexing_threshold != config.optimizer_config.indexing_threshold
+        )
+        sharded = config.params.sharding_method == ShardingMethod.CUSTOM
+        if sharded != bool(profile.shard_buckets):
+            logger.warning(
+                f"Collection '{collection_name}' sharding differs from its profile; "
+                f"sharding can only be set when the collection is created"
+            )
+        if profile.sparse_vector and profile.sparse_vector not in (config.params.sparse_vectors or {}):
+            logger.warning(
+                f"Collection '{collection_name}' has no sparse vector '{profile.sparse_vector}'; "
+                f"rebuild it to enable hybrid search"
+            )
+        vectors_drift = current_on_disk != profile.on_disk_vectors
+        payload_drift = (
+            profile.on_disk_payload is not None
+            and bool(config.params.on_disk_payload) != profile.on_disk_payload
+        )
+        quantization_drift = current_quantization != desired_quantization
+
+        if not (hnsw_drift or optimizers_drift or vectors_drift or payload_drift or quantization_drift):
+            return False
+
+        self.client.update_collection(
+            collection_name=collection_name,
+            vectors_config=(
+                {name: VectorParamsDiff(on_disk=profile.on_disk_vectors) for name in named}
+                if vectors_drift else None
+            ),
+            hnsw_config=hnsw if hnsw_drift else None,
+            optimizers_config=self._optimizers_config(profile) if optimizers_drift else None,
+            quantization_config=(
+                (self._quantization_config(profile) or Disabled.DISABLED)
+                if quantization_drift else None
+            ),
+            collection_params=(
+                CollectionParamsDiff(on_disk_payload=profile.on_disk_payload)
+                if payload_drift else None
+            ),
+        )
+        logger.info(f"Migrated collection '{collection_name}' to its configured profile")
+        return True
+
+    def sparse_vector_name(self, collection_name: str) -> Optional[str]:
+        """
+        Sparse vector of a collection's profile, if the collection actually stores it
+
+        Collections created before the profile gained a sparse vector lack it
+        until they are rebuilt.
+
+        Args:
+            collection_name: Name of the collection or alias
+
+        Returns:
+            Sparse vector name, or None
+        """
+        name = self._profile(collection_name).sparse_vector
+        physical = self.resolve_collection(collection_name) if name else None
+        if physical is None:
+            return None
+        params = self.client.get_collection(collection_name=physical).config.params
+        return name if name in (params.sparse_vectors or {}) else None
+
+    def vector_names(self, collection_name: str) -> List[str]:
+        """
+        Named dense vectors of a collection
+
+        Args:
+            collection_name: Name of the collection or alias
+
+        Returns:
+            Vector names, or an empty list for a single unnamed vector (or a
+            missing collection)
+        """
+        physical = self.resolve_collection(collection_name)
+        if physical is None:
+            return []
+        vectors = self.client.get_collection(collection_name=physical).config.params.vectors
+        return list(vectors) if isinstance(vectors, dict) else []
+
+    def vector_sizes(self, collection_name: str) -> Optional[VectorSizes]:
+        """
+        Dense vector size(s) of a collection
+
+        Args:
+            collection_name: Name of the collection or alias
+
+        Returns:
+            Size of the unnamed vector, {name: size} for named vectors, or
+            None for a missing collection
+        """
+        physical = self.resolve_collection(collection_name)
+        if physical is None:
+            return None
+        vectors = self.client.get_collection(collection_name=physical).config.params.vectors
+        if isinstance(vectors, dict):
+            return {name: params.size for name, params in vectors.items()}
+        return vectors.size
+
+    def _ensure_payload_indexes(
+        self,
+        collection_name: str,
+        profile: Optional[CollectionProfile] = None,
+    ) -> None:
+        """
+        Create payload indexes for common filter and ordering fields
         
-        for field in index_fields:
+        Args:
+            collection_name: Name of the collection
+            profile: Collection profile; its tenant_key gets a tenant index
+        """
+        profile = profile or self._profile(collection_name)
+        indexes = dict(PAYLOAD_INDEXES)
+        if profile.tenant_key:
+            # Tenant indexes co-locate each tenant's points on disk
+            indexes[profile.tenant_key] = KeywordIndexParams(
+                type=KeywordIndexType.KEYWORD,
+                is_tenant=True,
+            )
+
+        for field, schema in indexes.items():
             try:
                 self.client.create_payload_index(
                     collection_name=collection_name,
                     field_name=field,
-                    field_schema=PayloadSchemaType.KEYWORD,
+                    field_schema=schema,
                 )
                 logger.debug(f"Created payload index for '{field}' in collection '{collection_name}'")
             except Exception as e:
@@ -103,42 +801,142 @@ class QdrantManager:
     def upsert_points(
         self,
         collection_name: str,
-        vectors: List[List[float]],
+        vectors: List[Union[List[float], Dict[str, List[float]]]],
         payloads: List[Dict[str, Any]],
         ids: Optional[List[str]] = None,
+        sparse_vectors: Optional[List[Dict[str, List]]] = None,
     ) -> List[str]:
         """
         Insert or update points in a collection
 
         Args:
             collection_name: Name of the collection
-            vectors: List of embedding vectors
+            vectors: List of embedding vectors, or of {name: vector} dicts
+                for collections with named vectors
             payloads: List of metadata dictionaries
             ids: Optional list of point IDs
+            sparse_vectors: Optional sparse vectors stored as the profile's
+                sparse vector (see sparse_vector_name)
 
         Returns:
             List of point IDs
         """
         if ids is None:
             ids = [str(uuid4()) for _ in range(len(vectors))]
+        sparse_vectors = sparse_vectors or [None] * len(vectors)
 
         points = [
             PointStruct(
                 id=point_id,
-                vector=vector,
+                vector=self.point_vector(collection_name, vector, sparse),
                 payload=payload,
             )
-            for point_id, vector, payload in zip(ids, vectors, payloads)
+            for point_id, vector, sparse, payload in zip(ids, vectors, sparse_vectors, payloads)
         ]
 
-        self.client.upsert(
-            collection_name=collection_name,
-            points=points,
-        )
+        for shard_key, group in self._route(collection_name, points).items():
+            self.client.upsert(
+                collection_name=collection_name,
+                points=group,
+                shard_key_selector=shard_key,
+            )
 
         logger.info(f"Upserted {len(points)} points to collection '{collection_name}'")
         return ids
 
+    def bulk_upsert(
+        self,
+        collection_name: str,
+        rows: Iterable[Tuple[Optional[str], List[float], Dict[str, Any]]],
+        batch_size: Optional[int] = None,
+        parallel: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Stream (id, vector, payload) rows into a collection in concurrent batches
+
+        Batches are sent with wait=False from a small thread pool, keeping at
+        most 2 x parallel batches in flight. The last batch is held back and
+        sent with wait=True once every earlier batch has been acknowledged;
+        Qdrant applies a shard's updates in WAL order, so when it returns all
+        previous batches are applied too. On custom-sharded collections that
+        ordering only holds per shard key, so every batch waits.
+
+        Args:
+            collection_name: Name of the collection
+            rows: Iterable of (id or None, vector, payload); vector may be a
+                {name: vector} dict or a struct from point_vector
+            batch_size: Points per request (defaults to settings.qdrant_upsert_batch_size)
+            parallel: Concurrent requests (defaults to settings.qdrant_upsert_parallel)
+
+        Returns:
+            Point IDs, batch count, elapsed seconds and points per second
+        """
+        batch_size = batch_size or settings.qdrant_upsert_batch_size
+        parallel = parallel or settings.qdrant_upsert_parallel
+
+        def batches() -> Iterator[List[PointStruct]]:
+            batch = []
+            for point_id, vector, payload in rows:
+                batch.append(PointStruct(
+                    id=point_id if point_id is not None else str(uuid4()),
+                    vector=vector,
+                    payload=payload,
+                ))
+                if len(batch) == batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+        sharded = bool(self._profile(collection_name).shard_buckets)
+
+        def send(points: List[PointStruct], wait: bool) -> None:
+            for shard_key, group in self._route(collection_name, points).items():
+                self.client.upsert(
+                    collection_name=collection_name,
+                    points=group,
+                    wait=wait or sharded,
+                    shard_key_selector=shard_key,
+                )
+
+        started = time.perf_counter()
+        ids: List[str] = []
+        n_batches = 0
+        held_back: Optional[List[PointStruct]] = None
+
+        with ThreadPoolExecutor(max_workers=parallel) as pool:
+            in_flight = deque()
+            for batch in batches():
+                ids.extend(str(point.id) for point in batch)
+                n_batches += 1
+                # Always keep the newest batch back so it can be the barrier
+                if held_back is not None:
+                    in_flight.append(pool.submit(send, held_back, False))
+                    while len(in_flight) > parallel * 2:
+                        in_flight.popleft().result()
+                held_back = batch
+
+            for future in in_flight:
+                future.result()
+
+        # Consistency barrier
+        if held_back is not None:
+            send(held_back, True)
+
+        elapsed = time.perf_counter() - started
+        stats = {
+            "ids": ids,
+            "points": len(ids),
+            "batches": n_batches,
+            "seconds": elapsed,
+            "points_per_second": len(ids) / elapsed if elapsed > 0 else 0.0,
+        }
+        logger.info(
+            f"Bulk upserted {len(ids)} points to '{collection_name}' in {n_batches} batches "
+            f"({stats['points_per_second']:.0f} points/s)"
+        )
+        return stats
+
     def search(
         self,
         collection_name: str,
@@ -146,6 +944,9 @@ class QdrantManager:
         limit: int = 5,
         score_threshold: float = 0.0,
         query_filter: Optional[Filter] = None,
+        shard_key_selector: Optional[str] = None,
+        with_payload: PayloadSpec = True,
+        using: Optional[str] = None,
     ) -> List[ScoredPoint]:
         """
         Search for similar vectors
@@ -156,57 +957,400 @@ class QdrantManager:
             limit: Number of results to return
             score_threshold: Minimum similarity score
             query_filter: Optional filter conditions
+            shard_key_selector: Restrict to one custom shard (see shard_key_for)
+            with_payload: True/False, payload fields to include, or a selector
+                from payload_selector (e.g. exclude=["content"])
+            using: Named vector to search (None for the unnamed vector)
 
         Returns:
             List of search results with scores
         """
         results = self.client.search(
             collection_name=collection_name,
-            query_vector=query_vector,
+            query_vector=self._query_vector(query_vector, using),
             limit=limit,
             score_threshold=score_threshold,
             query_filter=query_filter,
+            search_params=self.search_params(collection_name),
+            shard_key_selector=shard_key_selector,
+            with_payload=with_payload,
         )
 
         logger.debug(f"Search returned {len(results)} results from '{collection_name}'")
         return results
 
+    def search_batch(
+        self,
+        collection_name: str,
+        query_vectors: List[List[float]],
+        limits: Union[int, List[int]] = 5,
+        query_filters: Optional[List[Optional[Filter]]] = None,
+        score_threshold: float = 0.0,
+        with_payload: PayloadSpec = True,
+        using: Optional[str] = None,
+    ) -> List[List[ScoredPoint]]:
+        """
+        Run many searches against one collection in a single request
+
+        Args:
+            collection_name: Name of the collection
+            query_vectors: Query embedding vectors
+            limits: One limit for all queries or a limit per query
+            query_filters: Optional filter per query (None entries allowed)
+            score_threshold: Minimum similarity score
+            with_payload: True/False, payload fields to include, or a selector
+                from payload_selector (e.g. exclude=["content"])
+            using: Named vector to search (None for the unnamed vector)
+
+        Returns:
+            One result list per query, in query order
+        """
+        if isinstance(limits, int):
+            limits = [limits] * len(query_vectors)
+        query_filters = query_filters or [None] * len(query_vectors)
+
+        params = self.search_params(collection_name)
+        requests = [
+            SearchRequest(
+                vector=self._query_vector(vector, using),
+                filter=query_filter,
+                limit=limit,
+                score_threshold=score_threshold,
+                with_payload=with_payload,
+                params=params,
+            )
+            for vector, query_filter, limit in zip(query_vectors, query_filters, limits)
+        ]
+        results = self.client.search_batch(collection_name=collection_name, requests=requests)
+
+        logger.debug(f"Batch search ran {len(requests)} queries against '{collection_name}'")
+        return results
+
+    def fusion_search_batch(
+        self,
+        collection_name: str,
+        query_vectors: List[List[float]],
+        sparse_queries: List[Optional[Dict[str, List]]],
+        limits: Union[int, List[int]] = 5,
+        query_filters: Optional[List[Optional[Filter]]] = None,
+        prefetch_limit: Optional[int] = None,
+        with_payload: PayloadSpec = True,
+        using: Optional[str] = None,
+    ) -> List[List[ScoredPoint]]:
+        """
+        Run many dense + sparse RRF searches against one collection in a single request
+
+        Queries without a sparse vector (e.g. only stopwords) run dense-only
+        within the same batch.
+
+        Args:
+            collection_name: Name of the collection
+            query_vectors: Query embedding vectors
+            sparse_queries: Sparse query vector per query (None entries allowed)
+            limits: One limit for all queries or a limit per query
+            query_filters: Optional filter per query (None entries allowed)
+            prefetch_limit: Candidates per retriever (defaults to settings.hybrid_prefetch_limit)
+            with_payload: True/False, payload fields to include, or a selector
+                from payload_selector (e.g. exclude=["content"])
+            using: Named dense vector to search (None for the unnamed vector)
+
+        Returns:
+            One result list per query, in query order
+        """
+        if isinstance(limits, int):
+            limits = [limits] * len(query_vectors)
+        query_filters = query_filters or [None] * len(query_vectors)
+
+        requests = []
+        for vector, sparse_query, query_filter, limit in zip(
+            query_vectors, sparse_queries, query_filters, limits
+        ):
+            if sparse_query is None:
+                requests.append(QueryRequest(
+                    query=vector,
+                    using=using,
+                    filter=query_filter,
+                    limit=limit,
+                    params=self.search_params(collection_name),
+                    with_payload=with_payload,
+                ))
+            else:
+                requests.append(QueryRequest(
+                    prefetch=self._fusion_prefetch(
+                        collection_name, vector, sparse_query, query_filter, prefetch_limit, using
+                    ),
+                    query=FusionQuery(fusion=Fusion.RRF),
+                    limit=limit,
+                    with_payload=with_payload,
+                ))
+        responses = self.client.query_batch_points(collection_name=collection_name, requests=requests)
+
+        logger.debug(f"Fusion batch search ran {len(requests)} queries against '{collection_name}'")
+        return [response.points for response in responses]
+
+    def search_groups(
+        self,
+        collection_name: str,
+        query_vector: List[float],
+        group_by: str,
+        limit: int = 5,
+        group_size: int = 3,
+        metadata_filters: Optional[Dict[str, Any]] = None,
+        with_payload: PayloadSpec = True,
+        using: Optional[str] = None,
+    ) -> List[Any]:
+        """
+        Search and group hits by a payload field on the server
+
+        Args:
+            collection_name: Name of the collection
+            query_vector: Query embedding vector
+            group_by: Payload field to group by (must be indexed)
+            limit: Number of groups to return
+            group_size: Hits kept per group
+            metadata_filters: Optional exact-match filters
+            with_payload: True/False, payload fields to include, or a selector
+                from payload_selector (e.g. exclude=["content"])
+            using: Named vector to search (None for the unnamed vector)
+
+        Returns:
+            Point groups ordered by their best hit
+        """
+        result = self.client.search_groups(
+            collection_name=collection_name,
+            query_vector=self._query_vector(query_vector, using),
+            group_by=group_by,
+            limit=limit,
+            group_size=group_size,
+            query_filter=self.build_filter(metadata_filters),
+            search_params=self.search_params(collection_name),
+            with_payload=with_payload,
+        )
+
+        logger.debug(f"Group search returned {len(result.groups)} groups from '{collection_name}'")
+        return result.groups
+
+    def fusion_search_groups(
+        self,
+        collection_name: str,
+        query_vector: List[float],
+        sparse_query: Dict[str, List],
+        group_by: str,
+        limit: int = 5,
+        group_size: int = 3,
+        metadata_filters: Optional[Dict[str, Any]] = None,
+        prefetch_limit: Optional[int] = None,
+        with_payload: PayloadSpec = True,
+        using: Optional[str] = None,
+    ) -> List[Any]:
+        """
+        Dense + sparse search fused with reciprocal rank fusion, grouped by a payload field
+
+        Both candidate lists are retrieved and fused by Qdrant in one request.
+
+        Args:
+            collection_name: Name of the collection
+            query_vector: Query embedding vector
+            sparse_query: Sparse query vector (e.g. BM25Encoder.embed_query)
+            group_by: Payload field to group by (must be indexed)
+            limit: Number of groups to return
+            group_size: Hits kept per group
+            metadata_filters: Optional exact-match filters
+            prefetch_limit: Candidates per retriever (defaults to settings.hybrid_prefetch_limit)
+            with_payload: True/False, payload fields to include, or a selector
+                from payload_selector (e.g. exclude=["content"])
+            using: Named dense vector to prefetch from (None for the unnamed vector)
+
+        Returns:
+            Point groups ordered by their best fused hit
+        """
+        query_filter = self.build_filter(metadata_filters)
+        result = self.client.query_points_groups(
+            collection_name=collection_name,
+            prefetch=self._fusion_prefetch(
+                collection_name, query_vector, sparse_query, query_filter, prefetch_limit, using
+            ),
+            query=FusionQuery(fusion=Fusion.RRF),
+            group_by=group_by,
+            limit=limit,
+            group_size=group_size,
+            with_payload=with_payload,
+        )
+
+        logger.debug(f"Fusion search returned {len(result.groups)} groups from '{collection_name}'")
+        return result.groups
+
+    def scroll(
+        self,
+        collection_name: str,
+        scroll_filter: Optional[Filter] = None,
+        limit: int = 100,
+        offset: Optional[Any] = None,
+        with_vectors: bool = False,
+        order_by: Optional[OrderBy] = None,
+        shard_key_selector: Optional[str] = None,
+        with_payload: PayloadSpec = True,
+    ) -> Tuple[List[Any], Optional[Any]]:
+        """
+        Page through points matching a filter
+
+        Args:
+            collection_name: Name of the collection
+            scroll_filter: Optional filter conditions
+            limit: Page size
+            offset: Offset returned by the previous page
+            with_vectors: Whether to return vectors
+            order_by: Order by an indexed payload field instead of point ID.
+                Qdrant does not return offsets for ordered scrolls; page with
+                OrderBy.start_from instead.
+            shard_key_selector: Restrict to one custom shard (see shard_key_for)
+            with_payload: Whether to return payloads, or the payload fields to return
+
+        Returns:
+            (points, next_offset) where next_offset is None on the last page
+        """
+        points, next_offset = self.client.scroll(
+            collection_name=collection_name,
+            scroll_filter=scroll_filter,
+            limit=limit,
+            offset=offset,
+            with_payload=with_payload,
+            with_vectors=with_vectors,
+            order_by=order_by,
+            shard_key_selector=shard_key_selector,
+        )
+        return points, next_offset
+
+    def retrieve(
+        self,
+        collection_name: str,
+        ids: List[Union[str, int]],
+        with_vectors: bool = False,
+        with_payload: PayloadSpec = True,
+    ) -> List[Any]:
+        """
+        Fetch points by ID
+
+        Args:
+            collection_name: Name of the collection
+            ids: Point IDs
+            with_vectors: Whether to return vectors
+            with_payload: True/False, payload fields to include, or a selector
+                from payload_selector (e.g. exclude=["content"])
+
+        Returns:
+            Records for the IDs that exist
+        """
+        return self.client.retrieve(
+            collection_name=collection_name,
+            ids=ids,
+            with_payload=with_payload,
+            with_vectors=with_vectors,
+        )
+
+    def existing_ids(
+        self,
+        collection_name: str,
+        ids: List[Union[str, int]],
+        batch_size: int = 1024,
+    ) -> Set[str]:
+        """
+        Which of the given point IDs are already stored
+
+        Args:
+            collection_name: Name of the collection
+            ids: Candidate point IDs
+            batch_size: IDs per retrieve request
+
+        Returns:
+            Set of stored IDs (as strings)
+        """
+        found = set()
+        for start in range(0, len(ids), batch_size):
+            records = self.client.retrieve(
+                collection_name=collection_name,
+                ids=ids[start:start + batch_size],
+                with_payload=False,
+                with_vectors=False,
+            )
+            found.update(str(record.id) for record in records)
+        return found
+
+    def count(
+        self,
+        collection_name: str,
+        count_filter: Optional[Filter] = None,
+        shard_key_selector: Optional[str] = None,
+    ) -> int:
+        """
+        Exact number of points matching a filter
+
+        Args:
+            collection_name: Name of the collection
+            count_filter: Optional filter conditions
+            shard_key_selector: Restrict to one custom shard (see shard_key_for)
+
+        Returns:
+            Point count
+        """
+        return self.client.count(
+            collection_name=collection_name,
+            count_filter=count_filter,
+            exact=True,
+            shard_key_selector=shard_key_selector,
+        ).count
+
     def hybrid_search(
         self,
         collection_name: str,
         query_vector: List[float],
         metadata_filters: Dict[str, Any],
         limit: int = 5,
+        with_payload: PayloadSpec = True,
+        sparse_query: Optional[Dict[str, List]] = None,
+        prefetch_limit: Optional[int] = None,
+        using: Optional[str] = None,
     ) -> List[ScoredPoint]:
         """
         Perform hybrid search with semantic similarity and metadata filtering
 
+        With a sparse query, dense and sparse candidates are fused with
+        reciprocal rank fusion on the server in a single request.
+
         Args:
             collection_name: Name of the collection
             query_vector: Query embedding vector
             metadata_filters: Dictionary of metadata key-value pairs to filter
             limit: Number of results to return
+            with_payload: True/False, payload fields to include, or a selector
+                from payload_selector (e.g. exclude=["content"])
+            sparse_query: Optional sparse query vector (see sparse_vector_name)
+            prefetch_limit: Candidates per retriever (defaults to settings.hybrid_prefetch_limit)
+            using: Named vector to search (None for the unnamed vector)
 
         Returns:
             List of filtered search results
         """
-        # Build filter conditions
-        conditions = []
-        for key, value in metadata_filters.items():
-            conditions.append(
-                FieldCondition(
-                    key=key,
-                    match=MatchValue(value=value),
-                )
-            )
+        query_filter = self.build_filter(metadata_filters)
 
-        query_filter = Filter(must=conditions) if conditions else None
+        if sparse_query is not None:
+            return self.client.query_points(
+                collection_name=collection_name,
+                prefetch=self._fusion_prefetch(
+                    collection_name, query_vector, sparse_query, query_filter, prefetch_limit, using
+                ),
+                query=FusionQuery(fusion=Fusion.RRF),
+                limit=limit,
+                with_payload=with_payload,
+            ).points
 
         return self.search(
             collection_name=collection_name,
             query_vector=query_vector,
             limit=limit,
             query_filter=query_filter,
+            with_payload=with_payload,
+            using=using,
         )
 
     def get_collection_info(self, collection_name: str) -> Dict[str, Any]:
@@ -219,22 +1363,89 @@ class QdrantManager:
         Returns:
             Collection information
         """
-        info = self.client.get_collection(collection_name=collection_name)
+        physical = self.resolve_collection(collection_name) or collection_name
+        info = self.client.get_collection(collection_name=physical)
         return {
             "name": collection_name,
+            "collection": physical,
             "vectors_count": info.vectors_count,
             "points_count": info.points_count,
             "status": info.status,
         }
 
+    def delete_by_field(
+        self,
+        collection_name: str,
+        key: str,
+        values: List[Any],
+        batch_size: int = 1024,
+    ) -> None:
+        """
+        Delete every point whose payload field matches any of the values
+
+        Args:
+            collection_name: Name of the collection
+            key: Indexed payload field (e.g. parent_id)
+            values: Values to delete
+            batch_size: Values per delete request
+        """
+        for start in range(0, len(values), batch_size):
+            self.client.delete(
+                collection_name=collection_name,
+                points_selector=FilterSelector(
+                    filter=self.any_of_filter(key, values[start:start + batch_size])
+                ),
+            )
+        logger.info(f"Deleted points for {len(values)} '{key}' values from '{collection_name}'")
+
+    def delete_points(self, collection_name: str, ids: List[Union[str, int]]) -> None:
+        """
+        Delete points by ID
+
+        Args:
+            collection_name: Name of the collection
+            ids: Point IDs
+        """
+        self.client.delete(collection_name=collection_name, points_selector=ids)
+        logger.info(f"Deleted {len(ids)} points from '{collection_name}'")
+
+    def set_payload(
+        self,
+        collection_name: str,
+        payload: Dict[str, Any],
+        ids: List[Union[str, int]],
+        shard_key_selector: Optional[str] = None,
+    ) -> None:
+        """
+        Overwrite payload fields of points, keeping their vectors
+
+        Args:
+            collection_name: Name of the collection
+            payload: Fields to set
+            ids: Point IDs
+            shard_key_selector: Custom shard holding the points (see shard_key_for)
+        """
+        self.client.set_payload(
+            collection_name=collection_name,
+            payload=payload,
+            points=ids,
+            shard_key_selector=shard_key_selector,
+        )
+
     def delete_collection(self, collection_name: str) -> None:
         """
         Delete a collection
 
+        Deleting an alias drops the physical collection it serves (and with
+        it the alias).
+
         Args:
-            collection_name: Name of the collection to delete
+            collection_name: Name of the collection or alias to delete
         """
-        self.client.delete_collection(collection_name=collection_name)
+        physical = self.resolve_collection(collection_name)
+        if physical is None:
+            return
+        self.client.delete_collection(collection_name=physical)
         logger.info(f"Deleted collection '{collection_name}'")
 
     def list_collections(self) -> List[str]:
@@ -0,0 +1,334 @@
+"""
+Process-wide registry of shared models and Qdrant clients
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import threading
+import time
+
+from src.utils import settings, setup_logger
+
+logger = setup_logger(__name__, settings.log_level)
+
+_instances: Dict[Tuple, Any] = {}
+_proxies: Dict[Tuple, "LazyEmbedder"] = {}
+_load_stats: Dict[Tuple, Dict[str, float]] = {}
+_registry_lock = threading.Lock()
+_key_locks: Dict[Tuple, threading.Lock] = {}
+
+
+class LazyEmbedder:
+    """
+    Stand-in for a shared embedder that loads the model on first use
+
+    ``model_name``, ``backend`` and ``dimension`` are answered from the
+    registry key and settings without loading anything, so collections can
+    be created and batchers wired up before the model is in memory. Any
+    other attribute access loads the real embedder and delegates to it.
+    """
+
+    def __init__(self, key: Tuple, loader: Callable[[], Any], dimension: int):
+        """
+        Initialize lazy embedder
+
+        Args:
+            key: Registry key of the real embedder
+            loader: Function returning the shared real embedder
+            dimension: Embedding dimension from settings
+        """
+        self._key = key
+        self._loader = loader
+        self._instance = None
+        self.model_name = key[1]
+        self.backend = key[2] if len(key) > 2 else "torch"
+        self.dimension = dimension
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the underlying model has been loaded"""
+        return self._instance is not None
+
+    def load(self) -> Any:
+        """
+        Load (or return) the real embedder
+
+        Returns:
+            Shared embedder instance
+        """
+        if self._instance is None:
+            self._instance = self._loader()
+        return self._instance
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not set in __init__
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+
+def _current_rss_bytes() -> Optional[int]:
+    """Resident set size of this process (Linux only)"""
+    try:
+        import os
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _get_or_create(key: Tuple, factory: Callable[[], Any]) -> Any:
+    """
+    Return the shared instance for key, building it at most once
+
+    Args:
+        key: Registry key
+        factory: Zero-argument constructor
+
+    Returns:
+        Shared instance
+    """
+    instance = _instances.get(key)
+    if instance is not None:
+        return instance
+
+    with _registry_lock:
+        key_lock = _key_locks.setdefault(key, threading.Lock())
+
+    # Per-key lock so loading one model does not block lookups of another
+    with key_lock:
+        instance = _instances.get(key)
+        if instance is not None:
+            return instance
+
+        rss_before = _current_rss_bytes()
+        started = time.perf_counter()
+        instance = factory()
+        rss_after = _current_rss_bytes()
+
+        _load_stats[key] = {
+            "load_seconds": time.perf_counter() - started,
+            "rss_delta_bytes": (
+                rss_after - rss_before if rss_before is not None and rss_after is not None else None
+            ),
+        }
+        _instances[key] = instance
+        logger.info(f"Registered shared instance for {key[0]}: {key[1]}")
+        return instance
+
+
+def _shared_model(
+    key: Tuple,
+    factory: Callable[[], Any],
+    dimension: int,
+    lazy: Optional[bool],
+) -> Any:
+    """Return the shared embedder for key, or a lazy stand-in for it"""
+    lazy = settings.lazy_model_loading if lazy is None else lazy
+    instance = _instances.get(key)
+    if instance is not None or not lazy:
+        return instance or _get_or_create(key, factory)
+
+    with _registry_lock:
+        proxy = _proxies.get(key)
+        if proxy is None:
+            proxy = LazyEmbedder(key, lambda: _get_or_create(key, factory), dimension)
+            _proxies[key] = proxy
+    return proxy
+
+
+def get_qdrant_manager(url: Optional[str] = None, api_key: Optional[str] = None):
+    """
+    Get the shared QdrantManager for an endpoint
+
+    Args:
+        url: Qdrant URL (defaults to settings.qdrant_url)
+        api_key: Qdrant API key (defaults to settings.qdrant_api_key)
+
+    Returns:
+        QdrantManager instance
+    """
+    from src.core.qdrant_client import QdrantManager
+
+    url = url or settings.qdrant_url
+    api_key = api_key or settings.qdrant_api_key
+    return _get_or_create(
+        ("qdrant", url, api_key),
+        lambda: QdrantManager(url=url, api_key=api_key),
+    )
+
+
+def get_async_qdrant_manager(url: Optional[str] = None, api_key: Optional[str] = None):
+    """
+    Get the shared AsyncQdrantManager for an endpoint
+
+    The client binds to the event loop it is first used on, so share it
+    only within one loop (e.g. one API worker).
+
+    Args:
+        url: Qdrant URL (defaults to settings.qdrant_url)
+        api_key: Qdrant API key (defaults to settings.qdrant_api_key)
+
+    Returns:
+        AsyncQdrantManager instance
+    """
+    from src.core.async_qdrant_client import AsyncQdrantManager
+
+    url = url or settings.qdrant_url
+    api_key = api_key or settings.qdrant_api_key
+    return _get_or_create(
+        ("async_qdrant", url, api_key),
+        lambda: AsyncQdrantManager(url=url, api_key=api_key),
+    )
+
+
+def get_text_embedder(
+    model_name: Optional[str] = None,
+    backend: Optional[str] = None,
+    lazy: Optional[bool] = None,
+):
+    """
+    Get the shared TextEmbedder for a model
+
+    Args:
+        model_name: Model name (defaults to settings.text_embedding_model)
+        backend: Inference backend (defaults to settings.embedding_backend)
+        lazy: Defer loading until first use (defaults to settings.lazy_model_loading)
+
+    Returns:
+        TextEmbedder instance
+    """
+    from src.embeddings.text_embedder import TextEmbedder
+
+    model_name = model_name or settings.text_embedding_model
+    backend = backend or settings.embedding_backend
+    return _shared_model(
+        ("text_embedder", model_name, backend),
+        lambda: TextEmbedder(model_name, backend=backend),
+        settings.text_embedding_dim,
+        lazy,
+    )
+
+
+def get_medical_text_embedder(
+    model_name: Optional[str] = None,
+    backend: Optional[str] = None,
+    lazy: Optional[bool] = None,
+):
+    """
+    Get the shared MedicalTextEmbedder for a model
+
+    Args:
+        model_name: Model name (defaults to settings.medical_text_model)
+        backend: Inference backend (defaults to settings.embedding_backend)
+        lazy: Defer loading until first use (defaults to settings.lazy_model_loading)
+
+    Returns:
+        MedicalTextEmbedder instance
+    """
+    from src.embeddings.text_embedder import MedicalTextEmbedder
+
+    model_name = model_name or settings.medical_text_model
+    backend = backend or settings.embedding_backend
+    return _shared_model(
+        ("medical_text_embedder", model_name, backend),
+        lambda: MedicalTextEmbedder(model_name, backend=backend),
+        settings.medical_text_embedding_dim,
+        lazy,
+    )
+
+
+def get_image_embedder(model_name: Optional[str] = None, lazy: Optional[bool] = None):
+    """
+    Get the shared MedicalImageEmbedder for a model
+
+    Args:
+        model_name: Model name (defaults to settings.image_embedding_model)
+        lazy: Defer loading until first use (defaults to settings.lazy_model_loading)
+
+    Returns:
+        MedicalImageEmbedder instance
+    """
+    from src.embeddings.image_embedder import MedicalImageEmbedder
+
+    model_name = model_name or settings.image_embedding_model
+    return _shared_model(
+        ("image_embedder", model_name),
+        lambda: MedicalImageEmbedder(model_name),
+        settings.image_embedding_dim,
+        lazy,
+    )
+
+
+def warmup_models(embedders: List[Any], background: bool = True) -> Optional[threading.Thread]:
+    """
+    Load lazily-registered embedders ahead of their first request
+
+    Args:
+        embedders: Embedders or lazy stand-ins to load
+        background: Load on a daemon thread instead of blocking
+
+    Returns:
+        The warmup thread when running in the background
+    """
+    def run():
+        for embedder in embedders:
+            if isinstance(embedder, LazyEmbedder) and not embedder.loaded:
+                try:
+                    embedder.load()
+                except Exception as e:
+                    logger.error(f"Warmup of {embedder.model_name} failed: {e}")
+        logger.info("Model warmup complete")
+
+    if not background:
+        run()
+        return None
+
+    thread = threading.Thread(target=run, name="model-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def _parameter_bytes(model: Any) -> Optional[int]:
+    """Bytes held by a torch module's parameters and buffers"""
+    if not hasattr(model, "parameters"):
+        return None
+    total = sum(p.numel() * p.element_size() for p in model.parameters())
+    total += sum(b.numel() * b.element_size() for b in model.buffers())
+    return total
+
+
+def model_memory_report() -> List[Dict[str, Any]]:
+    """
+    Report memory used by each loaded model
+
+    Returns:
+        One entry per registered embedder with parameter bytes, the process
+        RSS growth observed while loading it, and load time
+    """
+    report = []
+    for key, instance in list(_instances.items()):
+        if key[0] in ("qdrant", "async_qdrant"):
+            continue
+        stats = _load_stats.get(key, {})
+        onnx_encoder = getattr(instance, "onnx_encoder", None)
+        report.append({
+            "kind": key[0],
+            "model_name": key[1],
+            "backend": getattr(instance, "backend", "torch"),
+            "parameter_bytes": (
+                onnx_encoder.model_bytes if onnx_encoder is not None
+                else _parameter_bytes(getattr(instance, "model", None))
+            ),
+            "rss_delta_bytes": stats.get("rss_delta_bytes"),
+            "load_seconds": stats.get("load_seconds"),
+        })
+    return report
+
+
+def clear_registry() -> None:
+    """Drop all shared instances (mainly for tests and reloads)"""
+    with _registry_lock:
+        _instances.clear()
+        _proxies.clear()
+        _load_stats.clear()
+        _key_locks.clear()
+    logger.info("Cleared shared model and client registry")
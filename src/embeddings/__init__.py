@@ -1,5 +1,29 @@
-"""Embedding generation modules"""
-from .text_embedder import TextEmbedder, MedicalTextEmbedder
-from .image_embedder import MedicalImageEmbedder
+"""Embedding generation modules
 
-__all__ = ["TextEmbedder", "MedicalTextEmbedder", "MedicalImageEmbedder"]
+Exports are resolved lazily so that importing this package (or anything that
+depends on it) does not pull in torch, transformers or torchvision until an
+embedder is actually used.
+"""
+from importlib import import_module
+
+_EXPORTS = {
+    "TextEmbedder": ".text_embedder",
+    "MedicalTextEmbedder": ".text_embedder",
+    "MedicalImageEmbedder": ".image_embedder",
+    "EmbeddingCache": ".cache",
+    "EmbeddingBatcher": ".batcher",
+    "BM25Encoder": ".sparse",
+    "bulk_embed": ".bulk",
+    "iter_bulk_embeddings": ".bulk",
+    "iter_study_slices": ".volume_loader",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
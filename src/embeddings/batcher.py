@@ -0,0 +1,173 @@
+"""
+Dynamic micro-batching of embedding requests across concurrent callers
+"""
+from typing import Any, Dict, List, Optional, Tuple, Union
+from concurrent.futures import Future
+import queue
+import threading
+import time
+import numpy as np
+
+from src.utils import settings, setup_logger
+
+logger = setup_logger(__name__, settings.log_level)
+
+_STOP = object()
+
+
+class EmbeddingBatcher:
+    """
+    Coalesce concurrent embed calls into batched model calls
+
+    Callers enqueue texts and block on a future. A single worker thread
+    flushes the queue as one batch when it reaches ``max_batch_size`` or
+    when the oldest queued text has waited ``max_wait_ms``.
+    """
+
+    def __init__(
+        self,
+        embedder: Any,
+        max_batch_size: Optional[int] = None,
+        max_wait_ms: Optional[float] = None,
+        method: str = "embed",
+    ):
+        """
+        Initialize embedding batcher
+
+        Args:
+            embedder: Embedder exposing embed(List[str]) and dimension
+            max_batch_size: Flush once this many texts are queued
+            max_wait_ms: Flush once the oldest text has waited this long
+            method: Embedder method called with each batch (e.g. "embed_bytes"
+                to batch encoded images)
+        """
+        self.embedder = embedder
+        self.method = method
+        self.dimension = embedder.dimension
+        self.max_batch_size = max_batch_size or settings.micro_batch_max_size
+        self.max_wait = (
+            settings.micro_batch_max_wait_ms if max_wait_ms is None else max_wait_ms
+        ) / 1000.0
+
+        self._queue: "queue.Queue[Union[Tuple[str, Future], object]]" = queue.Queue()
+        self._stats_lock = threading.Lock()
+        self.batches = 0
+        self.texts = 0
+        self.largest_batch = 0
+
+        self._worker = threading.Thread(
+            target=self._run,
+            name=f"embedding-batcher-{getattr(embedder, 'model_name', 'model')}",
+            daemon=True,
+        )
+        self._worker.start()
+        logger.info(
+            f"Embedding batcher started (max batch {self.max_batch_size}, "
+            f"max wait {self.max_wait * 1000:.1f} ms)"
+        )
+
+    def submit(self, text: str) -> Future:
+        """
+        Queue a single text for embedding
+
+        Args:
+            text: Input text
+
+        Returns:
+            Future resolving to this text's embedding vector
+        """
+        future: Future = Future()
+        self._queue.put((text, future))
+        return future
+
+    def embed(self, texts: Union[str, List[str]]) -> np.ndarray:
+        """
+        Generate embeddings through the shared batch queue
+
+        Args:
+            texts: Single text or list of texts
+
+        Returns:
+            Embedding array of shape (n_texts, dimension)
+        """
+        if isinstance(texts, str):
+            texts = [texts]
+
+        futures = [self.submit(text) for text in texts]
+        if not futures:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+        return np.stack([future.result() for future in futures])
+
+    def _collect(self, first: Tuple[str, Future]) -> Tuple[List[Tuple[str, Future]], bool]:
+        """Gather queued items until the batch is full or the deadline passes"""
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        """Worker loop"""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+
+            batch, stopping = self._collect(item)
+            texts = [text for text, _ in batch]
+            try:
+                vectors = getattr(self.embedder, self.method)(texts)
+            except Exception as e:
+                logger.error(f"Batched embedding of {len(texts)} texts failed: {e}")
+                if len(batch) == 1:
+                    batch[0][1].set_exception(e)
+                else:
+                    # Retry one by one so a bad input only fails its own caller
+                    for text, future in batch:
+                        try:
+                            future.set_result(getattr(self.embedder, self.method)([text])[0])
+                        except Exception as item_error:
+                            future.set_exception(item_error)
+            else:
+                for (_, future), vector in zip(batch, vectors):
+                    future.set_result(vector)
+
+            with self._stats_lock:
+                self.batches += 1
+                self.texts += len(batch)
+                self.largest_batch = max(self.largest_batch, len(batch))
+
+            if stopping:
+                return
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get queue and batching metrics
+
+        Returns:
+            Current queue depth, batch count and batch-size statistics
+        """
+        with self._stats_lock:
+            return {
+                "queue_depth": self._queue.qsize(),
+                "batches": self.batches,
+                "texts": self.texts,
+                "mean_batch_size": self.texts / self.batches if self.batches else 0.0,
+                "largest_batch": self.largest_batch,
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": self.max_wait * 1000,
+            }
+
+    def close(self) -> None:
+        """Stop the worker after draining queued requests"""
+        self._queue.put(_STOP)
+        self._worker.join()
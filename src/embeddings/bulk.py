@@ -0,0 +1,142 @@
+"""
+Multi-process bulk embedding for large offline ingests
+"""
+from typing import Any, Iterator, List, Optional
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+import numpy as np
+
+from src.utils import settings, setup_logger
+
+logger = setup_logger(__name__, settings.log_level)
+
+# Per-worker embedder, built once by the pool initializer
+_worker_embedder = None
+
+
+def _init_worker(
+    kind: str,
+    model_name: Optional[str],
+    backend: Optional[str],
+    threads: int,
+) -> None:
+    """Pin thread counts and load the embedder inside a worker process"""
+    global _worker_embedder
+
+    # Parallelism comes from the pool, so pin each worker's own threads
+    os.environ["TOKENIZERS_PARALLELISM"] = "false"
+    import torch
+    torch.set_num_threads(threads)
+    settings.onnx_num_threads = threads
+
+    from src.embeddings.text_embedder import TextEmbedder, MedicalTextEmbedder
+
+    embedder_cls = MedicalTextEmbedder if kind == "medical" else TextEmbedder
+    # Workers skip the cache; the parent process owns it
+    _worker_embedder = embedder_cls(model_name, use_cache=False, backend=backend)
+
+
+def _embed_shard(texts: List[str]) -> np.ndarray:
+    """Embed one shard in a worker process"""
+    return _worker_embedder.embed(texts)
+
+
+def iter_bulk_embeddings(
+    texts: List[str],
+    kind: str = "medical",
+    model_name: Optional[str] = None,
+    backend: Optional[str] = None,
+    num_workers: Optional[int] = None,
+    threads_per_worker: Optional[int] = None,
+    shard_size: Optional[int] = None,
+) -> Iterator[np.ndarray]:
+    """
+    Embed a corpus across a pool of worker processes
+
+    Shards are dispatched with a bounded window and yielded strictly in
+    input order, so callers can stream them into Qdrant while later shards
+    are still being computed.
+
+    Args:
+        texts: Corpus to embed
+        kind: "medical" for MedicalTextEmbedder or "text" for TextEmbedder
+        model_name: Model override
+        backend: Inference backend override
+        num_workers: Worker processes (defaults to settings.bulk_embed_workers or CPU count)
+        threads_per_worker: Torch/ONNX threads per worker
+        shard_size: Texts per shard
+
+    Yields:
+        Embedding arrays of shape (shard_len, dimension)
+    """
+    num_workers = num_workers or settings.bulk_embed_workers or os.cpu_count() or 1
+    threads_per_worker = threads_per_worker or settings.bulk_embed_threads_per_worker
+    shard_size = shard_size or settings.bulk_embed_shard_size
+
+    shards = [texts[i:i + shard_size] for i in range(0, len(texts), shard_size)]
+    if not shards:
+        return
+
+    num_workers = min(num_workers, len(shards))
+    logger.info(
+        f"Bulk embedding {len(texts)} texts in {len(shards)} shards "
+        f"on {num_workers} workers x {threads_per_worker} threads"
+    )
+
+    # spawn avoids inheriting torch/OpenMP state from the parent
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=num_workers,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(kind, model_name, backend, threads_per_worker),
+    ) as executor:
+        pending = deque()
+        next_shard = 0
+        window = num_workers * 2
+
+        while next_shard < len(shards) or pending:
+            while next_shard < len(shards) and len(pending) < window:
+                pending.append(executor.submit(_embed_shard, shards[next_shard]))
+                next_shard += 1
+            yield pending.popleft().result()
+
+
+def bulk_embed(
+    texts: List[str],
+    embedder: Any,
+    kind: str = "medical",
+    num_workers: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Embed a corpus, using the process pool only when it pays off
+
+    Cached vectors are served from the embedder's cache and only misses
+    are sent to the workers. Small corpora are embedded in-process.
+
+    Args:
+        texts: Corpus to embed
+        embedder: Loaded embedder whose model and cache to use
+        kind: "medical" or "text"
+        num_workers: Worker processes (1 forces in-process embedding)
+
+    Returns:
+        Embedding array of shape (n_texts, dimension)
+    """
+    def compute(batch: List[str]) -> np.ndarray:
+        workers = num_workers or settings.bulk_embed_workers or os.cpu_count() or 1
+        if workers <= 1 or len(batch) < settings.bulk_embed_min_texts:
+            return embedder._encode(batch)
+        return np.concatenate(list(iter_bulk_embeddings(
+            batch,
+            kind=kind,
+            model_name=embedder.model_name,
+            backend=embedder.backend,
+            num_workers=workers,
+        )))
+
+    if embedder.cache is not None:
+        return embedder.cache.get_or_compute(texts, compute)
+    return compute(texts)
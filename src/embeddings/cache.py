@@ -0,0 +1,343 @@
+"""
+Content-addressed embedding cache with in-memory and on-disk tiers
+"""
+from typing import Callable, Dict, List, Optional
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+import hashlib
+import json
+import threading
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: the disk tier is only safe for one process
+    fcntl = None
+
+from src.utils import settings, setup_logger
+
+logger = setup_logger(__name__, settings.log_level)
+
+
+class EmbeddingCache:
+    """
+    Two-tier embedding cache keyed by model name and content hash
+
+    The memory tier is an LRU over the most recently used vectors. The disk
+    tier is a fixed-size memory-mapped float32 matrix under
+    ``settings.models_dir``; once it is full, the oldest slot is recycled.
+
+    The disk tier is shared by every process using the same directory (API
+    workers and the seed script). Each slot stores the key of its vector next
+    to it, so lookups verify the slot still holds the requested text, and
+    slots are claimed through a shared write counter under a file lock.
+    Nothing is rewritten per insert: a process builds its index from the
+    stored keys when it opens the cache, and on a miss picks up the slots
+    other processes have written since.
+    """
+
+    KEY_BYTES = hashlib.sha256().digest_size
+
+    def __init__(
+        self,
+        model_name: str,
+        dimension: int,
+        cache_dir: Optional[Path] = None,
+        memory_entries: Optional[int] = None,
+        disk_mb: Optional[int] = None,
+    ):
+        """
+        Initialize embedding cache
+
+        Args:
+            model_name: Model the cached vectors belong to
+            dimension: Embedding dimension
+            cache_dir: Root directory for the disk tier
+            memory_entries: Maximum vectors kept in the memory tier
+            disk_mb: Maximum size of the disk tier in megabytes (0 disables it)
+        """
+        self.model_name = model_name
+        self.dimension = dimension
+        self.memory_entries = (
+            settings.embedding_cache_memory_entries if memory_entries is None else memory_entries
+        )
+        disk_mb = settings.embedding_cache_disk_mb if disk_mb is None else disk_mb
+
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        # Disk tier
+        self.disk_capacity = int(disk_mb * 1024 * 1024) // (dimension * 4)
+        self._disk_index: Dict[str, int] = {}
+        self._vectors: Optional[np.memmap] = None
+        self._keys: Optional[np.memmap] = None
+        self._cursor: Optional[np.memmap] = None
+        self._seen_writes = 0
+        if self.disk_capacity > 0:
+            root = Path(cache_dir or settings.models_dir / "embedding_cache")
+            self.cache_dir = root / self._slug(model_name)
+            self._open_disk_tier()
+
+    @staticmethod
+    def _slug(model_name: str) -> str:
+        """Filesystem-safe directory name for a model"""
+        return model_name.replace("/", "__").replace(":", "_")
+
+    @contextmanager
+    def _file_lock(self):
+        """Exclusive lock on the disk tier across processes"""
+        with open(self.cache_dir / "cache.lock", "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _open_disk_tier(self) -> None:
+        """Open or create the memory-mapped vectors, slot keys and cursor"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        layout_path = self.cache_dir / "layout.json"
+        layout = {
+            "model_name": self.model_name,
+            "dimension": self.dimension,
+            "capacity": self.disk_capacity,
+        }
+        files = {
+            "vectors": (self.cache_dir / "vectors.f32", np.float32, (self.disk_capacity, self.dimension)),
+            "keys": (self.cache_dir / "keys.u8", np.uint8, (self.disk_capacity, self.KEY_BYTES)),
+            "cursor": (self.cache_dir / "cursor.i64", np.int64, (1,)),
+        }
+
+        with self._file_lock():
+            try:
+                current = json.loads(layout_path.read_text())
+            except (OSError, ValueError):
+                current = None
+            fresh = current != layout or not all(path.exists() for path, _, _ in files.values())
+            if fresh:
+                if current is not None:
+                    logger.info(f"Embedding cache layout changed for {self.model_name}, resetting")
+                for path, dtype, shape in files.values():
+                    np.memmap(path, dtype=dtype, mode="w+", shape=shape).flush()
+                layout_path.write_text(json.dumps(layout))
+                # Index of the earlier single-process layout
+                (self.cache_dir / "index.json").unlink(missing_ok=True)
+
+            self._vectors, self._keys, self._cursor = (
+                np.memmap(path, dtype=dtype, mode="r+", shape=shape)
+                for path, dtype, shape in files.values()
+            )
+            self._index_slots(range(self.disk_capacity))
+            self._seen_writes = int(self._cursor[0])
+
+        logger.info(
+            f"Embedding cache for {self.model_name}: {len(self._disk_index)} "
+            f"vectors on disk (capacity {self.disk_capacity})"
+        )
+
+    def _index_slots(self, slots) -> None:
+        """Add the keys currently stored in slots to the local index"""
+        for slot in slots:
+            stored = self._keys[slot]
+            if stored.any():
+                self._disk_index[stored.tobytes().hex()] = int(slot)
+
+    def _catch_up(self) -> None:
+        """Index slots other processes wrote since this one last looked (file lock held)"""
+        writes = int(self._cursor[0])
+        if writes == self._seen_writes:
+            return
+        if writes - self._seen_writes >= self.disk_capacity:
+            slots = range(self.disk_capacity)
+        else:
+            slots = (i % self.disk_capacity for i in range(self._seen_writes, writes))
+        self._index_slots(slots)
+        self._seen_writes = writes
+
+    def _refresh_index(self) -> None:
+        """Pick up other processes' writes before counting a miss"""
+        # Unlocked peek: nothing was written since the last look
+        if int(self._cursor[0]) == self._seen_writes:
+            return
+        with self._file_lock():
+            self._catch_up()
+
+    def _read_slot(self, key: str, slot: int) -> Optional[np.ndarray]:
+        """Copy a slot's vector if it still holds key (another process may recycle it)"""
+        expected = np.frombuffer(bytes.fromhex(key), dtype=np.uint8)
+        if not np.array_equal(self._keys[slot], expected):
+            return None
+        vector = np.array(self._vectors[slot])
+        # Writers clear the key before overwriting the vector
+        if not np.array_equal(self._keys[slot], expected):
+            return None
+        return vector
+
+    def key(self, text: str) -> str:
+        """
+        Content hash for a text under this cache's model
+
+        Args:
+            text: Input text
+
+        Returns:
+            Hex digest identifying (model, text)
+        """
+        digest = hashlib.sha256()
+        digest.update(self.model_name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        """Insert into the memory tier, evicting the least recently used entry"""
+        if self.memory_entries <= 0:
+            return
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        """
+        Look up a cached embedding
+
+        Args:
+            text: Input text
+
+        Returns:
+            Cached vector or None
+        """
+        key = self.key(text)
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return vector
+
+            if key not in self._disk_index and self._vectors is not None:
+                self._refresh_index()
+            slot = self._disk_index.get(key)
+            if slot is not None:
+                vector = self._read_slot(key, slot)
+                if vector is not None:
+                    self._remember(key, vector)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return vector
+                self._disk_index.pop(key, None)
+
+            self.misses += 1
+            return None
+
+    def put_many(self, texts: List[str], vectors: np.ndarray) -> None:
+        """
+        Store embeddings in both tiers
+
+        Args:
+            texts: Input texts
+            vectors: Embeddings aligned with texts
+        """
+        with self._lock:
+            new = {}
+            for text, vector in zip(texts, vectors):
+                key = self.key(text)
+                vector = np.asarray(vector, dtype=np.float32)
+                self._remember(key, vector)
+                if self._vectors is not None and key not in self._disk_index:
+                    new[key] = vector
+
+            if new:
+                with self._file_lock():
+                    self._catch_up()
+                    for key, vector in new.items():
+                        if key in self._disk_index:
+                            continue
+                        # Recycle the oldest slot once the file is full. The
+                        # counter only grows, so other processes can tell
+                        # which slots changed since they last looked.
+                        slot = self._seen_writes % self.disk_capacity
+                        self._seen_writes += 1
+                        self._cursor[0] = self._seen_writes
+                        evicted = self._keys[slot]
+                        if evicted.any():
+                            self._disk_index.pop(evicted.tobytes().hex(), None)
+                        self._keys[slot] = 0
+                        self._vectors[slot] = vector
+                        self._keys[slot] = np.frombuffer(bytes.fromhex(key), dtype=np.uint8)
+                        self._disk_index[key] = slot
+
+    def get_or_compute(
+        self,
+        texts: List[str],
+        compute: Callable[[List[str]], np.ndarray],
+    ) -> np.ndarray:
+        """
+        Return embeddings for texts, computing only the cache misses
+
+        Args:
+            texts: Input texts
+            compute: Function embedding a list of texts
+
+        Returns:
+            Embedding array of shape (n_texts, dimension)
+        """
+        embeddings = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        missing: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            if text in missing:
+                missing[text].append(i)
+                continue
+            vector = self.get(text)
+            if vector is None:
+                missing[text] = [i]
+            else:
+                embeddings[i] = vector
+
+        if missing:
+            miss_texts = list(missing)
+            computed = np.asarray(compute(miss_texts), dtype=np.float32)
+            self.put_many(miss_texts, computed)
+            for text, vector in zip(miss_texts, computed):
+                embeddings[missing[text]] = vector
+
+        return embeddings
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get cache counters
+
+        Returns:
+            Hit/miss counts, hit rate and tier sizes
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "model_name": self.model_name,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "disk_entries": len(self._disk_index),
+                "disk_capacity": self.disk_capacity,
+            }
+
+    def clear(self) -> None:
+        """Drop all cached vectors from both tiers"""
+        with self._lock:
+            self._memory.clear()
+            self._disk_index.clear()
+            if self._vectors is not None:
+                with self._file_lock():
+                    # The write counter keeps growing; zeroed keys fail
+                    # verification in other processes
+                    self._keys[:] = 0
+        logger.info(f"Cleared embedding cache for {self.model_name}")
@@ -1,28 +1,49 @@
 """
 Image embedding generation for medical images
 """
-from typing import Union, List
+from typing import Any, Dict, Union, List, Iterable, Iterator, Optional, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
+import hashlib
+import io
 import numpy as np
 from PIL import Image
 import torch
 from torchvision import transforms, models
 from transformers import AutoImageProcessor, ResNetModel
 
+from src.embeddings.cache import EmbeddingCache
+from src.embeddings.volume_loader import iter_study_slices
 from src.utils import settings, setup_logger
 
 logger = setup_logger(__name__, settings.log_level)
 
+# PIL resample codes used by Hugging Face image processors
+_INTERPOLATION = {
+    0: transforms.InterpolationMode.NEAREST,
+    1: transforms.InterpolationMode.LANCZOS,
+    2: transforms.InterpolationMode.BILINEAR,
+    3: transforms.InterpolationMode.BICUBIC,
+    4: transforms.InterpolationMode.BOX,
+    5: transforms.InterpolationMode.HAMMING,
+}
+
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff"}
+
 
 class MedicalImageEmbedder:
     """Generate embeddings for medical images using ResNet"""
 
-    def __init__(self, model_name: str = None):
+    def __init__(self, model_name: str = None, use_cache: Optional[bool] = None):
         """
         Initialize medical image embedder
 
         Args:
             model_name: Model name for image embedding
+            use_cache: Cache embeddings of encoded images passed to embed_bytes
+                (defaults to settings.embedding_cache_enabled)
         """
         self.model_name = model_name or settings.image_embedding_model
         logger.info(f"Loading image embedding model: {self.model_name}")
@@ -38,16 +59,34 @@ class MedicalImageEmbedder:
         self.model.to(self.device)
         logger.info(f"Image embedder initialized on {self.device}")
 
-        # Image preprocessing
+        # Image preprocessing equivalent to the processor (resize, center
+        # crop, normalise), run per image on the decode thread pool
+        crop_size = 224
+        crop_pct = getattr(self.processor, "crop_pct", None) or 0.875
+        # Same resampling filter as the processor (bicubic for ResNet-50)
+        resample = getattr(self.processor, "resample", None)
+        interpolation = _INTERPOLATION.get(
+            int(resample) if resample is not None else 3,
+            transforms.InterpolationMode.BICUBIC,
+        )
         self.transform = transforms.Compose([
-            transforms.Resize((224, 224)),
+            transforms.Resize(int(crop_size / crop_pct), interpolation=interpolation),
+            transforms.CenterCrop(crop_size),
             transforms.ToTensor(),
             transforms.Normalize(
-                mean=[0.485, 0.456, 0.406],
-                std=[0.229, 0.224, 0.225]
+                mean=getattr(self.processor, "image_mean", None) or [0.485, 0.456, 0.406],
+                std=getattr(self.processor, "image_std", None) or [0.229, 0.224, 0.225],
             )
         ])
 
+        # Cached vectors are keyed by preprocessing too, so vectors from an
+        # earlier resize filter are not served
+        use_cache = settings.embedding_cache_enabled if use_cache is None else use_cache
+        self.cache = (
+            EmbeddingCache(f"{self.model_name}@{interpolation.value}", self.dimension)
+            if use_cache else None
+        )
+
     def load_image(self, image_path: Union[str, Path]) -> Image.Image:
         """
         Load and preprocess image
@@ -65,12 +104,92 @@ class MedicalImageEmbedder:
         image = Image.open(image_path).convert("RGB")
         return image
 
-    def embed(self, images: Union[str, Path, Image.Image, List]) -> np.ndarray:
+    @staticmethod
+    def validate_bytes(data: bytes) -> None:
+        """
+        Check that an encoded image can be decoded, without decoding pixels
+
+        Args:
+            data: Encoded image file (PNG, JPEG, ...)
+
+        Raises:
+            ValueError: If the data is not a readable image
+        """
+        try:
+            with Image.open(io.BytesIO(data)) as image:
+                image.verify()
+        except (OSError, SyntaxError, Image.DecompressionBombError) as e:
+            raise ValueError(f"Could not decode image: {e}") from e
+
+    def _prepare(self, image: Union[str, Path, bytes, Image.Image]) -> torch.Tensor:
+        """Decode and transform one image into a (3, 224, 224) tensor"""
+        if isinstance(image, (str, Path)):
+            image = self.load_image(image)
+        elif isinstance(image, bytes):
+            try:
+                image = Image.open(io.BytesIO(image)).convert("RGB")
+            except OSError as e:
+                raise ValueError(f"Could not decode image: {e}") from e
+        elif image.mode != "RGB":
+            image = image.convert("RGB")
+        return self.transform(image)
+
+    def _forward(self, tensors: List[torch.Tensor]) -> np.ndarray:
+        """Run one stacked batch through the model"""
+        with torch.no_grad():
+            batch = torch.stack(tensors).to(self.device)
+            outputs = self.model(pixel_values=batch)
+            # Pooled output is (batch, 2048, 1, 1)
+            return outputs.pooler_output.flatten(1).cpu().numpy()
+
+    def iter_embed(
+        self,
+        images: Iterable[Union[str, Path, bytes, Image.Image]],
+        batch_size: Optional[int] = None,
+        num_workers: Optional[int] = None,
+    ) -> Iterator[np.ndarray]:
+        """
+        Stream embeddings for an arbitrarily long sequence of images
+
+        Images are decoded and resized on a thread pool while the previous
+        batch runs through the model.
+
+        Args:
+            images: Iterable of image paths, encoded image bytes or PIL Images
+            batch_size: Images per forward pass (defaults to settings.image_batch_size)
+            num_workers: Decode threads (defaults to settings.image_decode_workers)
+
+        Yields:
+            Embedding arrays of shape (batch_len, dimension), in input order
+        """
+        batch_size = batch_size or settings.image_batch_size
+        num_workers = num_workers or settings.image_decode_workers
+        images = iter(images)
+
+        with ThreadPoolExecutor(max_workers=num_workers) as pool:
+            def decode_next():
+                chunk = list(islice(images, batch_size))
+                return [pool.submit(self._prepare, image) for image in chunk]
+
+            pending = decode_next()
+            while pending:
+                upcoming = decode_next()
+                tensors = [future.result() for future in pending]
+                logger.debug(f"Generating embeddings for batch of {len(tensors)} images")
+                yield self._forward(tensors)
+                pending = upcoming
+
+    def embed(
+        self,
+        images: Union[str, Path, Image.Image, List],
+        batch_size: Optional[int] = None,
+    ) -> np.ndarray:
         """
         Generate embeddings for image(s)
 
         Args:
             images: Single image path/PIL Image or list of them
+            batch_size: Images per forward pass (defaults to settings.image_batch_size)
 
         Returns:
             Embedding array of shape (n_images, dimension)
@@ -81,25 +200,105 @@ class MedicalImageEmbedder:
 
         logger.debug(f"Generating embeddings for {len(images)} images")
 
-        embeddings = []
-        with torch.no_grad():
-            for img in images:
-                # Load image if path
-                if isinstance(img, (str, Path)):
-                    img = self.load_image(img)
+        batches = list(self.iter_embed(images, batch_size=batch_size))
+        if not batches:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+        return np.concatenate(batches)
 
-                # Process image
-                inputs = self.processor(images=img, return_tensors="pt")
-                inputs = {k: v.to(self.device) for k, v in inputs.items()}
+    def embed_bytes(
+        self,
+        images: List[bytes],
+        batch_size: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        Generate embeddings for encoded image files (e.g. uploads)
+
+        Images already seen are served from the embedding cache, keyed by a
+        hash of their bytes, so repeated queries skip decoding and the model.
+
+        Args:
+            images: Encoded image files (PNG, JPEG, ...)
+            batch_size: Images per forward pass (defaults to settings.image_batch_size)
+
+        Returns:
+            Embedding array of shape (n_images, dimension)
+        """
+        if self.cache is None:
+            return self.embed(list(images), batch_size=batch_size)
+
+        digests = [hashlib.sha256(data).hexdigest() for data in images]
+        by_digest = dict(zip(digests, images))
+        return self.cache.get_or_compute(
+            digests,
+            lambda misses: self.embed([by_digest[digest] for digest in misses], batch_size=batch_size),
+        )
+
+    def embed_directory(
+        self,
+        directory: Union[str, Path],
+        batch_size: Optional[int] = None,
+        recursive: bool = True,
+    ) -> Iterator[Tuple[List[Path], np.ndarray]]:
+        """
+        Stream embeddings for every image file under a directory
+
+        Args:
+            directory: Root directory
+            batch_size: Images per forward pass
+            recursive: Descend into subdirectories
+
+        Yields:
+            (paths, embeddings) pairs, one per batch
+        """
+        directory = Path(directory)
+        pattern = "**/*" if recursive else "*"
+        paths = (
+            path for path in sorted(directory.glob(pattern))
+            if path.suffix.lower() in IMAGE_EXTENSIONS
+        )
+
+        return self._embed_tagged(((path, path) for path in paths), batch_size)
+
+    def embed_study(
+        self,
+        study_path: Union[str, Path],
+        batch_size: Optional[int] = None,
+        **slice_options: Any,
+    ) -> Iterator[Tuple[List[Dict[str, Any]], np.ndarray]]:
+        """
+        Stream embeddings for a DICOM series or NIfTI volume
+
+        Slices are read lazily, windowed and selected (or projected)
+        according to slice_options, so memory stays bounded regardless of
+        study size.
+
+        Args:
+            study_path: DICOM series directory or NIfTI file
+            batch_size: Images per forward pass
+            **slice_options: strategy, stride, slab, window (and axis for NIfTI)
+
+        Yields:
+            (slice metadata, embeddings) pairs, one per batch
+        """
+        slices = iter_study_slices(Path(study_path), **slice_options)
+        return self._embed_tagged(((metadata, image) for image, metadata in slices), batch_size)
 
-                # Get embeddings
-                outputs = self.model(**inputs)
+    def _embed_tagged(
+        self,
+        tagged_images: Iterator[Tuple[Any, Any]],
+        batch_size: Optional[int] = None,
+    ) -> Iterator[Tuple[List[Any], np.ndarray]]:
+        """Embed (tag, image) pairs, yielding each batch with its tags"""
+        # The decode pool reads one batch ahead, so track consumed tags
+        consumed = deque()
 
-                # Use pooled output
-                embedding = outputs.pooler_output.cpu().numpy()
-                embeddings.append(embedding[0])
+        def images():
+            for tag, image in tagged_images:
+                consumed.append(tag)
+                yield image
 
-        return np.array(embeddings)
+        for vectors in self.iter_embed(images(), batch_size=batch_size):
+            yield [consumed.popleft() for _ in range(len(vectors))], vectors
 
     def embed_from_array(self, image_array: np.ndarray) -> np.ndarray:
         """
@@ -0,0 +1,220 @@
+"""
+ONNX Runtime inference backend with dynamic int8 quantization
+"""
+from typing import Any, Dict, List, Optional
+from pathlib import Path
+import time
+import numpy as np
+
+from src.utils import settings, setup_logger
+
+logger = setup_logger(__name__, settings.log_level)
+
+PARITY_TEXTS = [
+    "Chest pain radiating to the left arm with diaphoresis and dyspnea.",
+    "CAP treatment based on CURB-65 score with azithromycin or doxycycline.",
+    "RIPE therapy: rifampin, isoniazid, pyrazinamide and ethambutol for two months.",
+    "CHA2DS2-VASc score guides anticoagulation in atrial fibrillation.",
+    "Type 2 diabetes first-line therapy is metformin plus lifestyle changes.",
+    "Patient reports mild worsening of asthma symptoms at night.",
+    "MRI shows multiple periventricular white matter lesions.",
+    "Hypothyroidism: fatigue, weight gain, cold intolerance, elevated TSH.",
+]
+
+
+def _require_onnxruntime():
+    """Import onnxruntime or raise a helpful error"""
+    try:
+        import onnxruntime
+    except ImportError as e:
+        raise ImportError(
+            "The ONNX embedding backend requires onnxruntime and onnx. "
+            "Install them with: pip install onnxruntime onnx"
+        ) from e
+    return onnxruntime
+
+
+def onnx_model_path(model_name: str, quantize: bool = True) -> Path:
+    """
+    Location of the exported ONNX graph for a model
+
+    Args:
+        model_name: Hugging Face model name
+        quantize: Whether the int8 graph is wanted
+
+    Returns:
+        Path under settings.models_dir
+    """
+    slug = model_name.replace("/", "__").replace(":", "_")
+    filename = "model.int8.onnx" if quantize else "model.onnx"
+    return settings.models_dir / "onnx" / slug / filename
+
+
+def export_onnx(model_name: str, quantize: bool = True) -> Path:
+    """
+    Export a transformer encoder to ONNX, optionally quantized to int8
+
+    Args:
+        model_name: Hugging Face model name
+        quantize: Apply dynamic int8 weight quantization
+
+    Returns:
+        Path to the exported graph
+    """
+    import torch
+    from transformers import AutoTokenizer, AutoModel
+
+    fp32_path = onnx_model_path(model_name, quantize=False)
+    fp32_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if not fp32_path.exists():
+        logger.info(f"Exporting {model_name} to ONNX at {fp32_path}")
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        model = AutoModel.from_pretrained(model_name)
+        model.eval()
+
+        dummy = dict(tokenizer(["example medical text"], return_tensors="pt"))
+        input_names = list(dummy.keys())
+        dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+        dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+        with torch.no_grad():
+            torch.onnx.export(
+                model,
+                (dummy,),
+                str(fp32_path),
+                input_names=input_names,
+                output_names=["last_hidden_state"],
+                dynamic_axes=dynamic_axes,
+                opset_version=14,
+            )
+
+    if not quantize:
+        return fp32_path
+
+    int8_path = onnx_model_path(model_name, quantize=True)
+    if not int8_path.exists():
+        _require_onnxruntime()
+        from onnxruntime.quantization import quantize_dynamic, QuantType
+
+        logger.info(f"Quantizing {model_name} to int8 at {int8_path}")
+        quantize_dynamic(str(fp32_path), str(int8_path), weight_type=QuantType.QInt8)
+
+    return int8_path
+
+
+class OnnxEncoder:
+    """Run a transformer encoder exported to ONNX on CPU"""
+
+    def __init__(self, model_name: str, quantize: Optional[bool] = None):
+        """
+        Initialize ONNX encoder, exporting the model on first use
+
+        Args:
+            model_name: Hugging Face model name
+            quantize: Use the int8 graph (defaults to settings.onnx_quantize)
+        """
+        ort = _require_onnxruntime()
+        self.model_name = model_name
+        self.quantize = settings.onnx_quantize if quantize is None else quantize
+
+        path = onnx_model_path(model_name, self.quantize)
+        if not path.exists():
+            path = export_onnx(model_name, self.quantize)
+        self.path = path
+        self.model_bytes = path.stat().st_size
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if settings.onnx_num_threads > 0:
+            options.intra_op_num_threads = settings.onnx_num_threads
+        self.session = ort.InferenceSession(
+            str(path),
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        self.input_names = [inp.name for inp in self.session.get_inputs()]
+        logger.info(f"ONNX encoder loaded from {path} ({self.model_bytes / 1e6:.1f} MB)")
+
+    @property
+    def variant(self) -> str:
+        """Short label used to keep caches of different backends apart"""
+        return "onnx-int8" if self.quantize else "onnx-fp32"
+
+    def __call__(self, inputs: Dict[str, Any]) -> np.ndarray:
+        """
+        Run the encoder
+
+        Args:
+            inputs: Tokenizer output with numpy arrays
+
+        Returns:
+            Last hidden state of shape (batch, sequence, hidden)
+        """
+        feed = {
+            name: np.asarray(inputs[name], dtype=np.int64)
+            for name in self.input_names
+            if name in inputs
+        }
+        return self.session.run(["last_hidden_state"], feed)[0]
+
+
+def parity_check(
+    kind: str = "medical",
+    texts: Optional[List[str]] = None,
+    model_name: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Compare ONNX and PyTorch embeddings for the same texts
+
+    Args:
+        kind: "medical" for MedicalTextEmbedder or "text" for TextEmbedder
+        texts: Texts to compare (defaults to a small medical sample)
+        model_name: Model override
+
+    Returns:
+        Cosine agreement and per-query latency for both backends
+    """
+    from src.embeddings.text_embedder import TextEmbedder, MedicalTextEmbedder
+
+    embedder_cls = MedicalTextEmbedder if kind == "medical" else TextEmbedder
+    texts = texts or PARITY_TEXTS
+
+    results = {}
+    vectors = {}
+    for backend in ("torch", "onnx"):
+        embedder = embedder_cls(model_name, use_cache=False, backend=backend)
+        embedder.embed(texts[:1])  # warm up
+
+        started = time.perf_counter()
+        for text in texts:
+            embedder.embed(text)
+        results[f"{backend}_ms_per_query"] = (time.perf_counter() - started) * 1000 / len(texts)
+        vectors[backend] = embedder.embed(texts)
+
+    a = vectors["torch"] / np.linalg.norm(vectors["torch"], axis=1, keepdims=True)
+    b = vectors["onnx"] / np.linalg.norm(vectors["onnx"], axis=1, keepdims=True)
+    cosines = np.sum(a * b, axis=1)
+
+    results.update({
+        "model_name": model_name or (
+            settings.medical_text_model if kind == "medical" else settings.text_embedding_model
+        ),
+        "n_texts": len(texts),
+        "mean_cosine": float(cosines.mean()),
+        "min_cosine": float(cosines.min()),
+        "speedup": results["torch_ms_per_query"] / results["onnx_ms_per_query"],
+    })
+    logger.info(
+        f"ONNX parity for {results['model_name']}: mean cosine {results['mean_cosine']:.4f}, "
+        f"min {results['min_cosine']:.4f}, speedup {results['speedup']:.2f}x"
+    )
+    return results
+
+
+if __name__ == "__main__":
+    import json
+    import sys
+
+    kind = sys.argv[1] if len(sys.argv) > 1 else "medical"
+    print(json.dumps(parity_check(kind), indent=2))
@@ -0,0 +1,176 @@
+"""
+Dimensionality reduction for stored vectors (PCA or prefix truncation)
+"""
+from typing import Dict, Optional
+from pathlib import Path
+import numpy as np
+
+from src.utils import settings, setup_logger
+
+logger = setup_logger(__name__, settings.log_level)
+
+
+class VectorProjection:
+    """Linear projection fitted offline on a corpus and applied to documents and queries"""
+
+    def __init__(self, mean: np.ndarray, components: np.ndarray, method: str):
+        """
+        Initialize projection
+
+        Args:
+            mean: Corpus mean subtracted before projecting, shape (input_dim,)
+            components: Projection matrix, shape (output_dim, input_dim)
+            method: "pca" or "truncate"
+        """
+        self.mean = mean.astype(np.float32)
+        self.components = components.astype(np.float32)
+        self.method = method
+
+    @property
+    def input_dim(self) -> int:
+        return self.components.shape[1]
+
+    @property
+    def output_dim(self) -> int:
+        return self.components.shape[0]
+
+    @classmethod
+    def fit(cls, vectors: np.ndarray, output_dim: int, method: str = "pca") -> "VectorProjection":
+        """
+        Fit a projection on corpus vectors
+
+        Args:
+            vectors: Corpus embeddings, shape (n, input_dim)
+            output_dim: Target dimension
+            method: "pca" (principal components) or "truncate" (keep the
+                leading dimensions, for Matryoshka-trained models)
+
+        Returns:
+            Fitted projection
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        input_dim = vectors.shape[1]
+        if not 0 < output_dim <= input_dim:
+            raise ValueError(f"Projection dimension must be in 1..{input_dim}, got {output_dim}")
+
+        if method == "truncate":
+            return cls(np.zeros(input_dim), np.eye(input_dim)[:output_dim], method)
+        if method != "pca":
+            raise ValueError(f"Unknown projection method: {method}")
+        if len(vectors) < output_dim:
+            raise ValueError(
+                f"PCA to {output_dim} dimensions needs at least {output_dim} vectors, got {len(vectors)}"
+            )
+
+        mean = vectors.mean(axis=0)
+        _, singular_values, vt = np.linalg.svd(vectors - mean, full_matrices=False)
+        explained = (singular_values[:output_dim] ** 2).sum() / (singular_values ** 2).sum()
+        logger.info(
+            f"Fitted PCA {input_dim} -> {output_dim} on {len(vectors)} vectors "
+            f"({explained:.1%} variance retained)"
+        )
+        return cls(mean, vt[:output_dim], method)
+
+    def transform(self, vectors: np.ndarray) -> np.ndarray:
+        """
+        Project vectors
+
+        Args:
+            vectors: Embeddings of shape (n, input_dim)
+
+        Returns:
+            Projected embeddings of shape (n, output_dim)
+        """
+        return (np.asarray(vectors, dtype=np.float32) - self.mean) @ self.components.T
+
+    @staticmethod
+    def path_for(collection_name: str) -> Path:
+        """Location of a (physical) collection's persisted projection"""
+        return settings.models_dir / "projections" / f"{collection_name}.npz"
+
+    def save(self, collection_name: str) -> Path:
+        """
+        Persist the projection for a collection
+
+        Args:
+            collection_name: Collection the projection belongs to
+
+        Returns:
+            Path written
+        """
+        path = self.path_for(collection_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(path, mean=self.mean, components=self.components, method=self.method)
+        logger.info(f"Saved {self.method} projection for '{collection_name}' to {path}")
+        return path
+
+    @classmethod
+    def delete(cls, collection_name: str) -> None:
+        """Remove a collection's persisted projection, if any"""
+        cls.path_for(collection_name).unlink(missing_ok=True)
+
+    @classmethod
+    def load(cls, collection_name: str) -> Optional["VectorProjection"]:
+        """
+        Load a collection's projection if one has been fitted
+
+        Args:
+            collection_name: Collection name
+
+        Returns:
+            Projection or None
+        """
+        path = cls.path_for(collection_name)
+        if not path.exists():
+            return None
+        data = np.load(path)
+        return cls(data["mean"], data["components"], str(data["method"]))
+
+
+def _top_k(corpus: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    """Exact cosine top-k indices"""
+    corpus = corpus / np.clip(np.linalg.norm(corpus, axis=1, keepdims=True), 1e-12, None)
+    queries = queries / np.clip(np.linalg.norm(queries, axis=1, keepdims=True), 1e-12, None)
+    scores = queries @ corpus.T
+    return np.argsort(-scores, axis=1)[:, :k]
+
+
+def recall_benchmark(
+    projection: VectorProjection,
+    corpus: np.ndarray,
+    queries: Optional[np.ndarray] = None,
+    k: int = 10,
+) -> Dict[str, float]:
+    """
+    Measure how much top-k recall the projection loses against full dimensions
+
+    Args:
+        projection: Fitted projection
+        corpus: Full-dimension corpus embeddings
+        queries: Full-dimension query embeddings (defaults to the corpus itself)
+        k: Cutoff
+
+    Returns:
+        Recall@k of projected search relative to full-dimension search
+    """
+    queries = corpus if queries is None else queries
+    k = min(k, len(corpus))
+
+    full = _top_k(corpus, queries, k)
+    reduced = _top_k(projection.transform(corpus), projection.transform(queries), k)
+    overlap = [len(set(a) & set(b)) / k for a, b in zip(full, reduced)]
+
+    report = {
+        "method": projection.method,
+        "input_dim": projection.input_dim,
+        "output_dim": projection.output_dim,
+        "k": k,
+        "recall_at_k": float(np.mean(overlap)),
+        "min_recall_at_k": float(np.min(overlap)),
+        "memory_ratio": projection.output_dim / projection.input_dim,
+    }
+    logger.info(
+        f"Projection {report['input_dim']} -> {report['output_dim']}: "
+        f"recall@{k} {report['recall_at_k']:.3f}"
+    )
+    return report
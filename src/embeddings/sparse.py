@@ -0,0 +1,116 @@
+"""
+BM25 term-weight sparse vectors for lexical matching
+"""
+from typing import Dict, List, Optional
+from collections import Counter
+import re
+import zlib
+
+from src.utils import settings
+
+# Terms keep internal hyphens, slashes and dots so scores, drug names and
+# doses ("curb-65", "cha2ds2-vasc", "0.9%") survive as single tokens
+_TOKEN = re.compile(r"[a-z0-9]+(?:[-/.][a-z0-9]+)*")
+
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have in into is it its of on or "
+    "that the their this to was were which with".split()
+)
+
+
+class BM25Encoder:
+    """
+    Local BM25 encoder producing sparse vectors for Qdrant
+
+    Documents get the BM25 term-frequency component (saturated by k1 and
+    normalized by length with b); queries get weight 1 per term. The IDF
+    component is left to Qdrant (sparse vector modifier "idf"), which keeps
+    it current as the collection changes without refitting anything here.
+    Terms are mapped to sparse indices by CRC32, so no vocabulary is stored.
+    """
+
+    def __init__(
+        self,
+        k1: Optional[float] = None,
+        b: Optional[float] = None,
+        avg_doc_length: Optional[float] = None,
+    ):
+        """
+        Initialize BM25 encoder
+
+        Args:
+            k1: Term-frequency saturation (defaults to settings.bm25_k1)
+            b: Length normalization (defaults to settings.bm25_b)
+            avg_doc_length: Average document length in terms (defaults to
+                settings.bm25_avg_doc_length)
+        """
+        self.k1 = settings.bm25_k1 if k1 is None else k1
+        self.b = settings.bm25_b if b is None else b
+        self.avg_doc_length = avg_doc_length or settings.bm25_avg_doc_length
+
+    @staticmethod
+    def tokenize(text: str) -> List[str]:
+        """
+        Split text into lowercase terms
+
+        Compound terms are kept whole and also split into their parts, so
+        "CURB-65" matches both "curb-65" and "CURB 65".
+
+        Args:
+            text: Input text
+
+        Returns:
+            Terms without stopwords
+        """
+        terms = []
+        for token in _TOKEN.findall(text.lower()):
+            if token in STOPWORDS:
+                continue
+            terms.append(token)
+            parts = re.split(r"[-/]", token)
+            if len(parts) > 1:
+                terms.extend(part for part in parts if part and part not in STOPWORDS)
+        return terms
+
+    @staticmethod
+    def term_index(term: str) -> int:
+        """Sparse index of a term"""
+        return zlib.crc32(term.encode("utf-8"))
+
+    def _sparse(self, weights: Dict[int, float]) -> Dict[str, List]:
+        """Sparse vector with sorted indices"""
+        indices = sorted(weights)
+        return {"indices": indices, "values": [weights[i] for i in indices]}
+
+    def embed_documents(self, texts: List[str]) -> List[Dict[str, List]]:
+        """
+        Encode documents (or chunks) for indexing
+
+        Args:
+            texts: Document texts
+
+        Returns:
+            One {"indices", "values"} sparse vector per text
+        """
+        vectors = []
+        for text in texts:
+            terms = self.tokenize(text)
+            norm = self.k1 * (1 - self.b + self.b * len(terms) / self.avg_doc_length)
+            weights: Dict[int, float] = {}
+            for term, tf in Counter(terms).items():
+                index = self.term_index(term)
+                weights[index] = weights.get(index, 0.0) + tf * (self.k1 + 1) / (tf + norm)
+            vectors.append(self._sparse(weights))
+        return vectors
+
+    def embed_query(self, query: str) -> Dict[str, List]:
+        """
+        Encode a search query
+
+        Args:
+            query: Query text
+
+        Returns:
+            {"indices", "values"} sparse vector
+        """
+        return self._sparse({self.term_index(term): 1.0 for term in self.tokenize(query)})
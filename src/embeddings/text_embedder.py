@@ -1,12 +1,14 @@
 """
 Text embedding generation for medical documents
 """
-from typing import List, Union
+from typing import List, Optional, Union
 import numpy as np
 from sentence_transformers import SentenceTransformer
 from transformers import AutoTokenizer, AutoModel
 import torch
 
+from src.embeddings.cache import EmbeddingCache
+from src.embeddings.onnx_backend import OnnxEncoder
 from src.utils import settings, setup_logger
 
 logger = setup_logger(__name__, settings.log_level)
@@ -15,25 +17,53 @@ logger = setup_logger(__name__, settings.log_level)
 class TextEmbedder:
     """Generate embeddings for text using Sentence Transformers"""
 
-    def __init__(self, model_name: str = None):
+    def __init__(
+        self,
+        model_name: str = None,
+        use_cache: Optional[bool] = None,
+        backend: Optional[str] = None,
+    ):
         """
         Initialize text embedder
 
         Args:
             model_name: Model name for embedding generation
+            use_cache: Enable the embedding cache (defaults to settings.embedding_cache_enabled)
+            backend: "torch" or "onnx" (defaults to settings.embedding_backend)
         """
         self.model_name = model_name or settings.text_embedding_model
-        logger.info(f"Loading text embedding model: {self.model_name}")
-        self.model = SentenceTransformer(self.model_name)
-        self.dimension = self.model.get_sentence_embedding_dimension()
+        self.backend = backend or settings.embedding_backend
+        logger.info(f"Loading text embedding model: {self.model_name} ({self.backend})")
+
+        if self.backend == "onnx":
+            # Sentence Transformers pipeline re-implemented on ONNX Runtime:
+            # transformer -> mean pooling -> L2 normalisation
+            self.model = None
+            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+            self.onnx_encoder = OnnxEncoder(self.model_name)
+            self.dimension = settings.text_embedding_dim
+            cache_key = f"{self.model_name}@{self.onnx_encoder.variant}"
+        else:
+            self.onnx_encoder = None
+            self.model = SentenceTransformer(self.model_name)
+            self.dimension = self.model.get_sentence_embedding_dimension()
+            cache_key = self.model_name
+
+        use_cache = settings.embedding_cache_enabled if use_cache is None else use_cache
+        self.cache = EmbeddingCache(cache_key, self.dimension) if use_cache else None
         logger.info(f"Text embedder initialized with dimension: {self.dimension}")
 
-    def embed(self, texts: Union[str, List[str]]) -> np.ndarray:
+    def embed(
+        self,
+        texts: Union[str, List[str]],
+        batch_size: Optional[int] = None,
+    ) -> np.ndarray:
         """
         Generate embeddings for text(s)
 
         Args:
             texts: Single text or list of texts
+            batch_size: Texts per forward pass (defaults to settings.embedding_batch_size)
 
         Returns:
             Embedding array of shape (n_texts, dimension)
@@ -41,44 +71,101 @@ class TextEmbedder:
         if isinstance(texts, str):
             texts = [texts]
 
+        if self.cache is not None:
+            return self.cache.get_or_compute(texts, lambda misses: self._encode(misses, batch_size))
+        return self._encode(texts, batch_size)
+
+    def _encode(self, texts: List[str], batch_size: Optional[int] = None) -> np.ndarray:
+        """Run the model on texts, bypassing the cache"""
         logger.debug(f"Generating embeddings for {len(texts)} texts")
+        if self.onnx_encoder is not None:
+            return self._encode_onnx(texts, batch_size or settings.embedding_batch_size)
+
         embeddings = self.model.encode(
             texts,
+            batch_size=batch_size or settings.embedding_batch_size,
             convert_to_numpy=True,
             show_progress_bar=False
         )
         return embeddings
 
+    def _encode_onnx(self, texts: List[str], batch_size: int) -> np.ndarray:
+        """Mean-pooled, normalised embeddings from the ONNX encoder"""
+        embeddings = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for start in range(0, len(texts), batch_size):
+            inputs = self.tokenizer(
+                texts[start:start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=settings.text_max_length,
+                return_tensors="np",
+            )
+            hidden = self.onnx_encoder(inputs)
+            mask = inputs["attention_mask"][..., None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            norms = np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+            embeddings[start:start + batch_size] = pooled / norms
+        return embeddings
+
 
 class MedicalTextEmbedder:
     """Generate embeddings for medical text using BioBERT"""
 
-    def __init__(self, model_name: str = None):
+    def __init__(
+        self,
+        model_name: str = None,
+        use_cache: Optional[bool] = None,
+        backend: Optional[str] = None,
+    ):
         """
         Initialize medical text embedder
 
         Args:
             model_name: Model name for medical text embedding
+            use_cache: Enable the embedding cache (defaults to settings.embedding_cache_enabled)
+            backend: "torch" or "onnx" (defaults to settings.embedding_backend)
         """
         self.model_name = model_name or settings.medical_text_model
-        logger.info(f"Loading medical text embedding model: {self.model_name}")
+        self.backend = backend or settings.embedding_backend
+        logger.info(f"Loading medical text embedding model: {self.model_name} ({self.backend})")
 
         self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-        self.model = AutoModel.from_pretrained(self.model_name)
-        self.model.eval()
         self.dimension = settings.medical_text_embedding_dim
 
-        # Move to GPU if available
-        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-        self.model.to(self.device)
+        if self.backend == "onnx":
+            self.model = None
+            self.onnx_encoder = OnnxEncoder(self.model_name)
+            self.device = "cpu"
+            cache_key = f"{self.model_name}@{self.onnx_encoder.variant}"
+        else:
+            self.onnx_encoder = None
+            self.model = AutoModel.from_pretrained(self.model_name)
+            self.model.eval()
+
+            # Move to GPU if available
+            self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+            self.model.to(self.device)
+            cache_key = self.model_name
+
+        use_cache = settings.embedding_cache_enabled if use_cache is None else use_cache
+        self.cache = EmbeddingCache(cache_key, self.dimension) if use_cache else None
         logger.info(f"Medical text embedder initialized on {self.device}")
 
-    def embed(self, texts: Union[str, List[str]]) -> np.ndarray:
+    def embed(
+        self,
+        texts: Union[str, List[str]],
+        batch_size: Optional[int] = None,
+    ) -> np.ndarray:
         """
         Generate embeddings for medical text(s)
 
+        Texts are sorted by token length and run through the model in
+        batches, each padded only to its own longest member. Embeddings
+        are returned in the original input order.
+
         Args:
             texts: Single text or list of texts
+            batch_size: Texts per forward pass (defaults to settings.embedding_batch_size)
 
         Returns:
             Embedding array of shape (n_texts, dimension)
@@ -86,25 +173,52 @@ class MedicalTextEmbedder:
         if isinstance(texts, str):
             texts = [texts]
 
-        logger.debug(f"Generating medical text embeddings for {len(texts)} texts")
+        if self.cache is not None:
+            return self.cache.get_or_compute(texts, lambda misses: self._encode(misses, batch_size))
+        return self._encode(texts, batch_size)
+
+    def _encode(self, texts: List[str], batch_size: Optional[int] = None) -> np.ndarray:
+        """Run the model on texts, bypassing the cache"""
+        batch_size = batch_size or settings.embedding_batch_size
+        logger.debug(
+            f"Generating medical text embeddings for {len(texts)} texts "
+            f"(batch size {batch_size})"
+        )
+
+        embeddings = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        if not texts:
+            return embeddings
+
+        # Tokenize once without padding, then bucket by length
+        encoded = self.tokenizer(
+            texts,
+            truncation=True,
+            max_length=settings.medical_text_max_length,
+        )
+        order = np.argsort([len(ids) for ids in encoded["input_ids"]], kind="stable")
 
-        embeddings = []
         with torch.no_grad():
-            for text in texts:
-                # Tokenize
-                inputs = self.tokenizer(
-                    text,
-                    return_tensors="pt",
+            for start in range(0, len(texts), batch_size):
+                batch_indices = order[start:start + batch_size]
+                features = [
+                    {key: encoded[key][i] for key in encoded.keys()}
+                    for i in batch_indices
+                ]
+                inputs = self.tokenizer.pad(
+                    features,
                     padding=True,
-                    truncation=True,
-                    max_length=512
-                ).to(self.device)
-
-                # Get embeddings
-                outputs = self.model(**inputs)
+                    return_tensors="np" if self.onnx_encoder is not None else "pt",
+                )
 
                 # Use [CLS] token embedding
-                embedding = outputs.last_hidden_state[:, 0, :].cpu().numpy()
-                embeddings.append(embedding[0])
+                embeddings[batch_indices] = self._forward(inputs)[:, 0, :]
+
+        return embeddings
+
+    def _forward(self, inputs) -> np.ndarray:
+        """Run one padded batch through the selected backend"""
+        if self.onnx_encoder is not None:
+            return self.onnx_encoder(inputs)
 
-        return np.array(embeddings)
+        outputs = self.model(**inputs.to(self.device))
+        return outputs.last_hidden_state.cpu().numpy()
@@ -0,0 +1,334 @@
+"""
+Streaming DICOM series and NIfTI volume ingestion
+"""
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from pathlib import Path
+import numpy as np
+from PIL import Image
+
+from src.utils import settings, setup_logger
+
+logger = setup_logger(__name__, settings.log_level)
+
+NIFTI_SUFFIXES = (".nii", ".nii.gz")
+
+
+def window_and_normalize(
+    pixels: np.ndarray,
+    center: Optional[float] = None,
+    width: Optional[float] = None,
+) -> np.ndarray:
+    """
+    Apply an intensity window and scale a slice to uint8
+
+    Args:
+        pixels: 2D slice in modality units (e.g. Hounsfield)
+        center: Window center; without a window the slice's own range is used
+        width: Window width
+
+    Returns:
+        uint8 array of the same shape
+    """
+    pixels = pixels.astype(np.float32, copy=False)
+    if center is not None and width:
+        low, high = center - width / 2.0, center + width / 2.0
+    else:
+        low, high = float(pixels.min()), float(pixels.max())
+
+    if high <= low:
+        return np.zeros(pixels.shape, dtype=np.uint8)
+    scaled = (np.clip(pixels, low, high) - low) / (high - low)
+    return (scaled * 255.0).astype(np.uint8)
+
+
+def _select_slices(n_slices: int, strategy: str, stride: int, slab: int) -> List[List[int]]:
+    """
+    Group slice indices into the images that will be embedded
+
+    Args:
+        n_slices: Number of slices in the volume
+        strategy: "middle", "stride" or "mip"
+        stride: Step between slices for "stride"
+        slab: Slices per projection for "mip"
+
+    Returns:
+        One index group per output image (projected when longer than one)
+    """
+    if n_slices == 0:
+        return []
+    if strategy == "middle":
+        return [[n_slices // 2]]
+    if strategy == "stride":
+        start = (n_slices - 1) % stride // 2
+        return [[i] for i in range(start, n_slices, stride)]
+    if strategy == "mip":
+        return [list(range(i, min(i + slab, n_slices))) for i in range(0, n_slices, slab)]
+    raise ValueError(f"Unknown slice strategy: {strategy}")
+
+
+def _project(read_slice, indices: List[int]) -> np.ndarray:
+    """Maximum intensity projection, holding one slice at a time"""
+    projection = None
+    for index in indices:
+        pixels = read_slice(index)
+        projection = pixels if projection is None else np.maximum(projection, pixels)
+    return projection
+
+
+def _to_image(pixels: np.ndarray, center: Optional[float], width: Optional[float]) -> Image.Image:
+    """Window a slice and wrap it as an RGB PIL image"""
+    return Image.fromarray(window_and_normalize(pixels, center, width)).convert("RGB")
+
+
+def _first_value(value: Any) -> Optional[float]:
+    """DICOM window attributes may be multi-valued"""
+    if value is None:
+        return None
+    try:
+        return float(value[0])
+    except TypeError:
+        return float(value)
+
+
+def _read_native_frame(path: Path, dataset: Any, frame: int) -> Optional[np.ndarray]:
+    """
+    Read one frame of uncompressed pixel data straight from the file
+
+    Args:
+        path: DICOM file
+        dataset: Dataset read with PixelData deferred
+        frame: Frame index
+
+    Returns:
+        Frame pixels, or None when the data is encapsulated (compressed),
+        already loaded or not byte-aligned
+    """
+    element = dataset.get_item("PixelData")
+    if (
+        element is None
+        or getattr(element, "value", None) is not None
+        or getattr(element, "value_tell", None) is None
+        or element.is_undefined_length
+        or int(getattr(dataset, "SamplesPerPixel", 1)) != 1
+        or int(dataset.BitsAllocated) % 8
+    ):
+        return None
+
+    dtype = np.dtype(
+        f"{'<' if element.is_little_endian else '>'}"
+        f"{'i' if int(getattr(dataset, 'PixelRepresentation', 0)) else 'u'}"
+        f"{int(dataset.BitsAllocated) // 8}"
+    )
+    shape = (int(dataset.Rows), int(dataset.Columns))
+    frame_bytes = shape[0] * shape[1] * dtype.itemsize
+    with open(path, "rb") as f:
+        f.seek(element.value_tell + frame * frame_bytes)
+        buffer = f.read(frame_bytes)
+    if len(buffer) != frame_bytes:
+        return None
+    return np.frombuffer(buffer, dtype=dtype).reshape(shape)
+
+
+def _scan_dicom_dir(series_dir: Path) -> Dict[str, List[Tuple[float, int, Path, Any]]]:
+    """
+    Read headers in a directory and group frames by series
+
+    Files without pixel data (e.g. DICOMDIR, structured reports) are
+    skipped, and multi-frame files contribute one entry per frame.
+
+    Args:
+        series_dir: Directory holding one or more series
+
+    Returns:
+        SeriesInstanceUID -> [(order, frame, path, header)] sorted by position
+    """
+    import pydicom
+
+    series: Dict[str, List[Tuple[float, int, Path, Any]]] = {}
+    for path in sorted(Path(series_dir).iterdir()):
+        if not path.is_file():
+            continue
+        try:
+            header = pydicom.dcmread(path, stop_before_pixels=True)
+        except Exception:
+            continue
+        # Image storage always carries the pixel matrix size
+        if "Rows" not in header or "Columns" not in header:
+            logger.debug(f"Skipping {path.name}: no pixel data")
+            continue
+        position = getattr(header, "ImagePositionPatient", None)
+        order = float(position[2]) if position else float(getattr(header, "InstanceNumber", 0) or 0)
+        n_frames = int(getattr(header, "NumberOfFrames", 1) or 1)
+        entries = series.setdefault(str(getattr(header, "SeriesInstanceUID", "")), [])
+        entries.extend((order, frame, path, header) for frame in range(n_frames))
+
+    for entries in series.values():
+        entries.sort(key=lambda item: (item[0], item[1]))
+    return series
+
+
+def iter_dicom_series(
+    series_dir: Path,
+    strategy: Optional[str] = None,
+    stride: Optional[int] = None,
+    slab: Optional[int] = None,
+    window: Optional[Tuple[float, float]] = None,
+) -> Iterator[Tuple[Image.Image, Dict[str, Any]]]:
+    """
+    Lazily read the DICOM series in a directory and yield windowed slices for embedding
+
+    Only headers are read up front to group files by SeriesInstanceUID and
+    order each series. Pixel data is deferred and loaded per selected slice
+    (per frame for uncompressed multi-frame files), so memory stays bounded
+    by a single slice (plus a projection buffer for "mip"). Compressed
+    multi-frame files are decoded once and reused while their frames are read.
+
+    Args:
+        series_dir: Directory holding one or more series
+        strategy: Slice selection ("middle", "stride", "mip")
+        stride: Step between slices for "stride"
+        slab: Slices per projection for "mip"
+        window: (center, width) override; defaults to the DICOM header
+
+    Yields:
+        (image, metadata) pairs
+    """
+    import pydicom
+
+    strategy = strategy or settings.volume_slice_strategy
+    stride = stride or settings.volume_slice_stride
+    slab = slab or settings.volume_mip_slab
+
+    all_series = _scan_dicom_dir(series_dir)
+    if not all_series:
+        logger.warning(f"No DICOM images found in {series_dir}")
+        return
+
+    decoded: Dict[Path, np.ndarray] = {}
+
+    for series_uid, frames in all_series.items():
+        first = frames[0][3]
+        center, width = window or (
+            _first_value(getattr(first, "WindowCenter", None)),
+            _first_value(getattr(first, "WindowWidth", None)),
+        )
+        study_metadata = {
+            "source_path": str(series_dir),
+            "format": "dicom",
+            "modality": str(getattr(first, "Modality", "")),
+            "body_part": str(getattr(first, "BodyPartExamined", "")),
+            "study_uid": str(getattr(first, "StudyInstanceUID", "")),
+            "series_uid": series_uid,
+            "n_slices": len(frames),
+        }
+
+        def read_slice(index: int) -> np.ndarray:
+            _, frame, path, header = frames[index]
+            n_frames = int(getattr(header, "NumberOfFrames", 1) or 1)
+            # Defer large elements so only this file's pixels are read
+            dataset = pydicom.dcmread(path, defer_size="1 KB")
+            pixels = _read_native_frame(path, dataset, frame) if n_frames > 1 else None
+            if pixels is None:
+                if n_frames > 1:
+                    # Keep only the most recent compressed multi-frame file
+                    if path not in decoded:
+                        decoded.clear()
+                        decoded[path] = dataset.pixel_array
+                    pixels = decoded[path][frame]
+                else:
+                    pixels = dataset.pixel_array
+            slope = float(getattr(dataset, "RescaleSlope", 1) or 1)
+            intercept = float(getattr(dataset, "RescaleIntercept", 0) or 0)
+            return pixels.astype(np.float32) * slope + intercept
+
+        for indices in _select_slices(len(frames), strategy, stride, slab):
+            pixels = _project(read_slice, indices)
+            yield _to_image(pixels, center, width), {
+                **study_metadata,
+                "slice_indices": indices,
+                "projection": "mip" if len(indices) > 1 else "slice",
+            }
+        decoded.clear()
+
+
+def iter_nifti_volume(
+    volume_path: Path,
+    axis: int = 2,
+    strategy: Optional[str] = None,
+    stride: Optional[int] = None,
+    slab: Optional[int] = None,
+    window: Optional[Tuple[float, float]] = None,
+) -> Iterator[Tuple[Image.Image, Dict[str, Any]]]:
+    """
+    Lazily read a NIfTI volume and yield windowed slices for embedding
+
+    The volume is opened through nibabel's array proxy (memory-mapped for
+    uncompressed files), so only the selected slices are ever read.
+
+    Args:
+        volume_path: Path to a .nii or .nii.gz file
+        axis: Slicing axis (2 = axial for RAS volumes)
+        strategy: Slice selection ("middle", "stride", "mip")
+        stride: Step between slices for "stride"
+        slab: Slices per projection for "mip"
+        window: (center, width); defaults to each image's own range
+
+    Yields:
+        (image, metadata) pairs
+    """
+    import nibabel as nib
+
+    strategy = strategy or settings.volume_slice_strategy
+    stride = stride or settings.volume_slice_stride
+    slab = slab or settings.volume_mip_slab
+
+    volume = nib.load(str(volume_path), mmap=True)
+    proxy = volume.dataobj
+    shape = volume.shape
+    center, width = window or (None, None)
+
+    def read_slice(index: int) -> np.ndarray:
+        slicer = [slice(None)] * len(shape)
+        slicer[axis] = index
+        # Collapse any extra (e.g. time) dimensions to their first frame
+        for extra in range(3, len(shape)):
+            slicer[extra] = 0
+        return np.asarray(proxy[tuple(slicer)], dtype=np.float32)
+
+    study_metadata = {
+        "source_path": str(volume_path),
+        "format": "nifti",
+        "shape": list(shape),
+        "axis": axis,
+        "n_slices": shape[axis],
+    }
+
+    for indices in _select_slices(shape[axis], strategy, stride, slab):
+        pixels = _project(read_slice, indices)
+        yield _to_image(pixels, center, width), {
+            **study_metadata,
+            "slice_indices": indices,
+            "projection": "mip" if len(indices) > 1 else "slice",
+        }
+
+
+def iter_study_slices(
+    path: Path,
+    **kwargs: Any,
+) -> Iterator[Tuple[Image.Image, Dict[str, Any]]]:
+    """
+    Dispatch to the DICOM or NIfTI reader based on the path
+
+    Args:
+        path: DICOM series directory or NIfTI file
+        **kwargs: Options forwarded to the reader
+
+    Yields:
+        (image, metadata) pairs
+    """
+    path = Path(path)
+    if path.is_dir():
+        return iter_dicom_series(path, **kwargs)
+    if path.name.lower().endswith(NIFTI_SUFFIXES):
+        return iter_nifti_volume(path, **kwargs)
+    raise ValueError(f"Unsupported study format: {path}")
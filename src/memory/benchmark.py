@@ -0,0 +1,159 @@
+"""
+Per-patient query latency benchmark for the patient memory collection
+"""
+from typing import Any, Dict, List, Optional, Sequence
+import math
+import time
+import numpy as np
+
+from src.core import QdrantManager, get_qdrant_manager
+from src.utils import settings, setup_logger
+from src.utils.config import CollectionProfile
+
+logger = setup_logger(__name__, settings.log_level)
+
+LAYOUTS = ("flat", "tenant")
+
+
+def tenant_latency_benchmark(
+    patient_counts: Sequence[int] = (50, 200, 1000),
+    interactions_per_patient: Optional[int] = None,
+    full_scan_points: int = 100,
+    queries: int = 200,
+    dimension: Optional[int] = None,
+    qdrant: Optional[QdrantManager] = None,
+    seed: int = 0,
+) -> List[Dict[str, Any]]:
+    """
+    Compare patient-filtered search latency of the flat and tenant layouts
+
+    Two scratch collections, one plain and one with the tenant profile, are
+    filled with the same random unit vectors in steps up to each patient
+    count; after each step, the same filtered searches for random patients
+    are timed on both. With the tenant profile each patient has its own
+    HNSW graph, so latency should stay flat; without it every query walks
+    the population-wide graph under a filter.
+
+    Qdrant answers a filter matching fewer points than the full-scan
+    threshold with an exact scan in either layout, and does not build a
+    graph for small segments at all. Both thresholds are therefore set to
+    full_scan_points on the scratch collections, and each patient gets
+    several times that many points, so every timed query goes through HNSW.
+
+    Args:
+        patient_counts: Increasing patient counts to measure at
+        interactions_per_patient: Points stored per patient (defaults to
+            4 * full_scan_points)
+        full_scan_points: Full-scan and indexing threshold, in points
+        queries: Timed searches per step and layout
+        dimension: Vector dimension (defaults to settings.text_embedding_dim)
+        qdrant: Qdrant manager (defaults to the shared instance)
+        seed: Random seed
+
+    Returns:
+        One row per patient count and layout with p50/p95/mean latency in
+        milliseconds
+    """
+    qdrant = qdrant or get_qdrant_manager()
+    dimension = dimension or settings.text_embedding_dim
+    interactions_per_patient = interactions_per_patient or 4 * full_scan_points
+    if interactions_per_patient <= full_scan_points:
+        raise ValueError(
+            f"interactions_per_patient ({interactions_per_patient}) must exceed "
+            f"full_scan_points ({full_scan_points}) for filtered searches to use HNSW"
+        )
+    rng = np.random.default_rng(seed)
+
+    # Qdrant thresholds are expressed in KB of float32 vector data
+    threshold_kb = math.ceil(full_scan_points * dimension * 4 / 1024)
+    thresholds = {"hnsw_full_scan_threshold": threshold_kb, "indexing_threshold": threshold_kb}
+    profiles = {
+        "flat": CollectionProfile(**thresholds),
+        "tenant": CollectionProfile(tenant_key="patient_id", **thresholds),
+    }
+    collections = {layout: f"benchmark_patient_memory_{layout}" for layout in LAYOUTS}
+
+    def unit_vectors(n: int) -> np.ndarray:
+        vectors = rng.standard_normal((n, dimension)).astype(np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    for layout, collection_name in collections.items():
+        qdrant.delete_collection(collection_name)
+        qdrant.create_collection(collection_name, dimension, profile=profiles[layout])
+
+    report = []
+    stored = 0
+    try:
+        for target in sorted(patient_counts):
+            new_patients = range(stored, target)
+            n_points = len(new_patients) * interactions_per_patient
+            vectors = unit_vectors(n_points)
+            for collection_name in collections.values():
+                rows = (
+                    (None, vectors[i].tolist(), {
+                        "patient_id": f"P{new_patients[i // interactions_per_patient]:07d}",
+                        "type": "benchmark",
+                    })
+                    for i in range(n_points)
+                )
+                qdrant.bulk_upsert(collection_name, rows)
+            stored = target
+            for collection_name in collections.values():
+                qdrant.wait_until_ready(collection_name)
+
+            probes = [
+                (query.tolist(), f"P{rng.integers(stored):07d}")
+                for query in unit_vectors(queries)
+            ]
+            for layout, collection_name in collections.items():
+                latencies = []
+                for query, patient_id in probes:
+                    started = time.perf_counter()
+                    qdrant.search(
+                        collection_name=collection_name,
+                        query_vector=query,
+                        limit=5,
+                        query_filter=qdrant.build_filter({"patient_id": patient_id}),
+                    )
+                    latencies.append((time.perf_counter() - started) * 1000)
+
+                row = {
+                    "patients": stored,
+                    "points": stored * interactions_per_patient,
+                    "layout": layout,
+                    "p50_ms": float(np.percentile(latencies, 50)),
+                    "p95_ms": float(np.percentile(latencies, 95)),
+                    "mean_ms": float(np.mean(latencies)),
+                }
+                logger.info(
+                    f"{row['patients']} patients ({layout}): "
+                    f"p50 {row['p50_ms']:.2f} ms, p95 {row['p95_ms']:.2f} ms"
+                )
+                report.append(row)
+    finally:
+        for collection_name in collections.values():
+            qdrant.delete_collection(collection_name)
+
+    return report
+
+
+if __name__ == "__main__":
+    # Run as `python -m src.memory.benchmark` against the configured Qdrant
+    rows = tenant_latency_benchmark()
+    by_step: Dict[int, Dict[str, Dict[str, Any]]] = {}
+    for row in rows:
+        by_step.setdefault(row["patients"], {})[row["layout"]] = row
+
+    print(
+        f"{'patients':>9} {'points':>9} "
+        + " ".join(f"{layout + ' ' + stat:>13}" for layout in LAYOUTS for stat in ("p50", "p95"))
+    )
+    for patients, layouts in by_step.items():
+        print(
+            f"{patients:>9} {layouts[LAYOUTS[0]]['points']:>9} "
+            + " ".join(
+                f"{layouts[layout][stat]:>13.2f}"
+                for layout in LAYOUTS
+                for stat in ("p50_ms", "p95_ms")
+            )
+        )
@@ -1,25 +1,75 @@
 """
 Patient memory management with long-term context tracking
 """
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple, Union, TYPE_CHECKING
+from datetime import datetime, timedelta, timezone, tzinfo
 from uuid import uuid4
+import base64
 import json
 
-from src.core import QdrantManager
-from src.embeddings import TextEmbedder
+from qdrant_client.models import Direction, Filter, HasIdCondition, OrderBy
+
+from src.core import QdrantManager, get_qdrant_manager, get_text_embedder
 from src.utils import settings, setup_logger
 
+if TYPE_CHECKING:
+    from src.embeddings import TextEmbedder
+
 logger = setup_logger(__name__, settings.log_level)
 
+# Payload projection for timelines and counters that do not render content;
+# rendered interactions are fetched with hydrate_interactions
+INTERACTION_LIST_FIELDS = ["interaction_id", "patient_id", "type", "timestamp"]
+
+
+def _format_timestamp(value: Optional[Union[datetime, str]] = None) -> str:
+    """
+    RFC 3339 UTC timestamp for the DATETIME-indexed payload field
+
+    Interactions stored by earlier versions carry naive local-time
+    timestamps, which Qdrant orders as if they were UTC; convert them once
+    with PatientMemoryManager.migrate_naive_timestamps.
+    """
+    if value is None:
+        value = datetime.now(timezone.utc)
+    elif isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def _stored_datetime(value: str, source_tz: Optional[tzinfo] = None) -> datetime:
+    """
+    Parse a stored payload timestamp as an aware UTC datetime
+
+    Naive values predate the UTC change and were written in local time
+    (source_tz, defaulting to this host's zone).
+    """
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        # astimezone() on a naive datetime assumes the host's local zone
+        parsed = parsed.replace(tzinfo=source_tz) if source_tz else parsed.astimezone()
+    return parsed.astimezone(timezone.utc)
+
 
 class PatientMemoryManager:
     """Manage long-term patient memory and interaction history"""
 
-    def __init__(self):
-        """Initialize patient memory manager"""
-        self.qdrant = QdrantManager()
-        self.text_embedder = TextEmbedder()
+    def __init__(
+        self,
+        qdrant: Optional[QdrantManager] = None,
+        text_embedder: Optional["TextEmbedder"] = None,
+    ):
+        """
+        Initialize patient memory manager
+
+        Args:
+            qdrant: Qdrant manager (defaults to the shared instance)
+            text_embedder: Text embedder (defaults to the shared instance)
+        """
+        self.qdrant = qdrant or get_qdrant_manager()
+        self.text_embedder = text_embedder or get_text_embedder()
         self.collection_name = settings.patient_memory_collection
 
         # Create collection if not exists
@@ -35,6 +85,7 @@ class PatientMemoryManager:
         interaction_type: str,
         content: str,
         metadata: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[Union[datetime, str]] = None,
     ) -> str:
         """
         Store a patient interaction in memory
@@ -44,12 +95,13 @@ class PatientMemoryManager:
             interaction_type: Type of interaction (consultation, diagnosis, image_analysis, etc.)
             content: Content of the interaction
             metadata: Additional metadata
+            timestamp: When the interaction happened (defaults to now, UTC)
 
         Returns:
             Interaction ID
         """
         interaction_id = str(uuid4())
-        timestamp = datetime.now().isoformat()
+        timestamp = _format_timestamp(timestamp)
 
         # Generate embedding
         embedding = self.text_embedder.embed(content)[0].tolist()
@@ -75,10 +127,47 @@ class PatientMemoryManager:
         logger.info(f"Stored interaction {interaction_id} for patient {patient_id}")
         return interaction_id
 
+    def store_interactions(
+        self,
+        interactions: List[Dict[str, Any]],
+    ) -> List[str]:
+        """
+        Store many patient interactions with batched embedding and upsert
+
+        Args:
+            interactions: Dicts with patient_id, interaction_type, content
+                and optional metadata and timestamp
+
+        Returns:
+            Interaction IDs
+        """
+        embeddings = self.text_embedder.embed([item["content"] for item in interactions])
+
+        rows = []
+        for item, embedding in zip(interactions, embeddings):
+            interaction_id = str(uuid4())
+            rows.append((interaction_id, embedding.tolist(), {
+                "interaction_id": interaction_id,
+                "patient_id": item["patient_id"],
+                "type": item["interaction_type"],
+                "content": item["content"],
+                "timestamp": _format_timestamp(item.get("timestamp")),
+                **(item.get("metadata") or {}),
+            }))
+
+        stats = self.qdrant.bulk_upsert(collection_name=self.collection_name, rows=rows)
+        logger.info(f"Stored {stats['points']} interactions")
+        return stats["ids"]
+
     def retrieve_patient_history(
         self,
         patient_id: str,
         limit: int = 10,
+        cursor: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        include_fields: Optional[List[str]] = None,
+        exclude_fields: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Retrieve patient's interaction history
@@ -86,32 +175,192 @@ class PatientMemoryManager:
         Args:
             patient_id: Patient identifier
             limit: Maximum number of interactions to retrieve
+            cursor: Cursor from retrieve_patient_history_page to continue from
+            start: Only interactions at or after this time
+            end: Only interactions before this time
+            include_fields: Only return these payload fields (e.g. INTERACTION_LIST_FIELDS)
+            exclude_fields: Return every payload field except these
+
+        Returns:
+            List of interactions, newest first
+        """
+        interactions, _ = self.retrieve_patient_history_page(
+            patient_id,
+            limit,
+            cursor,
+            start=start,
+            end=end,
+            include_fields=include_fields,
+            exclude_fields=exclude_fields,
+        )
+        return interactions
+
+    def retrieve_patient_history_page(
+        self,
+        patient_id: str,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        newest_first: bool = True,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        include_fields: Optional[List[str]] = None,
+        exclude_fields: Optional[List[str]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Retrieve one page of a patient's timeline
+
+        Points are scrolled with a patient_id filter and ordered by the
+        indexed timestamp inside Qdrant, so the page is the true newest (or
+        oldest) N regardless of history length.
+
+        Args:
+            patient_id: Patient identifier
+            limit: Page size
+            cursor: Cursor returned with the previous page
+            newest_first: Order newest to oldest (False for oldest first)
+            start: Only interactions at or after this time
+            end: Only interactions before this time
+            include_fields: Only return these payload fields
+            exclude_fields: Return every payload field except these
 
         Returns:
-            List of interactions sorted by timestamp
+            (interactions, next_cursor) where next_cursor is None on the last page
         """
-        # Use dummy vector for filtering-only search
-        dummy_vector = [0.0] * self.text_embedder.dimension
+        start_from, seen_ids = self._decode_cursor(cursor)
+        scroll_filter = self._patient_filter(patient_id, start, end)
+        # Points sharing the boundary timestamp were already returned
+        scroll_filter.must_not = [HasIdCondition(has_id=seen_ids)] if seen_ids else None
 
-        results = self.qdrant.hybrid_search(
+        points, _ = self.qdrant.scroll(
             collection_name=self.collection_name,
-            query_vector=dummy_vector,
-            metadata_filters={"patient_id": patient_id},
+            scroll_filter=scroll_filter,
             limit=limit,
+            shard_key_selector=self.qdrant.shard_key_for(self.collection_name, patient_id),
+            order_by=OrderBy(
+                key="timestamp",
+                direction=Direction.DESC if newest_first else Direction.ASC,
+                start_from=datetime.fromisoformat(start_from) if start_from else None,
+            ),
+            with_payload=self._payload(include_fields, exclude_fields),
         )
+        interactions = [point.payload for point in points]
 
-        # Extract and sort by timestamp
-        interactions = [point.payload for point in results]
-        interactions.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
+        next_cursor = None
+        if len(points) == limit:
+            boundary = points[-1].payload["timestamp"]
+            boundary_ids = [str(point.id) for point in points if point.payload["timestamp"] == boundary]
+            if boundary == start_from:
+                boundary_ids = seen_ids + boundary_ids
+            next_cursor = self._encode_cursor(boundary, boundary_ids)
 
         logger.debug(f"Retrieved {len(interactions)} interactions for patient {patient_id}")
-        return interactions
+        return interactions, next_cursor
+
+    def retrieve_between_interactions(
+        self,
+        patient_id: str,
+        first_interaction_id: str,
+        second_interaction_id: str,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve what happened between two visits
+
+        Args:
+            patient_id: Patient identifier
+            first_interaction_id: Earlier interaction
+            second_interaction_id: Later interaction
+            limit: Maximum number of interactions to retrieve
+
+        Returns:
+            Interactions strictly after the first and before the second, oldest first
+        """
+        bounds = self.qdrant.retrieve(
+            collection_name=self.collection_name,
+            ids=[first_interaction_id, second_interaction_id],
+        )
+        if len(bounds) != 2:
+            raise ValueError("Both interactions must exist")
+        # Either bound may still carry a pre-migration naive timestamp
+        start, end = sorted(_stored_datetime(point.payload["timestamp"]) for point in bounds)
+
+        interactions, _ = self.retrieve_patient_history_page(
+            patient_id,
+            limit=limit + 1,
+            newest_first=False,
+            start=start,
+            end=end,
+        )
+        bound_ids = {first_interaction_id, second_interaction_id}
+        return [item for item in interactions if item.get("interaction_id") not in bound_ids][:limit]
+
+    def _payload(
+        self,
+        include_fields: Optional[List[str]],
+        exclude_fields: Optional[List[str]],
+    ):
+        """Payload projection that always keeps timestamp, which cursors rely on"""
+        if include_fields is not None:
+            include_fields = list(dict.fromkeys([*include_fields, "timestamp"]))
+        if exclude_fields is not None:
+            exclude_fields = [field for field in exclude_fields if field != "timestamp"]
+        return self.qdrant.payload_selector(include_fields, exclude_fields)
+
+    def hydrate_interactions(self, interaction_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch full interactions for results that are actually rendered
+
+        Args:
+            interaction_ids: Interaction IDs from (projected) results
+
+        Returns:
+            Full interaction payloads, in the order given (missing IDs skipped)
+        """
+        records = {
+            str(record.id): record.payload
+            for record in self.qdrant.retrieve(self.collection_name, interaction_ids)
+        }
+        return [records[i] for i in interaction_ids if i in records]
+
+    def _patient_filter(
+        self,
+        patient_id: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Filter:
+        """patient_id match plus an optional timestamp range, both evaluated by Qdrant"""
+        conditions = self.qdrant.build_filter({"patient_id": patient_id}).must
+        if start is not None or end is not None:
+            conditions.append(self.qdrant.datetime_range("timestamp", start, end))
+        return Filter(must=conditions)
+
+    @staticmethod
+    def _encode_cursor(timestamp: str, ids: List[str]) -> str:
+        """Opaque cursor holding the boundary timestamp and IDs already returned at it"""
+        raw = json.dumps({"timestamp": timestamp, "ids": ids}).encode()
+        return base64.urlsafe_b64encode(raw).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: Optional[str]) -> Tuple[Optional[str], List[str]]:
+        """Inverse of _encode_cursor"""
+        if not cursor:
+            return None, []
+        try:
+            data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return data["timestamp"], list(data["ids"])
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"Invalid history cursor: {cursor}") from e
 
     def semantic_memory_search(
         self,
         patient_id: str,
         query: str,
         limit: int = 5,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        within_days: Optional[int] = None,
+        include_fields: Optional[List[str]] = None,
+        exclude_fields: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Search patient memory semantically
@@ -120,19 +369,29 @@ class PatientMemoryManager:
             patient_id: Patient identifier
             query: Search query
             limit: Number of results
+            start: Only interactions at or after this time
+            end: Only interactions before this time
+            within_days: Shorthand for start = now - within_days
+            include_fields: Only return these payload fields
+            exclude_fields: Return every payload field except these
 
         Returns:
             Relevant past interactions
         """
+        if within_days is not None:
+            start = datetime.now(timezone.utc) - timedelta(days=within_days)
+
         # Generate query embedding
         query_embedding = self.text_embedder.embed(query)[0].tolist()
 
-        # Search with patient filter
-        results = self.qdrant.hybrid_search(
+        # Search with patient (and time range) filter
+        results = self.qdrant.search(
             collection_name=self.collection_name,
             query_vector=query_embedding,
-            metadata_filters={"patient_id": patient_id},
+            query_filter=self._patient_filter(patient_id, start, end),
             limit=limit,
+            shard_key_selector=self.qdrant.shard_key_for(self.collection_name, patient_id),
+            with_payload=self._payload(include_fields, exclude_fields),
         )
 
         interactions = [
@@ -156,21 +415,50 @@ class PatientMemoryManager:
         Returns:
             Patient summary with statistics
         """
-        history = self.retrieve_patient_history(patient_id, limit=100)
+        # The newest 5 are shown (fetched in full below) and date the last visit
+        history = self.retrieve_patient_history(
+            patient_id, limit=5, include_fields=INTERACTION_LIST_FIELDS
+        )
+        oldest, _ = self.retrieve_patient_history_page(
+            patient_id, limit=1, newest_first=False, include_fields=INTERACTION_LIST_FIELDS
+        )
+        recent = self.hydrate_interactions(
+            [item["interaction_id"] for item in history[:5] if "interaction_id" in item]
+        )
 
-        # Calculate statistics
-        interaction_types = {}
-        for interaction in history:
-            itype = interaction.get("type", "unknown")
-            interaction_types[itype] = interaction_types.get(itype, 0) + 1
+        # Calculate statistics over the whole history: a type-only scroll
+        # tallies every type, however old its latest entry
+        shard_key = self.qdrant.shard_key_for(self.collection_name, patient_id)
+        total = self.qdrant.count(
+            self.collection_name,
+            self._patient_filter(patient_id),
+            shard_key_selector=shard_key,
+        )
+        interaction_types: Dict[str, int] = {}
+        offset = None
+        while True:
+            points, offset = self.qdrant.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=self._patient_filter(patient_id),
+                limit=1024,
+                offset=offset,
+                shard_key_selector=shard_key,
+                with_payload=["type"],
+            )
+            for point in points:
+                # Untyped interactions are reported as "other"
+                itype = (point.payload or {}).get("type") or "other"
+                interaction_types[itype] = interaction_types.get(itype, 0) + 1
+            if offset is None:
+                break
 
         summary = {
             "patient_id": patient_id,
-            "total_interactions": len(history),
+            "total_interactions": total,
             "interaction_types": interaction_types,
-            "first_visit": history[-1].get("timestamp") if history else None,
+            "first_visit": oldest[0].get("timestamp") if oldest else None,
             "last_visit": history[0].get("timestamp") if history else None,
-            "recent_interactions": history[:5],
+            "recent_interactions": recent,
         }
 
         return summary
@@ -188,10 +476,10 @@ class PatientMemoryManager:
             updates: Dictionary of fields to update
         """
         # Retrieve existing point
-        results = self.qdrant.search(
+        results = self.qdrant.retrieve(
             collection_name=self.collection_name,
-            query_vector=[0.0] * self.text_embedder.dimension,
-            limit=1,
+            ids=[interaction_id],
+            with_vectors=True,
         )
 
         if not results:
@@ -218,3 +506,49 @@ class PatientMemoryManager:
         )
 
         logger.info(f"Updated interaction {interaction_id}")
+
+    def migrate_naive_timestamps(self, source_tz: Optional[tzinfo] = None) -> int:
+        """
+        Convert naive timestamps written by earlier versions to UTC
+
+        Earlier versions stored datetime.now().isoformat(), i.e. local time
+        without an offset, which Qdrant orders as UTC against newer
+        interactions. Safe to run repeatedly: timestamps with an offset are
+        left alone.
+
+        Args:
+            source_tz: Time zone the naive timestamps were written in
+                (defaults to this host's local time zone)
+
+        Returns:
+            Number of interactions migrated
+        """
+        migrated, offset = 0, None
+        while True:
+            points, offset = self.qdrant.scroll(
+                collection_name=self.collection_name,
+                limit=1024,
+                offset=offset,
+                with_payload=["timestamp", "patient_id"],
+            )
+            for point in points:
+                payload = point.payload or {}
+                value = payload.get("timestamp")
+                if not value:
+                    continue
+                if datetime.fromisoformat(value).tzinfo is not None:
+                    continue
+                self.qdrant.set_payload(
+                    self.collection_name,
+                    {"timestamp": _stored_datetime(value, source_tz).isoformat()},
+                    [point.id],
+                    shard_key_selector=self.qdrant.shard_key_for(
+                        self.collection_name, payload.get("patient_id")
+                    ),
+                )
+                migrated += 1
+            if offset is None:
+                break
+
+        logger.info(f"Migrated {migrated} naive timestamps in '{self.collection_name}' to UTC")
+        return migrated
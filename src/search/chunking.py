@@ -0,0 +1,103 @@
+"""
+Token-window chunking of long medical documents
+"""
+from typing import Any, Dict, List, Optional
+
+from src.utils import settings, setup_logger
+
+logger = setup_logger(__name__, settings.log_level)
+
+
+class TextChunker:
+    """Split documents into overlapping token windows with character offsets"""
+
+    def __init__(
+        self,
+        tokenizer: Any,
+        window_tokens: Optional[int] = None,
+        overlap_tokens: Optional[int] = None,
+    ):
+        """
+        Initialize text chunker
+
+        Args:
+            tokenizer: Fast Hugging Face tokenizer of the embedding model
+            window_tokens: Tokens per chunk (defaults to settings.chunk_tokens)
+            overlap_tokens: Tokens shared by consecutive chunks
+        """
+        self.tokenizer = tokenizer
+        self.window_tokens = window_tokens or settings.chunk_tokens
+        self.overlap_tokens = (
+            settings.chunk_overlap_tokens if overlap_tokens is None else overlap_tokens
+        )
+        if self.overlap_tokens >= self.window_tokens:
+            raise ValueError("Chunk overlap must be smaller than the chunk window")
+
+    def chunk(self, text: str) -> List[Dict[str, Any]]:
+        """
+        Split a document into chunks
+
+        Args:
+            text: Document text
+
+        Returns:
+            Chunks with content, chunk_index and char_start/char_end offsets
+        """
+        offsets = self.tokenizer(
+            text,
+            add_special_tokens=False,
+            return_offsets_mapping=True,
+        )["offset_mapping"]
+
+        if len(offsets) <= self.window_tokens:
+            return [{"content": text, "chunk_index": 0, "char_start": 0, "char_end": len(text)}]
+
+        chunks = []
+        step = self.window_tokens - self.overlap_tokens
+        for start in range(0, len(offsets), step):
+            window = offsets[start:start + self.window_tokens]
+            char_start = 0 if start == 0 else window[0][0]
+            is_last = start + self.window_tokens >= len(offsets)
+            char_end = len(text) if is_last else window[-1][1]
+            chunks.append({
+                "content": text[char_start:char_end],
+                "chunk_index": len(chunks),
+                "char_start": char_start,
+                "char_end": char_end,
+            })
+            if is_last:
+                break
+
+        logger.debug(f"Split document of {len(offsets)} tokens into {len(chunks)} chunks")
+        return chunks
+
+
+def merge_chunks(chunks: List[Dict[str, Any]], separator: str = " … ") -> str:
+    """
+    Stitch chunk payloads back into text, removing overlap
+
+    Contiguous or overlapping chunks are merged by character offset; gaps
+    between non-adjacent chunks are marked with the separator.
+
+    Args:
+        chunks: Chunk payloads with content, char_start and char_end
+        separator: Marker placed between non-adjacent chunks
+
+    Returns:
+        Merged text
+    """
+    ordered = sorted(chunks, key=lambda c: c.get("char_start", 0))
+    parts: List[str] = []
+    covered_until = None
+    for chunk in ordered:
+        content = chunk.get("content", "")
+        start = chunk.get("char_start")
+        if covered_until is None or start is None:
+            parts.append(content)
+        elif start <= covered_until:
+            parts.append(content[covered_until - start:])
+        else:
+            parts.append(separator + content)
+        if start is not None:
+            covered_until = max(covered_until or 0, chunk.get("char_end", start + len(content)))
+    return "".join(parts)
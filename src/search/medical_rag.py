@@ -1,17 +1,45 @@
 """
 Retrieval-Augmented Generation system for medical knowledge
 """
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Callable, List, Dict, Any, Optional, Set, Tuple, Union
 from pathlib import Path
+import asyncio
+import threading
 import json
-
-from src.core import QdrantManager, MedicalLLM
-from src.embeddings import TextEmbedder, MedicalTextEmbedder
+import numpy as np
+
+from src.core import (
+    MedicalLLM,
+    get_async_qdrant_manager,
+    get_image_embedder,
+    get_qdrant_manager,
+    get_text_embedder,
+    get_medical_text_embedder,
+    warmup_models,
+)
+from src.embeddings import BM25Encoder, EmbeddingBatcher, bulk_embed
+from src.embeddings.projection import VectorProjection, recall_benchmark
 from src.memory import PatientMemoryManager
+from src.search.chunking import TextChunker, merge_chunks
 from src.utils import settings, setup_logger
+from src.utils.hashing import content_hash, point_id
 
 logger = setup_logger(__name__, settings.log_level)
 
+# Per-chunk payload fields that are not part of a document's metadata
+CHUNK_FIELDS = ("chunk_index", "char_start", "char_end")
+
+# Payload projections for list views that do not render full content;
+# rendered results are fetched with hydrate_medical_texts/images
+TEXT_LIST_FIELDS = ["parent_id", "title", "category", "specialty", "source", "chunk_count"]
+IMAGE_LIST_FIELDS = ["title", "modality", "body_part", "diagnosis", "findings"]
+
+# Named vectors of the medical images collection
+TEXT_BIOMED_VECTOR = "text_biomed"  # BiomedBERT embedding of the description
+TEXT_MINILM_VECTOR = "text_minilm"  # MiniLM embedding of the description
+IMAGE_RESNET_VECTOR = "image_resnet"  # ResNet-50 embedding of the pixels
+TEXT_VECTORS = (TEXT_BIOMED_VECTOR, TEXT_MINILM_VECTOR)
+
 
 class MedicalRAGSystem:
     """
@@ -22,148 +50,1068 @@ class MedicalRAGSystem:
         """Initialize Medical RAG system"""
         logger.info("Initializing Medical RAG system")
 
-        # Initialize components
-        self.qdrant = QdrantManager()
+        # Initialize components (models and clients are shared process-wide)
+        self.qdrant = get_qdrant_manager()
         self.llm = MedicalLLM()
-        self.text_embedder = TextEmbedder()
-        self.medical_text_embedder = MedicalTextEmbedder()
-        self.memory_manager = PatientMemoryManager()
+        self.text_embedder = get_text_embedder()
+        self.medical_text_embedder = get_medical_text_embedder()
+        self.image_embedder = get_image_embedder()
+        self.memory_manager = PatientMemoryManager(
+            qdrant=self.qdrant,
+            text_embedder=self.text_embedder,
+        )
+
+        # Long documents are indexed as overlapping child chunks
+        self._chunker = None
+
+        # BM25 term weights for lexical matching alongside the dense vectors
+        self.sparse_encoder = BM25Encoder()
+
+        # Single-query embeddings from concurrent requests share batches
+        self.query_embedder = (
+            EmbeddingBatcher(self.medical_text_embedder)
+            if settings.micro_batch_enabled
+            else self.medical_text_embedder
+        )
+        # Uploaded query images likewise share ResNet forward passes
+        self.image_query_embedder = (
+            EmbeddingBatcher(self.image_embedder, method="embed_bytes")
+            if settings.micro_batch_enabled
+            else None
+        )
 
         # Collection names
         self.texts_collection = settings.medical_texts_collection
         self.images_collection = settings.medical_images_collection
 
+        # Projections belong to physical collections (<alias>_v<N>); freshly
+        # fitted ones wait until a new version is created for them
+        self.live_collections: Dict[str, str] = {}
+        self.projections: Dict[str, Optional[VectorProjection]] = {}
+        self.pending_projections: Dict[str, Optional[VectorProjection]] = {}
+
         # Create collections
         self._initialize_collections()
 
+        # Models load on first use unless warmed up here
+        if settings.warmup_mode != "none":
+            warmup_models(
+                [self.medical_text_embedder, self.text_embedder],
+                background=settings.warmup_mode == "background",
+            )
+
         logger.info("Medical RAG system initialized successfully")
 
+    @property
+    def chunker(self) -> TextChunker:
+        """Chunker bound to the medical embedder's tokenizer (loads it on first use)"""
+        if self._chunker is None:
+            self._chunker = TextChunker(self.medical_text_embedder.tokenizer)
+        return self._chunker
+
     def _initialize_collections(self) -> None:
         """Initialize Qdrant collections"""
-        # Medical texts collection (Using 768 dim BiomedBERT)
-        self.qdrant.create_collection(
-            collection_name=self.texts_collection,
-            vector_size=self.medical_text_embedder.dimension,
-        )
+        # Medical texts (768 dim BiomedBERT chunks, plus BM25) and medical
+        # images: named vectors for the description (BiomedBERT and MiniLM)
+        # and the pixels (ResNet) on each point, so images can be found by
+        # text or by a similar image
+        for name in (self.texts_collection, self.images_collection):
+            physical = self.qdrant.resolve_collection(name)
+            if physical is None:
+                # A new collection is created with any freshly fitted projection
+                projection = self.pending_projections.pop(name, None)
+                self.qdrant.create_collection(name, vector_size=self._vector_sizes(name, projection))
+                physical = self.qdrant.resolve_collection(name)
+                self._adopt_projection(physical, projection)
+            else:
+                projection = self._load_projection(physical, name)
+                self.qdrant.create_collection(name, vector_size=self._vector_sizes(name, projection))
+            self.live_collections[name] = physical
+            self._check_dimension(name)
+
+        self.texts_sparse_vector = self.qdrant.sparse_vector_name(self.texts_collection)
+        self.image_vectors = self.qdrant.vector_names(self.images_collection)
+        if not self.image_vectors:
+            logger.warning(
+                f"Collection '{self.images_collection}' has a single unnamed vector; "
+                f"rebuild it to store MiniLM and ResNet vectors"
+            )
 
-        # Medical images collection (Using 768 dim for Metadata Search)
-        # We index image descriptions/findings using the text embedder
-        # This allows searching for images using text queries
-        self.qdrant.create_collection(
-            collection_name=self.images_collection,
-            vector_size=self.medical_text_embedder.dimension,
+        logger.info("Qdrant collections initialized")
+
+    def _load_projection(self, physical: str, alias: str) -> Optional[VectorProjection]:
+        """Projection a physical collection was indexed with (cached)"""
+        if physical not in self.projections:
+            projection = VectorProjection.load(physical)
+            if projection is None and physical != alias:
+                # Saved before projections were keyed by physical collection
+                projection = VectorProjection.load(alias)
+            self.projections[physical] = projection
+        return self.projections[physical]
+
+    def _adopt_projection(self, physical: str, projection: Optional[VectorProjection]) -> None:
+        """Persist (or clear) the projection a new physical collection is indexed with"""
+        if projection is None:
+            VectorProjection.delete(physical)
+        else:
+            projection.save(physical)
+        self.projections[physical] = projection
+
+    def _projection(self, collection_name: str) -> Optional[VectorProjection]:
+        """Projection of an alias's live version, or of a physical collection"""
+        physical = self.live_collections.get(collection_name, collection_name)
+        return self._load_projection(physical, collection_name)
+
+    def _vector_sizes(
+        self,
+        collection_name: str,
+        projection: Optional[VectorProjection],
+    ) -> Union[int, Dict[str, int]]:
+        """Vector size(s) a collection is created with under a projection"""
+        dimension = projection.output_dim if projection else self.medical_text_embedder.dimension
+        if collection_name != self.images_collection:
+            return dimension
+        return {
+            TEXT_BIOMED_VECTOR: dimension,
+            TEXT_MINILM_VECTOR: self.text_embedder.dimension,
+            IMAGE_RESNET_VECTOR: self.image_embedder.dimension,
+        }
+
+    def _check_dimension(self, collection_name: str) -> None:
+        """Fail if a collection's stored vectors do not match its projection"""
+        def dense(sizes):
+            return sizes.get(TEXT_BIOMED_VECTOR) if isinstance(sizes, dict) else sizes
+
+        stored = dense(self.qdrant.vector_sizes(collection_name))
+        expected = dense(self._vector_sizes(collection_name, self._projection(collection_name)))
+        if stored != expected:
+            physical = self.live_collections.get(collection_name, collection_name)
+            raise ValueError(
+                f"Collection '{physical}' stores {stored}-dim vectors but its projection "
+                f"produces {expected}; restore {VectorProjection.path_for(physical)} "
+                f"or delete and re-seed the collection"
+            )
+
+    def _to_stored(self, collection_name: str, embeddings: np.ndarray) -> np.ndarray:
+        """Apply a collection's projection (if any) to documents or queries"""
+        projection = self._projection(collection_name)
+        return projection.transform(embeddings) if projection else embeddings
+
+    def fit_projection(
+        self,
+        collection_name: str,
+        corpus: List[str],
+        output_dim: Optional[int] = None,
+        method: Optional[str] = None,
+        queries: Optional[List[str]] = None,
+        holdout: float = 0.2,
+    ) -> Dict[str, Any]:
+        """
+        Fit a dimensionality reduction for the next version of a collection
+
+        The projection is fitted on what the collection actually indexes
+        (chunks of medical texts, descriptions of images) and is held until
+        a new physical version is created for it (a rebuild, or
+        _initialize_collections after the collection was deleted); the live
+        version keeps the basis it was indexed with.
+
+        Args:
+            collection_name: Collection to project
+            corpus: Representative documents to fit on
+            output_dim: Target dimension (defaults to settings.vector_projection_dims)
+            method: "pca" or "truncate" (defaults to settings.vector_projection_method)
+            queries: Real queries to benchmark with; without them a held-out
+                share of the corpus is used as queries instead
+            holdout: Share of the corpus held out for the benchmark
+
+        Returns:
+            Recall benchmark of the projection against full dimensions
+
+        Raises:
+            ValueError: If there is nothing left to fit on
+        """
+        output_dim = output_dim or settings.vector_projection_dims[collection_name]
+        method = method or settings.vector_projection_method
+
+        if collection_name == self.texts_collection:
+            corpus = [chunk["content"] for text in corpus for chunk in self.chunker.chunk(text)]
+        vectors = bulk_embed(corpus, self.medical_text_embedder)
+
+        if queries:
+            train, held_out = vectors, bulk_embed(queries, self.medical_text_embedder)
+        else:
+            order = np.random.default_rng(0).permutation(len(vectors))
+            n_held_out = int(len(vectors) * holdout)
+            train, held_out = vectors[order[n_held_out:]], vectors[order[:n_held_out]]
+        if len(train) == 0 or len(held_out) == 0:
+            raise ValueError(f"Not enough texts to fit and benchmark a projection for '{collection_name}'")
+
+        if method == "pca" and len(train) < output_dim:
+            logger.warning(
+                f"Only {len(train)} vectors to fit a {output_dim}-dim PCA for "
+                f"'{collection_name}'; falling back to truncation"
+            )
+            method = "truncate"
+
+        projection = VectorProjection.fit(train, output_dim, method)
+        self.pending_projections[collection_name] = projection
+        return recall_benchmark(projection, train, held_out)
+
+    def _complete_documents(
+        self,
+        collection_name: str,
+        parent_ids: List[str],
+        batch_size: int = 1024,
+    ) -> Set[str]:
+        """
+        Which documents have every one of their chunks stored
+
+        The first chunk's ID is known without tokenizing the document and
+        its payload records the chunk count, so a run that failed partway
+        leaves its document incomplete and it is indexed again.
+
+        Args:
+            collection_name: Collection to check
+            parent_ids: Candidate parent IDs
+            batch_size: IDs per retrieve request
+
+        Returns:
+            Parent IDs whose chunks are all stored
+        """
+        expected: Dict[str, List[str]] = {}
+        for start in range(0, len(parent_ids), batch_size):
+            records = self.qdrant.retrieve(
+                collection_name,
+                [point_id(parent_id, 0) for parent_id in parent_ids[start:start + batch_size]],
+                with_payload=["parent_id", "chunk_count"],
+            )
+            for record in records:
+                payload = record.payload or {}
+                parent_id, chunk_count = payload.get("parent_id"), payload.get("chunk_count")
+                if parent_id and chunk_count:
+                    expected[parent_id] = [point_id(parent_id, i) for i in range(1, chunk_count)]
+
+        stored = self.qdrant.existing_ids(
+            collection_name, [chunk_id for chunk_ids in expected.values() for chunk_id in chunk_ids]
         )
+        return {
+            parent_id for parent_id, chunk_ids in expected.items()
+            if all(chunk_id in stored for chunk_id in chunk_ids)
+        }
 
-        logger.info("Qdrant collections initialized")
+    def _prepare_documents(
+        self,
+        texts: List[str],
+        metadatas: List[Dict[str, Any]],
+        skip_unchanged: bool = True,
+        collection_name: Optional[str] = None,
+    ) -> Tuple[List[str], List[str], List[str], List[Dict[str, Any]]]:
+        """
+        Derive deterministic IDs and split new documents into child chunks
+
+        Parent IDs are derived from a hash of the normalized content and
+        metadata, and chunk IDs from the parent ID and chunk index, so
+        re-indexing the same document overwrites rather than duplicates it.
+
+        Args:
+            texts: Document contents
+            metadatas: Document metadata aligned with texts
+            skip_unchanged: Leave out documents whose hash is already stored
+            collection_name: Collection to check (defaults to the texts collection)
+
+        Returns:
+            (parent IDs for all documents, chunk IDs, chunk texts, chunk payloads)
+        """
+        hashes = [content_hash(text, metadata) for text, metadata in zip(texts, metadatas)]
+        parent_ids = [point_id(digest) for digest in hashes]
+
+        pending = range(len(texts))
+        if skip_unchanged:
+            complete = self._complete_documents(collection_name or self.texts_collection, parent_ids)
+            pending = [i for i, parent_id in enumerate(parent_ids) if parent_id not in complete]
+
+        chunk_ids, chunk_texts, payloads = [], [], []
+        for i in pending:
+            chunks = self.chunker.chunk(texts[i])
+            for chunk in chunks:
+                chunk_ids.append(point_id(parent_ids[i], chunk["chunk_index"]))
+                chunk_texts.append(chunk["content"])
+                payloads.append({
+                    **metadatas[i],
+                    **chunk,
+                    "parent_id": parent_ids[i],
+                    "chunk_count": len(chunks),
+                    "content_hash": hashes[i],
+                })
+        return parent_ids, chunk_ids, chunk_texts, payloads
 
     def index_medical_text(
         self,
         text: str,
         metadata: Dict[str, Any],
+        skip_unchanged: bool = True,
     ) -> str:
         """
-        Index medical text document
+        Index medical text document as one or more chunks
 
         Args:
             text: Medical text content
             metadata: Document metadata (title, source, category, etc.)
+            skip_unchanged: Skip the document if the identical version is stored
 
         Returns:
-            Document ID
+            Parent document ID
         """
-        # Generate embedding
-        embedding = self.medical_text_embedder.embed(text)[0].tolist()
+        parent_ids, chunk_ids, chunk_texts, payloads = self._prepare_documents(
+            [text], [metadata], skip_unchanged
+        )
+        if not chunk_ids:
+            logger.debug(f"Medical text unchanged, skipped: {metadata.get('title', 'Unknown')}")
+            return parent_ids[0]
+
+        # Generate embeddings for all chunks in one batch
+        embeddings = self.medical_text_embedder.embed(chunk_texts)
 
         # Store in Qdrant
-        ids = self.qdrant.upsert_points(
+        self.qdrant.upsert_points(
             collection_name=self.texts_collection,
-            vectors=[embedding],
-            payloads=[{
-                "content": text,
-                **metadata,
-            }],
+            vectors=self._to_stored(self.texts_collection, embeddings).tolist(),
+            payloads=payloads,
+            ids=chunk_ids,
+            sparse_vectors=(
+                self.sparse_encoder.embed_documents(chunk_texts) if self.texts_sparse_vector else None
+            ),
         )
 
-        logger.info(f"Indexed medical text: {metadata.get('title', 'Unknown')}")
-        return ids[0]
+        logger.info(
+            f"Indexed medical text: {metadata.get('title', 'Unknown')} "
+            f"({len(chunk_texts)} chunks)"
+        )
+        return parent_ids[0]
+
+    def index_medical_texts(
+        self,
+        texts: List[str],
+        metadatas: List[Dict[str, Any]],
+        num_workers: Optional[int] = None,
+        skip_unchanged: bool = True,
+        collection_name: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Bulk-index medical text documents
+
+        Args:
+            texts: Medical text contents
+            metadatas: Document metadata aligned with texts
+            num_workers: Embedding worker processes (1 keeps it in-process)
+            skip_unchanged: Skip documents whose identical version is stored
+            collection_name: Physical collection to write (defaults to the
+                texts alias; used to fill a new version during a rebuild)
+
+        Returns:
+            Parent document IDs
+        """
+        parent_ids, chunk_ids, chunk_texts, payloads = self._prepare_documents(
+            texts, metadatas, skip_unchanged, collection_name
+        )
+        if not chunk_ids:
+            logger.info(f"All {len(parent_ids)} medical texts unchanged, nothing to index")
+            return parent_ids
+
+        embeddings = bulk_embed(chunk_texts, self.medical_text_embedder, num_workers=num_workers)
+        target = collection_name or self.texts_collection
+        vectors = self._to_stored(target, embeddings)
+        sparse_vectors = (
+            self.sparse_encoder.embed_documents(chunk_texts)
+            if self.qdrant.sparse_vector_name(target)
+            else [None] * len(chunk_texts)
+        )
+
+        self.qdrant.bulk_upsert(
+            collection_name=target,
+            rows=(
+                (chunk_id, self.qdrant.point_vector(target, vector.tolist(), sparse), payload)
+                for chunk_id, vector, sparse, payload in zip(chunk_ids, vectors, sparse_vectors, payloads)
+            ),
+        )
+
+        indexed = len({payload["parent_id"] for payload in payloads})
+        logger.info(
+            f"Bulk-indexed {indexed} medical texts ({len(chunk_texts)} chunks), "
+            f"{len(parent_ids) - indexed} unchanged"
+        )
+        return parent_ids
+
+    def _text_payload(
+        self,
+        include_fields: Optional[List[str]],
+        exclude_fields: Optional[List[str]],
+    ):
+        """Payload projection for chunk hits; parent_id is always kept for grouping"""
+        if include_fields is not None:
+            include_fields = list(dict.fromkeys([*include_fields, "parent_id"]))
+        return self.qdrant.payload_selector(include_fields, exclude_fields)
+
+    def hydrate_medical_texts(self, parent_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch full documents for results that are actually rendered
+
+        Args:
+            parent_ids: Parent document IDs from (projected) search results
+
+        Returns:
+            Documents with full content, in the order given (missing IDs skipped)
+        """
+        chunks: Dict[str, List[Dict[str, Any]]] = {}
+        offset = None
+        while parent_ids:
+            points, offset = self.qdrant.scroll(
+                collection_name=self.texts_collection,
+                scroll_filter=self.qdrant.any_of_filter("parent_id", parent_ids),
+                limit=256,
+                offset=offset,
+            )
+            for point in points:
+                chunks.setdefault(point.payload["parent_id"], []).append(point.payload)
+            if offset is None:
+                break
+
+        documents = []
+        for parent_id in parent_ids:
+            if parent_id not in chunks:
+                continue
+            document = {k: v for k, v in chunks[parent_id][0].items() if k not in CHUNK_FIELDS}
+            document["content"] = merge_chunks(chunks[parent_id])
+            documents.append(document)
+        return documents
+
+    def hydrate_medical_images(self, image_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch full image records for results that are actually rendered
+
+        Args:
+            image_ids: Image IDs from (projected) search results
+
+        Returns:
+            Image payloads with their IDs, in the order given (missing IDs skipped)
+        """
+        records = {
+            str(record.id): record
+            for record in self.qdrant.retrieve(self.images_collection, image_ids)
+        }
+        return [
+            {"id": image_id, **records[image_id].payload}
+            for image_id in image_ids if image_id in records
+        ]
+
+    def get_medical_text(self, parent_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Reassemble a full medical text document from its chunks
+
+        Args:
+            parent_id: Parent document ID
+
+        Returns:
+            Document metadata with full content, or None if not found
+        """
+        documents = self.hydrate_medical_texts([parent_id])
+        return documents[0] if documents else None
+
+    def _merge_chunk_hits(self, hits: List[Any]) -> Dict[str, Any]:
+        """Collapse the chunk hits of one parent (best first) into a single result"""
+        best = hits[0]
+        result = {k: v for k, v in (best.payload or {}).items() if k not in CHUNK_FIELDS}
+        if "content" in result:
+            result["content"] = merge_chunks([hit.payload for hit in hits])
+        result["relevance_score"] = best.score
+        result["matched_chunks"] = len(hits)
+        return result
+
+    def _group_chunk_hits(self, hits: List[Any], limit: int) -> List[Dict[str, Any]]:
+        """Group score-ordered chunk hits by parent, keeping the top parents"""
+        groups: Dict[str, List[Any]] = {}
+        for hit in hits:
+            parent_id = (hit.payload or {}).get("parent_id", str(hit.id))
+            group = groups.setdefault(parent_id, [])
+            if len(group) < settings.chunk_group_size:
+                group.append(hit)
+        return [self._merge_chunk_hits(group) for group in list(groups.values())[:limit]]
+
+    def _prepare_images(
+        self,
+        descriptions: List[str],
+        metadatas: List[Dict[str, Any]],
+        skip_unchanged: bool = True,
+        collection_name: Optional[str] = None,
+    ) -> Tuple[List[str], List[int]]:
+        """
+        Derive deterministic image IDs and find which still need indexing
+
+        Args:
+            descriptions: Image descriptions/findings
+            metadatas: Image metadata aligned with descriptions
+            skip_unchanged: Leave out images whose hash is already stored
+            collection_name: Collection to check (defaults to the images collection)
+
+        Returns:
+            (IDs for all images, positions of images to index)
+        """
+        hashes = [content_hash(text, metadata) for text, metadata in zip(descriptions, metadatas)]
+        ids = [point_id(digest) for digest in hashes]
+        if not skip_unchanged:
+            return ids, list(range(len(ids)))
+        stored = self.qdrant.existing_ids(collection_name or self.images_collection, ids)
+        return ids, [i for i, image_id in enumerate(ids) if image_id not in stored]
+
+    @staticmethod
+    def _image_payload(description: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Stored payload of an indexed image"""
+        return {
+            "content": description,
+            "description": description,
+            **metadata,
+            "content_hash": content_hash(description, metadata),
+        }
+
+    def _image_vectors(
+        self,
+        descriptions: List[str],
+        images: Optional[List[Any]],
+        collection_name: str,
+        num_workers: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Vectors of image records for a collection
+
+        Collections with named vectors get the BiomedBERT and MiniLM
+        embeddings of each description, plus the ResNet embedding of the
+        pixels where an image is given. A legacy single-vector collection
+        only gets the BiomedBERT embedding.
+
+        Args:
+            descriptions: Image descriptions/findings
+            images: Optional image paths or PIL Images aligned with descriptions
+                (None entries for records without pixels)
+            collection_name: Collection the vectors are written to
+            num_workers: Embedding worker processes (1 keeps it in-process)
+
+        Returns:
+            One vector (or {name: vector} dict) per description
+        """
+        biomed = self._to_stored(
+            collection_name,
+            bulk_embed(descriptions, self.medical_text_embedder, num_workers=num_workers),
+        )
+        if not self.qdrant.vector_names(collection_name):
+            if any(image is not None for image in images or []):
+                logger.warning(f"'{collection_name}' has no '{IMAGE_RESNET_VECTOR}' vector; pixels not stored")
+            return [vector.tolist() for vector in biomed]
+
+        minilm = bulk_embed(descriptions, self.text_embedder, kind="text", num_workers=num_workers)
+        vectors = [
+            {TEXT_BIOMED_VECTOR: b.tolist(), TEXT_MINILM_VECTOR: m.tolist()}
+            for b, m in zip(biomed, minilm)
+        ]
+
+        with_pixels = [i for i, image in enumerate(images or []) if image is not None]
+        if with_pixels:
+            pixels = self.image_embedder.embed([images[i] for i in with_pixels])
+            for i, vector in zip(with_pixels, pixels):
+                vectors[i][IMAGE_RESNET_VECTOR] = vector.tolist()
+        return vectors
 
     def index_medical_image(
         self,
         description: str,
         metadata: Dict[str, Any],
+        skip_unchanged: bool = True,
+        image: Optional[Any] = None,
     ) -> str:
         """
-        Index medical image metadata for text search
+        Index a medical image for text and similar-image search
 
         Args:
             description: Image description/findings
-            metadata: Image metadata (diagnosis, modality, body_part, etc.)
+            metadata: Image metadata (diagnosis, modality, body_part, etc.);
+                include the image's source (e.g. image_path) so a new image
+                gets a new ID
+            skip_unchanged: Skip the image if the identical version is stored
+            image: Optional image path or PIL Image for the pixel vector
 
         Returns:
             Image ID
         """
-        # Generate text embedding for the image description
-        embedding = self.medical_text_embedder.embed(description)[0].tolist()
+        ids, pending = self._prepare_images([description], [metadata], skip_unchanged)
+        if not pending:
+            logger.debug(f"Medical image unchanged, skipped: {ids[0]}")
+            return ids[0]
 
         # Store in Qdrant
-        ids = self.qdrant.upsert_points(
+        self.qdrant.upsert_points(
             collection_name=self.images_collection,
-            vectors=[embedding],
-            payloads=[{
-                "content": description,
-                "description": description,
-                **metadata,
-            }],
+            vectors=self._image_vectors([description], [image], self.images_collection, num_workers=1),
+            payloads=[self._image_payload(description, metadata)],
+            ids=ids,
         )
 
         logger.info(f"Indexed medical image: {metadata.get('modality', 'Unknown')}")
         return ids[0]
 
+    def index_medical_images(
+        self,
+        descriptions: List[str],
+        metadatas: List[Dict[str, Any]],
+        num_workers: Optional[int] = None,
+        skip_unchanged: bool = True,
+        collection_name: Optional[str] = None,
+        images: Optional[List[Any]] = None,
+    ) -> List[str]:
+        """
+        Bulk-index medical images for text and similar-image search
+
+        Args:
+            descriptions: Image descriptions/findings
+            metadatas: Image metadata aligned with descriptions
+            num_workers: Embedding worker processes (1 keeps it in-process)
+            skip_unchanged: Skip images whose identical version is stored
+            collection_name: Physical collection to write (defaults to the
+                images alias; used to fill a new version during a rebuild)
+            images: Optional image paths or PIL Images aligned with
+                descriptions (None entries for records without pixels)
+
+        Returns:
+            Image IDs
+        """
+        ids, pending = self._prepare_images(descriptions, metadatas, skip_unchanged, collection_name)
+        if not pending:
+            logger.info(f"All {len(ids)} medical images unchanged, nothing to index")
+            return ids
+
+        target = collection_name or self.images_collection
+        vectors = self._image_vectors(
+            [descriptions[i] for i in pending],
+            [images[i] for i in pending] if images else None,
+            target,
+            num_workers=num_workers,
+        )
+
+        self.qdrant.bulk_upsert(
+            collection_name=target,
+            rows=(
+                (ids[i], vector, self._image_payload(descriptions[i], metadatas[i]))
+                for i, vector in zip(pending, vectors)
+            ),
+        )
+
+        logger.info(f"Bulk-indexed {len(pending)} medical images, {len(ids) - len(pending)} unchanged")
+        return ids
+
+    def _stored_documents(
+        self,
+        collection_name: str,
+        id_field: Optional[str],
+        key_field: str,
+    ) -> Tuple[Dict[str, Optional[str]], Set[str]]:
+        """
+        Map each stored document ID to its identity key
+
+        Args:
+            collection_name: Collection to scan
+            id_field: Payload field holding the document ID (None uses the point ID)
+            key_field: Payload field identifying a document across versions
+
+        Returns:
+            (document ID -> key_field value, IDs of points that lack id_field
+            and are keyed by their point ID instead)
+        """
+        fields = [key_field] + ([id_field] if id_field else [])
+        stored, offset = {}, None
+        legacy = set()
+        while True:
+            points, offset = self.qdrant.scroll(
+                collection_name=collection_name,
+                limit=1024,
+                offset=offset,
+                with_payload=fields,
+            )
+            for point in points:
+                payload = point.payload or {}
+                doc_id = payload.get(id_field) if id_field else str(point.id)
+                if doc_id is None:
+                    # Indexed before documents were split into chunks
+                    doc_id = str(point.id)
+                    legacy.add(doc_id)
+                stored.setdefault(doc_id, payload.get(key_field))
+            if offset is None:
+                break
+        return stored, legacy
+
+    @staticmethod
+    def _sync_summary(
+        collection_name: str,
+        total: int,
+        added_keys: List[Optional[str]],
+        removed_keys: List[Optional[str]],
+    ) -> Dict[str, Any]:
+        """Classify added/removed documents, counting a key present in both as changed"""
+        changed = len({key for key in added_keys if key is not None} & set(removed_keys))
+        summary = {
+            "collection": collection_name,
+            "total": total,
+            "added": len(added_keys) - changed,
+            "changed": changed,
+            "removed": len(removed_keys) - changed,
+            "unchanged": total - len(added_keys),
+        }
+        logger.info(
+            f"Synced '{collection_name}': {summary['added']} added, {summary['changed']} changed, "
+            f"{summary['removed']} removed, {summary['unchanged']} unchanged"
+        )
+        return summary
+
+    def sync_medical_texts(
+        self,
+        texts: List[str],
+        metadatas: List[Dict[str, Any]],
+        num_workers: Optional[int] = None,
+        key_field: str = "title",
+    ) -> Dict[str, Any]:
+        """
+        Make the medical texts collection match a source corpus
+
+        Stored documents are compared with the corpus by content-hash
+        parent ID: only new or edited documents are embedded and upserted,
+        and documents no longer in the corpus are deleted afterwards, so the
+        collection stays fully searchable throughout.
+
+        Args:
+            texts: Full source corpus contents
+            metadatas: Document metadata aligned with texts
+            num_workers: Embedding worker processes (1 keeps it in-process)
+            key_field: Metadata field that identifies a document across edits,
+                used only to report edits as "changed"
+
+        Returns:
+            Counts of added, changed, removed and unchanged documents
+        """
+        parent_ids = [point_id(content_hash(text, metadata)) for text, metadata in zip(texts, metadatas)]
+        stored, legacy = self._stored_documents(self.texts_collection, "parent_id", key_field)
+
+        # Identical documents in the corpus share an ID and are indexed once;
+        # stored documents missing chunks (an interrupted run) are redone
+        complete = self._complete_documents(
+            self.texts_collection, [parent_id for parent_id in set(parent_ids) if parent_id in stored]
+        )
+        pending = [
+            i for parent_id, i in {pid: i for i, pid in enumerate(parent_ids)}.items()
+            if parent_id not in complete
+        ]
+        removed = sorted(set(stored) - set(parent_ids))
+
+        if pending:
+            self.index_medical_texts(
+                [texts[i] for i in pending],
+                [metadatas[i] for i in pending],
+                num_workers=num_workers,
+                skip_unchanged=False,
+            )
+        # Points without a parent_id are deleted by point ID
+        removed_legacy = [doc_id for doc_id in removed if doc_id in legacy]
+        removed_parents = [doc_id for doc_id in removed if doc_id not in legacy]
+        if removed_parents:
+            self.qdrant.delete_by_field(self.texts_collection, "parent_id", removed_parents)
+        if removed_legacy:
+            self.qdrant.delete_points(self.texts_collection, removed_legacy)
+
+        return self._sync_summary(
+            self.texts_collection,
+            len(set(parent_ids)),
+            [metadatas[i].get(key_field) for i in pending],
+            [stored[parent_id] for parent_id in removed],
+        )
+
+    def sync_medical_images(
+        self,
+        descriptions: List[str],
+        metadatas: List[Dict[str, Any]],
+        num_workers: Optional[int] = None,
+        key_field: str = "title",
+        images: Optional[List[Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make the medical images collection match a source corpus
+
+        Args:
+            descriptions: Full source corpus descriptions
+            metadatas: Image metadata aligned with descriptions
+            num_workers: Embedding worker processes (1 keeps it in-process)
+            key_field: Metadata field that identifies an image across edits
+            images: Optional image paths or PIL Images aligned with descriptions
+
+        Returns:
+            Counts of added, changed, removed and unchanged images
+        """
+        ids = [point_id(content_hash(text, metadata)) for text, metadata in zip(descriptions, metadatas)]
+        stored, _ = self._stored_documents(self.images_collection, None, key_field)
+
+        pending = [
+            i for image_id, i in {iid: i for i, iid in enumerate(ids)}.items()
+            if image_id not in stored
+        ]
+        removed = sorted(set(stored) - set(ids))
+
+        if pending:
+            self.index_medical_images(
+                [descriptions[i] for i in pending],
+                [metadatas[i] for i in pending],
+                num_workers=num_workers,
+                skip_unchanged=False,
+                images=[images[i] for i in pending] if images else None,
+            )
+        if removed:
+            self.qdrant.delete_points(self.images_collection, removed)
+
+        return self._sync_summary(
+            self.images_collection,
+            len(set(ids)),
+            [metadatas[i].get(key_field) for i in pending],
+            [stored[image_id] for image_id in removed],
+        )
+
+    def rebuild_medical_texts(
+        self,
+        texts: List[str],
+        metadatas: List[Dict[str, Any]],
+        num_workers: Optional[int] = None,
+        background: bool = False,
+        keep_previous: bool = False,
+    ) -> Optional[threading.Thread]:
+        """
+        Re-index the medical texts into a new collection version and swap the alias
+
+        Searches keep using the current version until the new one is fully
+        indexed, e.g. after changing the collection profile or chunking.
+
+        Args:
+            texts: Full source corpus contents
+            metadatas: Document metadata aligned with texts
+            num_workers: Embedding worker processes (1 keeps it in-process)
+            background: Rebuild on a daemon thread instead of blocking
+            keep_previous: Keep the old version for rollback
+
+        Returns:
+            The rebuild thread when running in the background
+        """
+        def populate(physical: str) -> None:
+            self.index_medical_texts(
+                texts, metadatas, num_workers=num_workers, skip_unchanged=False, collection_name=physical
+            )
+
+        return self._rebuild(self.texts_collection, populate, background, keep_previous)
+
+    def rebuild_medical_images(
+        self,
+        descriptions: List[str],
+        metadatas: List[Dict[str, Any]],
+        num_workers: Optional[int] = None,
+        background: bool = False,
+        keep_previous: bool = False,
+        images: Optional[List[Any]] = None,
+    ) -> Optional[threading.Thread]:
+        """
+        Re-index the medical images into a new collection version and swap the alias
+
+        Pixel vectors are recomputed from images; records rebuilt without
+        one lose their image_resnet vector.
+
+        Args:
+            descriptions: Full source corpus descriptions
+            metadatas: Image metadata aligned with descriptions
+            num_workers: Embedding worker processes (1 keeps it in-process)
+            background: Rebuild on a daemon thread instead of blocking
+            keep_previous: Keep the old version for rollback
+            images: Optional image paths or PIL Images aligned with descriptions
+
+        Returns:
+            The rebuild thread when running in the background
+        """
+        def populate(physical: str) -> None:
+            self.index_medical_images(
+                descriptions,
+                metadatas,
+                num_workers=num_workers,
+                skip_unchanged=False,
+                collection_name=physical,
+                images=images,
+            )
+
+        return self._rebuild(self.images_collection, populate, background, keep_previous)
+
+    def _rebuild(
+        self,
+        alias: str,
+        populate: Callable[[str], None],
+        background: bool,
+        keep_previous: bool,
+    ) -> Optional[threading.Thread]:
+        """Run a blue/green rebuild of one collection, optionally in the background"""
+        # The new version uses a freshly fitted projection, else the live one
+        projection = self.pending_projections.get(alias, self._projection(alias))
+
+        def populate_version(physical: str) -> None:
+            self._adopt_projection(physical, projection)
+            populate(physical)
+
+        def run():
+            try:
+                self.qdrant.rebuild_collection(
+                    alias,
+                    vector_size=self._vector_sizes(alias, projection),
+                    populate=populate_version,
+                    keep_previous=keep_previous,
+                )
+                if self.pending_projections.get(alias) is projection:
+                    self.pending_projections.pop(alias)
+                self.live_collections[alias] = self.qdrant.resolve_collection(alias)
+                # A rebuilt collection gains the current sparse/named vectors
+                self.texts_sparse_vector = self.qdrant.sparse_vector_name(self.texts_collection)
+                self.image_vectors = self.qdrant.vector_names(self.images_collection)
+            except Exception as e:
+                logger.error(f"Rebuild of '{alias}' failed, previous version still live: {e}")
+                if not background:
+                    raise
+
+        if not background:
+            run()
+            return None
+
+        thread = threading.Thread(target=run, name=f"rebuild-{alias}", daemon=True)
+        thread.start()
+        return thread
+
+    def _sparse_query(self, query: str, mode: Optional[str]) -> Optional[Dict[str, List]]:
+        """BM25 query vector when hybrid search applies, otherwise None"""
+        mode = mode or settings.text_search_mode
+        if mode not in ("hybrid", "dense"):
+            raise ValueError(f"Unknown search mode: {mode}")
+        if mode == "dense" or not self.texts_sparse_vector:
+            return None
+        sparse_query = self.sparse_encoder.embed_query(query)
+        return sparse_query if sparse_query["indices"] else None
+
     def search_medical_texts(
         self,
         query: str,
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 5,
+        include_fields: Optional[List[str]] = None,
+        exclude_fields: Optional[List[str]] = None,
+        mode: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Search medical text knowledge base
 
+        In hybrid mode, dense (BiomedBERT) and BM25 candidates are fused with
+        reciprocal rank fusion by Qdrant in one request, so exact terms such
+        as drug names and score acronyms rank alongside semantic matches.
+        Relevance scores are then fused ranks rather than cosine similarities.
+
         Args:
             query: Search query
             filters: Optional metadata filters
             limit: Number of results
+            include_fields: Only return these payload fields (e.g. TEXT_LIST_FIELDS)
+            exclude_fields: Return every payload field except these
+            mode: "hybrid" or "dense" (defaults to settings.text_search_mode);
+                hybrid falls back to dense until the collection has a sparse vector
 
         Returns:
             Retrieved medical texts with relevance scores
         """
         # Generate query embedding
-        query_embedding = self.medical_text_embedder.embed(query)[0].tolist()
-
-        # Search
-        if filters:
-            results = self.qdrant.hybrid_search(
-                collection_name=self.texts_collection,
-                query_vector=query_embedding,
-                metadata_filters=filters,
-                limit=limit,
-            )
+        query_embedding = self._to_stored(
+            self.texts_collection,
+            self.query_embedder.embed(query),
+        )[0].tolist()
+        sparse_query = self._sparse_query(query, mode)
+
+        # Search chunks and aggregate the best hits per parent document
+        search_options = dict(
+            collection_name=self.texts_collection,
+            query_vector=query_embedding,
+            group_by="parent_id",
+            limit=limit,
+            group_size=settings.chunk_group_size,
+            metadata_filters=filters,
+            with_payload=self._text_payload(include_fields, exclude_fields),
+        )
+        if sparse_query is not None:
+            groups = self.qdrant.fusion_search_groups(sparse_query=sparse_query, **search_options)
         else:
-            results = self.qdrant.search(
-                collection_name=self.texts_collection,
-                query_vector=query_embedding,
-                limit=limit,
-            )
+            groups = self.qdrant.search_groups(**search_options)
 
         # Format results
+        retrieved = [self._merge_chunk_hits(group.hits) for group in groups]
+
+        logger.debug(f"Retrieved {len(retrieved)} medical texts for query: {query[:50]}...")
+        return retrieved
+
+    def search_medical_texts_batch(
+        self,
+        queries: List[str],
+        filters: Optional[List[Optional[Dict[str, Any]]]] = None,
+        limits: Union[int, List[int]] = 5,
+        include_fields: Optional[List[str]] = None,
+        exclude_fields: Optional[List[str]] = None,
+        mode: Optional[str] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search the medical text knowledge base for many queries at once
+
+        All queries are embedded in one model call and sent to Qdrant as a
+        single batch request, fused with BM25 in hybrid mode exactly like
+        search_medical_texts. Chunk hits are over-fetched and grouped per
+        parent document client-side, since group search has no batch form.
+
+        Args:
+            queries: Search queries
+            filters: Optional metadata filters per query
+            limits: One limit for all queries or a limit per query
+            include_fields: Only return these payload fields
+            exclude_fields: Return every payload field except these
+            mode: "hybrid" or "dense" (defaults to settings.text_search_mode)
+
+        Returns:
+            One result list per query, in query order
+        """
+        if isinstance(limits, int):
+            limits = [limits] * len(queries)
+        filters = filters or [None] * len(queries)
+
+        query_embeddings = self._to_stored(
+            self.texts_collection,
+            self.medical_text_embedder.embed(queries),
+        )
+
+        search_options = dict(
+            collection_name=self.texts_collection,
+            query_vectors=query_embeddings.tolist(),
+            limits=[limit * settings.chunk_group_size for limit in limits],
+            query_filters=[self.qdrant.build_filter(f) for f in filters],
+            with_payload=self._text_payload(include_fields, exclude_fields),
+        )
+        sparse_queries = [self._sparse_query(query, mode) for query in queries]
+        if any(sparse_query is not None for sparse_query in sparse_queries):
+            batch_results = self.qdrant.fusion_search_batch(sparse_queries=sparse_queries, **search_options)
+        else:
+            batch_results = self.qdrant.search_batch(**search_options)
+
         retrieved = [
-            {
-                **point.payload,
-                "relevance_score": point.score,
-            }
-            for point in results
+            self._group_chunk_hits(hits, limit)
+            for hits, limit in zip(batch_results, limits)
         ]
 
-        logger.debug(f"Retrieved {len(retrieved)} medical texts for query: {query[:50]}...")
+        logger.debug(f"Retrieved medical texts for {len(queries)} queries in one batch")
         return retrieved
 
     def search_medical_images(
@@ -171,6 +1119,9 @@ class MedicalRAGSystem:
         query: str,
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 5,
+        include_fields: Optional[List[str]] = None,
+        exclude_fields: Optional[List[str]] = None,
+        vector: str = TEXT_BIOMED_VECTOR,
     ) -> List[Dict[str, Any]]:
         """
         Search medical images by text query
@@ -179,32 +1130,49 @@ class MedicalRAGSystem:
             query: Search query
             filters: Optional metadata filters
             limit: Number of results
+            include_fields: Only return these payload fields (e.g. IMAGE_LIST_FIELDS)
+            exclude_fields: Return every payload field except these
+            vector: Description vector to search, TEXT_BIOMED_VECTOR or TEXT_MINILM_VECTOR
 
         Returns:
             Retrieved images with relevance scores
         """
+        using = self._image_text_vector(vector)
+
         # Generate query embedding
-        query_embedding = self.medical_text_embedder.embed(query)[0].tolist()
+        if using == TEXT_MINILM_VECTOR:
+            query_embedding = self.text_embedder.embed(query)[0].tolist()
+        else:
+            query_embedding = self._to_stored(
+                self.images_collection,
+                self.query_embedder.embed(query),
+            )[0].tolist()
 
         # Search
+        with_payload = self.qdrant.payload_selector(include_fields, exclude_fields)
         if filters:
             results = self.qdrant.hybrid_search(
                 collection_name=self.images_collection,
                 query_vector=query_embedding,
                 metadata_filters=filters,
                 limit=limit,
+                with_payload=with_payload,
+                using=using,
             )
         else:
             results = self.qdrant.search(
                 collection_name=self.images_collection,
                 query_vector=query_embedding,
                 limit=limit,
+                with_payload=with_payload,
+                using=using,
             )
 
         # Format results
         retrieved = [
             {
-                **point.payload,
+                "id": str(point.id),
+                **(point.payload or {}),
                 "relevance_score": point.score,
             }
             for point in results
@@ -213,6 +1181,253 @@ class MedicalRAGSystem:
         logger.debug(f"Retrieved {len(retrieved)} medical images for query: {query[:50]}...")
         return retrieved
 
+    def _image_text_vector(self, vector: str) -> Optional[str]:
+        """Named description vector to search (None on a legacy single-vector collection)"""
+        if vector not in TEXT_VECTORS:
+            raise ValueError(f"Text queries search {TEXT_VECTORS}, not '{vector}'")
+        if not self.image_vectors:
+            # Only the BiomedBERT vector exists, unnamed
+            return None
+        return vector
+
+    @property
+    def async_qdrant(self):
+        """Shared async Qdrant manager (created on first use from an event loop)"""
+        return get_async_qdrant_manager()
+
+    @property
+    def async_search_enabled(self) -> bool:
+        """
+        Whether asearch_* use the async client
+
+        An in-memory Qdrant store belongs to the synchronous client that
+        created and seeded it, so in that mode asearch_* run the synchronous
+        searches on a worker thread instead.
+        """
+        return not self.qdrant.in_memory
+
+    async def _aembed_query(self, collection_name: str, query: str) -> List[float]:
+        """Embed a query without blocking the event loop"""
+        if isinstance(self.query_embedder, EmbeddingBatcher):
+            vector = await asyncio.wrap_future(self.query_embedder.submit(query))
+            embeddings = vector[np.newaxis, :]
+        else:
+            embeddings = await asyncio.to_thread(self.query_embedder.embed, query)
+        return self._to_stored(collection_name, embeddings)[0].tolist()
+
+    async def asearch_medical_texts(
+        self,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 5,
+        include_fields: Optional[List[str]] = None,
+        exclude_fields: Optional[List[str]] = None,
+        mode: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Async variant of search_medical_texts for use from request handlers
+
+        Args:
+            query: Search query
+            filters: Optional metadata filters
+            limit: Number of results
+            include_fields: Only return these payload fields
+            exclude_fields: Return every payload field except these
+            mode: "hybrid" or "dense" (defaults to settings.text_search_mode)
+
+        Returns:
+            Retrieved medical texts with relevance scores
+        """
+        if not self.async_search_enabled:
+            return await asyncio.to_thread(
+                self.search_medical_texts, query, filters, limit, include_fields, exclude_fields, mode
+            )
+        query_embedding = await self._aembed_query(self.texts_collection, query)
+        sparse_query = self._sparse_query(query, mode)
+
+        search_options = dict(
+            collection_name=self.texts_collection,
+            query_vector=query_embedding,
+            group_by="parent_id",
+            limit=limit,
+            group_size=settings.chunk_group_size,
+            metadata_filters=filters,
+            with_payload=self._text_payload(include_fields, exclude_fields),
+        )
+        if sparse_query is not None:
+            groups = await self.async_qdrant.fusion_search_groups(sparse_query=sparse_query, **search_options)
+        else:
+            groups = await self.async_qdrant.search_groups(**search_options)
+        return [self._merge_chunk_hits(group.hits) for group in groups]
+
+    async def asearch_medical_images(
+        self,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 5,
+        include_fields: Optional[List[str]] = None,
+        exclude_fields: Optional[List[str]] = None,
+        vector: str = TEXT_BIOMED_VECTOR,
+    ) -> List[Dict[str, Any]]:
+        """
+        Async variant of search_medical_images for use from request handlers
+
+        Args:
+            query: Search query
+            filters: Optional metadata filters
+            limit: Number of results
+            include_fields: Only return these payload fields
+            exclude_fields: Return every payload field except these
+            vector: Description vector to search, TEXT_BIOMED_VECTOR or TEXT_MINILM_VECTOR
+
+        Returns:
+            Retrieved images with relevance scores
+        """
+        if not self.async_search_enabled:
+            return await asyncio.to_thread(
+                self.search_medical_images, query, filters, limit, include_fields, exclude_fields, vector
+            )
+        using = self._image_text_vector(vector)
+        if using == TEXT_MINILM_VECTOR:
+            query_embedding = (await asyncio.to_thread(self.text_embedder.embed, query))[0].tolist()
+        else:
+            query_embedding = await self._aembed_query(self.images_collection, query)
+        results = await self.async_qdrant.search(
+            collection_name=self.images_collection,
+            query_vector=query_embedding,
+            limit=limit,
+            query_filter=self.async_qdrant.build_filter(filters),
+            with_payload=self.async_qdrant.payload_selector(include_fields, exclude_fields),
+            using=using,
+        )
+        return [
+            {"id": str(point.id), **(point.payload or {}), "relevance_score": point.score}
+            for point in results
+        ]
+
+    def _image_example_filters(
+        self,
+        modality: Optional[str],
+        body_part: Optional[str],
+        filters: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Metadata filters for an image-by-example query; requires the pixel vector"""
+        if IMAGE_RESNET_VECTOR not in self.image_vectors:
+            raise RuntimeError(
+                f"Collection '{self.images_collection}' has no '{IMAGE_RESNET_VECTOR}' vector; "
+                f"rebuild it with images to enable similar-image search"
+            )
+        conditions = {"modality": modality, "body_part": body_part}
+        return {**(filters or {}), **{k: v for k, v in conditions.items() if v is not None}}
+
+    def search_images_by_example(
+        self,
+        image: bytes,
+        modality: Optional[str] = None,
+        body_part: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 5,
+        include_fields: Optional[List[str]] = None,
+        exclude_fields: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Find stored cases whose pixels resemble an image
+
+        The image is embedded with the ResNet image embedder (through the
+        shared micro-batcher and the embedding cache) and searched against
+        the image_resnet vectors; records indexed without pixels never match.
+
+        Args:
+            image: Encoded image file (PNG, JPEG, ...)
+            modality: Only cases of this modality (e.g. "X-ray")
+            body_part: Only cases of this body part (e.g. "Chest")
+            filters: Further exact-match metadata filters
+            limit: Number of results
+            include_fields: Only return these payload fields (e.g. IMAGE_LIST_FIELDS)
+            exclude_fields: Return every payload field except these
+
+        Returns:
+            Similar cases with relevance scores, most similar first
+
+        Raises:
+            ValueError: If the image cannot be decoded
+        """
+        filters = self._image_example_filters(modality, body_part, filters)
+        # Reject bad uploads before they join a shared batch
+        self.image_embedder.validate_bytes(image)
+        if self.image_query_embedder is not None:
+            query_embedding = self.image_query_embedder.submit(image).result()
+        else:
+            query_embedding = self.image_embedder.embed_bytes([image])[0]
+
+        results = self.qdrant.hybrid_search(
+            collection_name=self.images_collection,
+            query_vector=query_embedding.tolist(),
+            metadata_filters=filters,
+            limit=limit,
+            with_payload=self.qdrant.payload_selector(include_fields, exclude_fields),
+            using=IMAGE_RESNET_VECTOR,
+        )
+
+        logger.debug(f"Retrieved {len(results)} similar cases by image")
+        return [
+            {"id": str(point.id), **(point.payload or {}), "relevance_score": point.score}
+            for point in results
+        ]
+
+    async def asearch_images_by_example(
+        self,
+        image: bytes,
+        modality: Optional[str] = None,
+        body_part: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 5,
+        include_fields: Optional[List[str]] = None,
+        exclude_fields: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Async variant of search_images_by_example for use from request handlers
+
+        Args:
+            image: Encoded image file (PNG, JPEG, ...)
+            modality: Only cases of this modality (e.g. "X-ray")
+            body_part: Only cases of this body part (e.g. "Chest")
+            filters: Further exact-match metadata filters
+            limit: Number of results
+            include_fields: Only return these payload fields
+            exclude_fields: Return every payload field except these
+
+        Returns:
+            Similar cases with relevance scores, most similar first
+
+        Raises:
+            ValueError: If the image cannot be decoded
+        """
+        if not self.async_search_enabled:
+            return await asyncio.to_thread(
+                self.search_images_by_example,
+                image, modality, body_part, filters, limit, include_fields, exclude_fields,
+            )
+        filters = self._image_example_filters(modality, body_part, filters)
+        self.image_embedder.validate_bytes(image)
+        if self.image_query_embedder is not None:
+            query_embedding = await asyncio.wrap_future(self.image_query_embedder.submit(image))
+        else:
+            query_embedding = (await asyncio.to_thread(self.image_embedder.embed_bytes, [image]))[0]
+
+        results = await self.async_qdrant.search(
+            collection_name=self.images_collection,
+            query_vector=query_embedding.tolist(),
+            limit=limit,
+            query_filter=self.async_qdrant.build_filter(filters),
+            with_payload=self.async_qdrant.payload_selector(include_fields, exclude_fields),
+            using=IMAGE_RESNET_VECTOR,
+        )
+        return [
+            {"id": str(point.id), **(point.payload or {}), "relevance_score": point.score}
+            for point in results
+        ]
+
     def search_similar_images(
         self,
         query: str,
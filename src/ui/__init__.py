@@ -1,4 +1,17 @@
 """UI modules"""
-from .app import MediVisionApp, launch_app
+from importlib import import_module
 
-__all__ = ["MediVisionApp", "launch_app"]
+_EXPORTS = {
+    "MediVisionApp": ".app",
+    "launch_app": ".app",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
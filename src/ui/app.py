@@ -29,17 +29,20 @@ class MediVisionApp:
             logger.info("Loading demo medical texts...")
             medical_texts = demo_data.get_medical_texts()
 
-            for text in medical_texts:
-                self.rag_system.index_medical_text(
-                    text=text["content"],
-                    metadata={
+            # Content-hash IDs make this a no-op when nothing changed
+            self.rag_system.index_medical_texts(
+                texts=[text["content"] for text in medical_texts],
+                metadatas=[
+                    {
                         "title": text["title"],
                         "category": text["category"],
                         "specialty": text["specialty"],
                         "source": text["source"],
-                    },
-                )
-            logger.info(f"Indexed {len(medical_texts)} medical texts")
+                    }
+                    for text in medical_texts
+                ],
+            )
+            logger.info(f"Demo knowledge base holds {len(medical_texts)} medical texts")
 
         except Exception as e:
             logger.warning(f"Failed to load demo data: {e}")
@@ -3,9 +3,47 @@ Configuration management with secure credential handling
 """
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 from pydantic_settings import BaseSettings
-from pydantic import Field
+from pydantic import BaseModel, Field
+
+
+class CollectionProfile(BaseModel):
+    """Index, quantization and storage tuning for one Qdrant collection"""
+
+    # HNSW graph (None keeps the Qdrant default)
+    hnsw_m: Optional[int] = None
+    hnsw_ef_construct: Optional[int] = None
+    hnsw_payload_m: Optional[int] = None
+    search_ef: Optional[int] = None
+    # Filtered searches matching fewer vectors than this (in KB of vector
+    # data) scan exactly instead of walking the graph
+    hnsw_full_scan_threshold: Optional[int] = None
+    # Segments smaller than this (in KB) are not HNSW-indexed
+    indexing_threshold: Optional[int] = None
+
+    # Quantization: None, "scalar" (int8) or "binary"
+    quantization: Optional[str] = None
+    quantization_always_ram: bool = True
+    rescore: bool = True
+    oversampling: Optional[float] = None
+
+    # Storage
+    on_disk_vectors: bool = False
+    # None keeps the Qdrant server default (on disk) and is never migrated
+    on_disk_payload: Optional[bool] = None
+
+    # Multitenancy: payload field every query filters on. It gets a tenant
+    # keyword index and per-tenant HNSW graphs (global graph off by default).
+    tenant_key: Optional[str] = None
+    # Custom sharding: route each tenant to one of N shard keys (0 = off,
+    # requires distributed mode)
+    shard_buckets: int = 0
+
+    # Lexical matching: name of a BM25 sparse vector stored next to the
+    # dense one (term weights computed locally, IDF applied by Qdrant).
+    # Adding it to an existing collection requires a rebuild.
+    sparse_vector: Optional[str] = None
 
 
 class Settings(BaseSettings):
@@ -14,6 +52,13 @@ class Settings(BaseSettings):
     # Qdrant Configuration
     qdrant_url: str = Field(..., env="QDRANT_URL")
     qdrant_api_key: str = Field(..., env="QDRANT_API_KEY")
+    # Transport: gRPC (port 6334) cuts per-request overhead; the HTTP pool
+    # bounds concurrent REST connections per client
+    qdrant_prefer_grpc: bool = Field(default=False, env="QDRANT_PREFER_GRPC")
+    qdrant_grpc_port: int = 6334
+    qdrant_timeout: int = 30
+    qdrant_pool_max_connections: int = 100
+    qdrant_pool_max_keepalive: int = 20
 
     # Azure OpenAI Configuration
     azure_openai_endpoint: str = Field(..., env="AZURE_OPENAI_ENDPOINT")
@@ -30,7 +75,25 @@ class Settings(BaseSettings):
     data_dir: Path = project_root / "data"
     models_dir: Path = project_root / "models"
 
-    # Collection Names
+    # Per-collection profiles, e.g. {"patient_memory": {"quantization": "scalar",
+    # "oversampling": 2.0, "on_disk_vectors": true}}
+    # Setting COLLECTION_PROFILES replaces these defaults entirely.
+    collection_profiles: Dict[str, CollectionProfile] = Field(
+        default_factory=lambda: {
+            "patient_memory": CollectionProfile(tenant_key="patient_id"),
+            "medical_texts": CollectionProfile(sparse_vector="bm25"),
+        },
+        env="COLLECTION_PROFILES",
+    )
+    migrate_collection_profiles: bool = True
+
+    # Qdrant Bulk Ingestion
+    qdrant_upsert_batch_size: int = 256
+    qdrant_upsert_parallel: int = 4
+
+    # Collection Names (aliases over versioned physical collections
+    # <name>_v<N> when collection_aliases is on, so rebuilds swap atomically)
+    collection_aliases: bool = Field(default=True, env="COLLECTION_ALIASES")
     medical_images_collection: str = "medical_images"
     medical_texts_collection: str = "medical_texts"
     patient_memory_collection: str = "patient_memory"
@@ -45,6 +108,65 @@ class Settings(BaseSettings):
     medical_text_embedding_dim: int = 768
     image_embedding_dim: int = 2048
 
+    # Startup
+    lazy_model_loading: bool = Field(default=True, env="LAZY_MODEL_LOADING")
+    warmup_mode: str = Field(default="background", env="MODEL_WARMUP")  # none | background | eager
+
+    # Embedding Inference
+    embedding_batch_size: int = Field(default=32, env="EMBEDDING_BATCH_SIZE")
+    medical_text_max_length: int = 512
+    text_max_length: int = 256
+    embedding_backend: str = Field(default="torch", env="EMBEDDING_BACKEND")  # torch | onnx
+    onnx_quantize: bool = True
+    onnx_num_threads: int = 0  # 0 lets ONNX Runtime decide
+
+    image_batch_size: int = 16
+    image_decode_workers: int = 4
+
+    # Dimensionality Reduction (collection name -> stored dimension)
+    vector_projection_dims: Dict[str, int] = Field(default_factory=dict, env="VECTOR_PROJECTION_DIMS")
+    vector_projection_method: str = "pca"  # pca | truncate
+
+    # Document Chunking
+    chunk_tokens: int = 256
+    chunk_overlap_tokens: int = 32
+    chunk_group_size: int = 3  # chunk hits merged per parent document
+
+    # Hybrid Retrieval (dense + BM25 sparse, reciprocal rank fusion)
+    text_search_mode: str = Field(default="hybrid", env="TEXT_SEARCH_MODE")  # hybrid | dense
+    hybrid_prefetch_limit: int = 50  # candidates per retriever before fusion
+    bm25_k1: float = 1.2
+    bm25_b: float = 0.75
+    bm25_avg_doc_length: float = 150.0  # words per chunk
+
+    # DICOM / NIfTI ingestion
+    volume_slice_strategy: str = "stride"  # middle | stride | mip
+    volume_slice_stride: int = 8
+    volume_mip_slab: int = 16
+
+    # Bulk Embedding (offline ingest)
+    bulk_embed_workers: int = Field(default=0, env="BULK_EMBED_WORKERS")  # 0 = CPU count
+    bulk_embed_threads_per_worker: int = 1
+    bulk_embed_shard_size: int = 64
+    bulk_embed_min_texts: int = 256
+
+    # Image Uploads
+    image_upload_max_mb: float = Field(default=10.0, env="IMAGE_UPLOAD_MAX_MB")
+
+    # Query Micro-batching
+    micro_batch_enabled: bool = Field(default=True, env="MICRO_BATCH_ENABLED")
+    micro_batch_max_size: int = 32
+    micro_batch_max_wait_ms: float = 5.0
+
+    # Embedding Cache
+    embedding_cache_enabled: bool = Field(default=True, env="EMBEDDING_CACHE_ENABLED")
+    embedding_cache_memory_entries: int = 10000
+    embedding_cache_disk_mb: int = Field(default=256, env="EMBEDDING_CACHE_DISK_MB")
+
+    def collection_profile(self, collection_name: str) -> CollectionProfile:
+        """Profile configured for a collection, or the defaults"""
+        return self.collection_profiles.get(collection_name) or CollectionProfile()
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -0,0 +1,51 @@
+"""
+Content hashing and deterministic point IDs
+"""
+from typing import Any, Dict, Optional
+from uuid import UUID, uuid5
+import hashlib
+import json
+import re
+import unicodedata
+
+# Namespace for every point ID derived by this project
+POINT_ID_NAMESPACE = UUID("6f1c2d3e-8a4b-5c7d-9e0f-1a2b3c4d5e6f")
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_content(text: str) -> str:
+    """Unicode-normalize and collapse whitespace so cosmetic edits hash the same"""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def content_hash(content: str, metadata: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Stable hash of a record's normalized content and source metadata
+
+    Args:
+        content: Text content (document, description, ...)
+        metadata: Source metadata that identifies the record
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    canonical = json.dumps(metadata or {}, sort_keys=True, ensure_ascii=False, default=str)
+    digest = hashlib.sha256()
+    digest.update(normalize_content(content).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(canonical.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def point_id(*parts: Any) -> str:
+    """
+    Deterministic UUID point ID from one or more parts
+
+    Args:
+        *parts: Values identifying the point (e.g. a content hash and chunk index)
+
+    Returns:
+        UUID string accepted by Qdrant
+    """
+    return str(uuid5(POINT_ID_NAMESPACE, ":".join(str(part) for part in parts)))
@@ -0,0 +1,109 @@
+"""
+Startup-time profiling: per-module import cost and model load cost
+"""
+from typing import Any, Dict, Iterator, List, Optional
+from contextlib import contextmanager
+import importlib
+import sys
+import time
+
+# Ordered so that each measurement is the incremental cost of that module
+STARTUP_MODULES = [
+    "numpy",
+    "pydantic_settings",
+    "qdrant_client",
+    "openai",
+    "src.core",
+    "src.memory",
+    "src.search",
+    "torch",
+    "transformers",
+    "sentence_transformers",
+    "torchvision",
+    "gradio",
+]
+
+_phases: List[Dict[str, Any]] = []
+
+
+@contextmanager
+def timed_phase(name: str) -> Iterator[None]:
+    """
+    Record the wall time of a startup phase
+
+    Args:
+        name: Phase label shown in the startup report
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _phases.append({"phase": name, "seconds": time.perf_counter() - started})
+
+
+def measure_imports(modules: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Import modules one by one and time each
+
+    Only meaningful in a fresh interpreter; modules that are already
+    imported are reported with zero cost.
+
+    Args:
+        modules: Module names in import order (defaults to STARTUP_MODULES)
+
+    Returns:
+        One entry per module with its incremental import time
+    """
+    results = []
+    for name in modules or STARTUP_MODULES:
+        if name in sys.modules:
+            results.append({"module": name, "seconds": 0.0, "status": "already imported"})
+            continue
+        started = time.perf_counter()
+        try:
+            importlib.import_module(name)
+            status = "ok"
+        except ImportError as e:
+            status = f"missing: {e}"
+        results.append({
+            "module": name,
+            "seconds": time.perf_counter() - started,
+            "status": status,
+        })
+    return results
+
+
+def startup_report(measure: bool = False) -> Dict[str, Any]:
+    """
+    Summarise where startup time went
+
+    Args:
+        measure: Also import STARTUP_MODULES and time them
+
+    Returns:
+        Recorded phases, optional import timings and per-model load stats
+    """
+    from src.core.registry import model_memory_report
+
+    report: Dict[str, Any] = {"phases": list(_phases)}
+    if measure:
+        report["imports"] = measure_imports()
+    report["models"] = model_memory_report()
+    return report
+
+
+if __name__ == "__main__":
+    import json
+
+    # Run as `python -m src.utils.startup` for a cold-process breakdown
+    imports = measure_imports()
+    for entry in imports:
+        print(f"{entry['module']:<24} {entry['seconds'] * 1000:9.1f} ms  {entry['status']}")
+    print(f"{'total':<24} {sum(e['seconds'] for e in imports) * 1000:9.1f} ms")
+
+    if "--models" in sys.argv:
+        from src.core import get_text_embedder, get_medical_text_embedder
+
+        for getter in (get_text_embedder, get_medical_text_embedder):
+            getter(lazy=False)
+        print(json.dumps(startup_report()["models"], indent=2))